@@ -5,11 +5,15 @@ from __future__ import annotations
 import logging
 import sys
 from contextlib import suppress
+from dis import hasconst
+from itertools import pairwise
 from opcode import opmap
 from textwrap import dedent
 from types import CodeType
 from typing import TYPE_CHECKING
 
+from cx_Freeze._transform import LAZY_IMPORT_FUNC
+
 if TYPE_CHECKING:
     from collections.abc import Generator
 
@@ -47,6 +51,9 @@ LOAD_CONST = opmap["LOAD_CONST"]
 LOAD_NAME = opmap["LOAD_NAME"]
 LOAD_SMALL_INT = opmap.get("LOAD_SMALL_INT")  # Python 3.14+
 
+MAKE_FUNCTION = opmap["MAKE_FUNCTION"]
+SET_FUNCTION_ATTRIBUTE = opmap.get("SET_FUNCTION_ATTRIBUTE")  # Python 3.13+
+
 IMPORT_NAME = opmap["IMPORT_NAME"]
 IMPORT_FROM = opmap["IMPORT_FROM"]
 IMPORT_STAR = opmap.get("IMPORT_STAR")  # Python up to 3.11
@@ -56,6 +63,15 @@ STORE_NAME = opmap["STORE_NAME"]
 STORE_GLOBAL = opmap["STORE_GLOBAL"]
 STORE_OPS = (STORE_NAME, STORE_GLOBAL)
 
+CO_OPTIMIZED = 0x0001
+CO_HAS_DOCSTRING = 0x4000000  # Python 3.14+
+MAKE_FUNCTION_ANNOTATIONS = 0x04
+MAKE_FUNCTION_CLOSURE = 0x08
+
+# location entry codes of the line table (Python 3.11+)
+LOCATION_NO_COLUMNS = 13
+LOCATION_NONE = 15
+
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +79,7 @@ __all__ = [
     "code_object_replace",
     "code_object_replace_function",
     "code_object_replace_package",
+    "code_object_strip",
     "scan_code",
 ]
 
@@ -141,6 +158,155 @@ def code_object_replace_package(module: Module) -> CodeType | None:
     return code
 
 
+def code_object_strip(
+    code: CodeType,
+    *,
+    docstrings: bool = False,
+    annotations: bool = False,
+    debug_ranges: bool = False,
+) -> CodeType:
+    """Return a copy of the code object with the requested data removed.
+
+    - docstrings: the docstrings of the module, classes and functions are
+      replaced by None (like -OO does, but keeping the asserts);
+    - annotations: the annotations of functions stored as constant strings
+      (PEP 563) are replaced by an empty tuple;
+    - debug_ranges: the column information is removed from the line table,
+      keeping the line numbers (like -X no_debug_ranges, Python 3.11+).
+
+    Constants are only replaced when they are not used elsewhere in the code.
+    """
+    consts = list(code.co_consts)
+    for i, constant in enumerate(consts):
+        if isinstance(constant, CodeType):
+            consts[i] = code_object_strip(
+                constant,
+                docstrings=docstrings,
+                annotations=annotations,
+                debug_ranges=debug_ranges,
+            )
+
+    instructions = [
+        (opc, arg)
+        for _i, _offset, opc, arg in unpack_opargs(code.co_code)
+        if opc != EXTENDED_ARG
+    ]
+    references = [0] * len(consts)
+    for opc, arg in instructions:
+        if opc in hasconst:
+            references[arg] += 1
+
+    kwargs = {}
+    if docstrings:
+        if code.co_flags & CO_OPTIMIZED:
+            # functions: the docstring is the first constant
+            has_docstring = isinstance(consts[0], str) if consts else False
+            if sys.version_info[:2] >= (3, 14):
+                has_docstring = bool(code.co_flags & CO_HAS_DOCSTRING)
+            if has_docstring and references[0] == 0:
+                consts[0] = None
+                if code.co_flags & CO_HAS_DOCSTRING:
+                    kwargs["co_flags"] = code.co_flags & ~CO_HAS_DOCSTRING
+        else:
+            # module and class bodies: LOAD_CONST + STORE_NAME __doc__
+            names = code.co_names
+            for (opc, arg), (next_opc, next_arg) in pairwise(instructions):
+                if (
+                    opc == LOAD_CONST
+                    and next_opc == STORE_NAME
+                    and names[next_arg] == "__doc__"
+                    and isinstance(consts[arg], str)
+                    and references[arg] == 1
+                ):
+                    consts[arg] = None
+
+    if annotations:
+        uses = [0] * len(consts)
+        for index, (opc, arg) in enumerate(instructions):
+            if opc != LOAD_CONST or not _is_string_annotations(consts[arg]):
+                continue
+            following = instructions[index + 1 : index + 5]
+            if _is_making_function_with_annotations(consts, following):
+                uses[arg] += 1
+        for i, count in enumerate(uses):
+            if count and count == references[i]:
+                consts[i] = ()
+
+    if debug_ranges and sys.version_info[:2] >= (3, 11):
+        kwargs["co_linetable"] = _linetable_without_columns(code)
+
+    return code_object_replace(code, co_consts=consts, **kwargs)
+
+
+def _is_string_annotations(constant: object) -> bool:
+    """Check if the constant is a tuple of (name, annotation) strings."""
+    return (
+        isinstance(constant, tuple)
+        and len(constant) > 0
+        and len(constant) % 2 == 0
+        and all(isinstance(item, str) for item in constant)
+    )
+
+
+def _is_making_function_with_annotations(
+    consts: list, following: list[tuple[int, int]]
+) -> bool:
+    """Check if the instructions make a function using the annotations.
+
+    The annotations tuple must be the last value pushed before the code
+    object (no closure), so it is consumed by the function being made.
+    """
+    if not following:
+        return False
+    opc, arg = following.pop(0)
+    if opc != LOAD_CONST or not isinstance(consts[arg], CodeType):
+        return False
+    if following and following[0][0] == LOAD_CONST:
+        following.pop(0)  # qualname in Python 3.10
+    if len(following) < 1 or following[0][0] != MAKE_FUNCTION:
+        return False
+    if SET_FUNCTION_ATTRIBUTE:
+        # Python 3.13+
+        return len(following) > 1 and following[1] == (
+            SET_FUNCTION_ATTRIBUTE,
+            MAKE_FUNCTION_ANNOTATIONS,
+        )
+    flags = following[0][1]
+    return bool(
+        flags & MAKE_FUNCTION_ANNOTATIONS and not flags & MAKE_FUNCTION_CLOSURE
+    )
+
+
+def _linetable_without_columns(code: CodeType) -> bytes:
+    """Return the line table of the code object without column information.
+
+    Each entry covers up to 8 code units and has only the line delta.
+    """
+    table = bytearray()
+    previous_line = code.co_firstlineno
+    lines = [position[0] for position in code.co_positions()]
+    start = 0
+    while start < len(lines):
+        line = lines[start]
+        end = start + 1
+        while end < len(lines) and end - start < 8 and lines[end] == line:
+            end += 1
+        length = end - start
+        if line is None:
+            table.append(0x80 | (LOCATION_NONE << 3) | (length - 1))
+        else:
+            table.append(0x80 | (LOCATION_NO_COLUMNS << 3) | (length - 1))
+            delta = line - previous_line
+            value = (-delta << 1) | 1 if delta < 0 else delta << 1
+            while value >= 64:
+                table.append(64 | (value & 63))
+                value >>= 6
+            table.append(value)
+            previous_line = line
+        start = end
+    return bytes(table)
+
+
 def scan_code(code: CodeType) -> Generator:
     arguments = []
     names = code.co_names
@@ -198,6 +364,10 @@ def scan_code(code: CodeType) -> Generator:
             if func in ("__import__", "import_module"):
                 name = arguments[-1]
                 yield func, (name, -1, [])
+            elif func == LAZY_IMPORT_FUNC:
+                # top-level import rewritten by cx_Freeze._transform
+                # (see compile_source with lazy_imports=True)
+                yield "import", (arguments[-1], 0, None)
 
         # import statement: attempt to import module
         elif opc == IMPORT_NAME:
@@ -0,0 +1,269 @@
+"""Persistent cache shared across the builds."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+import time
+from contextlib import suppress
+from importlib.metadata import version
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from cx_Freeze._compat import IS_MACOS, IS_MINGW, IS_WINDOWS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from cx_Freeze._typing import StrPath
+
+__all__ = [
+    "ARTIFACT_CACHE_SIZE",
+    "ArtifactCache",
+    "StubCache",
+    "cache_dir",
+    "parse_size",
+]
+
+# Changing the tag invalidates the parsed stubs cached by previous versions
+STUB_CACHE_TAG = b"cx_Freeze-stub-imports-1\n"
+
+# Changing the tag invalidates the artifacts cached by previous versions
+ARTIFACT_CACHE_TAG = b"cx_Freeze-artifact-1\n"
+# The default size limit of the artifact cache
+ARTIFACT_CACHE_SIZE = 2 << 30
+
+
+def cache_dir() -> Path | None:
+    """Return the directory of the persistent cache.
+
+    The location can be changed using the CXFREEZE_CACHE_DIR environment
+    variable, and an empty value disables the cache.
+    """
+    value = os.environ.get("CXFREEZE_CACHE_DIR")
+    if value is not None:
+        return Path(value) if value else None
+    if IS_WINDOWS or IS_MINGW:
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData/Local"
+        return Path(base, "cx_Freeze", "Cache")
+    if IS_MACOS:
+        return Path.home() / "Library/Caches/cx_Freeze"
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base, "cx_Freeze")
+
+
+class StubCache:
+    """Cache of the imports parsed from the stub files (.pyi).
+
+    The imports are kept in memory for the current build, and stored in the
+    persistent cache using the hash of the stub contents as the key, so the
+    stubs of large bindings (Qt, VTK) are parsed only once.
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[str, str], str | None],
+        path: Path | None = None,
+    ) -> None:
+        """Construct a stub cache.
+
+        :param parse: The function that returns the imports of a stub, given
+            its source and filename.
+        :param path: The cache directory [default: cache_dir()/stubs].
+        """
+        if path is None:
+            path = cache_dir()
+            if path is not None:
+                path = path / "stubs"
+        self.path: Path | None = path
+        self._parse = parse
+        self._imports: dict[Path, str | None] = {}
+
+    def get(self, source_file: Path) -> str | None:
+        """Return the imports of the stub file, or None if it has none."""
+        source_file = source_file.resolve()
+        try:
+            return self._imports[source_file]
+        except KeyError:
+            imports = self._imports[source_file] = self._load(source_file)
+            return imports
+
+    def _load(self, source_file: Path) -> str | None:
+        try:
+            data = source_file.read_bytes()
+        except OSError:
+            return None
+        cached = None
+        if self.path is not None:
+            key = hashlib.sha256(STUB_CACHE_TAG + data).hexdigest()
+            cached = self.path / key[:2] / f"{key}.py"
+            with suppress(OSError, UnicodeDecodeError):
+                # an empty file means a stub without imports
+                return cached.read_text(encoding="utf_8") or None
+        try:
+            source = data.decode("utf_8")
+        except UnicodeDecodeError:
+            return None
+        imports = self._parse(source, source_file.name)
+        if cached is not None:
+            with suppress(OSError):
+                cached.parent.mkdir(parents=True, exist_ok=True)
+                # write to a temporary file to share the cache safely
+                temp = cached.with_suffix(f".{os.getpid()}.tmp")
+                temp.write_text(imports or "", encoding="utf_8")
+                temp.replace(cached)
+        return imports
+
+
+def parse_size(value: str | int) -> int:
+    """Return a size in bytes, from a number with an optional unit.
+
+    The units are K, M, G and T (like 500M). Raises ValueError on failure.
+    """
+    if isinstance(value, int):
+        return value
+    text = value.strip().upper().removesuffix("B")
+    multiplier = 1
+    for shift, suffix in ((10, "K"), (20, "M"), (30, "G"), (40, "T")):
+        if text.endswith(suffix):
+            text = text[:-1]
+            multiplier = 1 << shift
+            break
+    size = int(float(text) * multiplier)
+    if size < 0:
+        msg = f"invalid size: {value!r}"
+        raise ValueError(msg)
+    return size
+
+
+class ArtifactCache:
+    """Content-addressed cache of the products of the build.
+
+    The products (the bytecode compiled from the sources, the binaries
+    patched by patchelf) are stored using a hash of their inputs and of the
+    parameters of the transformation as the key. The files are written
+    atomically, so the cache can be shared by concurrent builds, and by
+    different machines over a network file system. The time of the last use
+    of each entry is its modification time, to evict the least recently used
+    entries when the cache is larger than its size limit.
+    """
+
+    def __init__(
+        self, path: StrPath | None = None, max_size: int | None = None
+    ) -> None:
+        """Construct an artifact cache.
+
+        :param path: The cache directory [default: cache_dir()/artifacts].
+        :param max_size: The size limit of the cache, in bytes
+            [default: ARTIFACT_CACHE_SIZE].
+        """
+        if path is None:
+            path = cache_dir()
+            if path is None:
+                msg = "the cache directory is disabled"
+                raise ValueError(msg)
+            path = path / "artifacts"
+        self.path: Path = Path(path)
+        if max_size is None:
+            max_size = ARTIFACT_CACHE_SIZE
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        # the artifacts depend on the versions of cx_Freeze and Python
+        self._tag: bytes = b"%s%s\n%s\n" % (
+            ARTIFACT_CACHE_TAG,
+            version("cx_Freeze").encode(),
+            sys.version.encode(),
+        )
+
+    def key(self, *parts: bytes | str) -> str:
+        """Return the key of an artifact, from its inputs and parameters."""
+        digest = hashlib.sha256(self._tag)
+        for part in parts:
+            data = part.encode() if isinstance(part, str) else part
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    @staticmethod
+    def file_hash(filename: StrPath) -> str:
+        """Return the hash of the content of a file, to use in a key."""
+        digest = hashlib.sha256()
+        with open(filename, "rb") as file:
+            while chunk := file.read(1 << 20):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.path / key[:2] / key
+
+    def get(self, key: str) -> bytes | None:
+        """Return the artifact with the given key, or None if not cached."""
+        entry = self._entry(key)
+        try:
+            data = entry.read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+        with suppress(OSError):
+            os.utime(entry)  # mark as recently used
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store the artifact with the given key; errors are ignored."""
+        entry = self._entry(key)
+        with suppress(OSError):
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file to share the cache safely
+            temp = entry.with_name(
+                f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            temp.write_bytes(data)
+            temp.replace(entry)
+
+    def entries(self) -> Iterator[tuple[Path, os.stat_result]]:
+        """Iterate over the cached files, with their status."""
+        if not self.path.is_dir():
+            return
+        for directory in self.path.iterdir():
+            if not directory.is_dir():
+                continue
+            for entry in directory.iterdir():
+                with suppress(OSError):
+                    yield entry, entry.stat()
+
+    def size(self) -> tuple[int, int]:
+        """Return the number of cached files and their total size."""
+        count = total = 0
+        for _, entry_stat in self.entries():
+            count += 1
+            total += entry_stat.st_size
+        return count, total
+
+    def prune(self, max_size: int | None = None) -> tuple[int, int]:
+        """Remove the least recently used files, to fit in the size limit.
+
+        The limit defaults to the max_size of the cache. The temporary files
+        left by interrupted builds are removed too. Returns the number of
+        removed files and their total size.
+        """
+        if max_size is None:
+            max_size = self.max_size
+        entries = sorted(
+            self.entries(), key=lambda item: item[1].st_mtime, reverse=True
+        )
+        stale = time.time() - 3600
+        total = removed = freed = 0
+        for entry, entry_stat in entries:
+            total += entry_stat.st_size
+            if total > max_size or (
+                entry.suffix == ".tmp" and entry_stat.st_mtime < stale
+            ):
+                with suppress(OSError):
+                    entry.unlink()
+                    removed += 1
+                    freed += entry_stat.st_size
+        return removed, freed
@@ -0,0 +1,170 @@
+"""Copy the files using the fastest method supported by the file system."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from cx_Freeze._compat import IS_LINUX
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+if IS_LINUX:
+    import fcntl
+
+__all__ = ["COPY_MODES", "copy_file", "dedup_files", "is_linked"]
+
+COPY_MODES = ("copy", "reflink", "hardlink", "auto")
+
+# ioctl to clone a file on Linux (btrfs, XFS, bcachefs...)
+FICLONE = 0x40049409
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    """Clone the file, sharing the data blocks until one of them is changed.
+
+    Returns False if it is not supported by the file system.
+    """
+    if not IS_LINUX:
+        return False
+    try:
+        with source.open("rb") as src, target.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError:
+        return False
+    return True
+
+
+def _copy_range(source: Path, target: Path) -> bool:
+    """Copy the file in the kernel, using os.copy_file_range.
+
+    Returns False if it is not supported by the file system.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+    try:
+        with source.open("rb") as src, target.open("wb") as dst:
+            while copy_file_range(src.fileno(), dst.fileno(), 1 << 30):
+                pass
+    except OSError:
+        return False
+    return True
+
+
+def _hardlink(source: Path, target: Path) -> bool:
+    """Link the file, returns False if it is not possible."""
+    try:
+        target.unlink(missing_ok=True)
+        os.link(source, target)
+    except OSError:
+        return False
+    return True
+
+
+def copy_file(
+    source: Path, target: Path, mode: str = "copy", *, private: bool = False
+) -> bool:
+    """Copy the data of a file, using the given copy mode.
+
+    :param source: The file to copy.
+    :param target: The new file, replaced if it exists.
+    :param mode: 'copy' for a plain copy, 'reflink' to clone the file when
+        the file system supports it, 'hardlink' to link the file, or 'auto'
+        to try a clone, a copy in the kernel and then a link.
+    :param private: The target is modified after the copy (like binaries
+        that are patched), so it is never a link to the source.
+    Returns True if the target is a link to the source.
+    """
+    if os.path.lexists(target):
+        # do not write into a file linked by the previous build
+        target.unlink()
+    if mode in ("reflink", "auto") and _reflink(source, target):
+        return False
+    if mode == "auto" and _copy_range(source, target):
+        return False
+    if (
+        mode in ("hardlink", "auto")
+        and not private
+        and _hardlink(source, target)
+    ):
+        return True
+    shutil.copyfile(source, target)
+    return False
+
+
+def is_linked(path: Path) -> bool:
+    """Return True if the file has other links, like a deduplicated one."""
+    try:
+        return path.lstat().st_nlink > 1
+    except OSError:
+        return False
+
+
+def _file_hash(path: Path) -> str | None:
+    try:
+        digest = hashlib.sha256()
+        with path.open("rb") as file:
+            while chunk := file.read(1 << 20):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def dedup_files(directory: Path, workers: int) -> tuple[int, int]:
+    """Replace the files with the same content by links to one of them.
+
+    Only the files of the same size and mode are hashed, in a pool of
+    threads, and the files already linked together are counted once. The
+    files that cannot be linked (on another file system, for example) are
+    left as they are.
+
+    :param directory: The directory of the files, searched recursively.
+    :param workers: The number of threads that hash the files.
+    Returns the number of files replaced by links and the bytes saved.
+    """
+    by_key: dict[tuple[int, int], dict[tuple[int, int], Path]] = {}
+    for path in sorted(directory.rglob("*")):
+        try:
+            stat = path.lstat()
+        except OSError:
+            continue
+        # the empty files save nothing, and the symbolic links are skipped
+        if stat.st_size == 0 or not path.is_file() or path.is_symlink():
+            continue
+        inodes = by_key.setdefault((stat.st_size, stat.st_mode), {})
+        inodes.setdefault((stat.st_dev, stat.st_ino), path)
+    candidates = [
+        (key, path)
+        for key, inodes in by_key.items()
+        if len(inodes) > 1
+        for path in inodes.values()
+    ]
+    with ThreadPoolExecutor(workers) as pool:
+        digests = pool.map(_file_hash, [path for _, path in candidates])
+        groups: dict[tuple[int, int, str], list[Path]] = {}
+        for ((size, mode), path), digest in zip(
+            candidates, digests, strict=True
+        ):
+            if digest is not None:
+                groups.setdefault((size, mode, digest), []).append(path)
+    linked = saved = 0
+    for (size, _, _), paths in groups.items():
+        original = paths[0]
+        for path in paths[1:]:
+            # link to a temporary name, to replace the file atomically
+            temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            try:
+                os.link(original, temp)
+                temp.replace(path)
+            except OSError:
+                temp.unlink(missing_ok=True)
+                continue
+            linked += 1
+            saved += size
+    return linked, saved
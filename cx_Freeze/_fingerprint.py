@@ -0,0 +1,191 @@
+"""Fingerprint of the inputs of a build, to detect the builds up to date."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from contextlib import suppress
+from importlib.machinery import PathFinder
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from cx_Freeze.freezer import Freezer
+
+__all__ = ["BuildFingerprint"]
+
+# Changing the version invalidates the fingerprints of previous versions
+FINGERPRINT_VERSION = 2
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _tool_versions() -> dict[str, str]:
+    versions = {
+        "python": sys.version,
+        "executable": sys.executable,
+        "cx_Freeze": version("cx_Freeze"),
+    }
+    for name in ("freeze-core", "patchelf"):
+        with suppress(PackageNotFoundError):
+            versions[name] = version(name)
+    return versions
+
+
+class BuildFingerprint:
+    """Fingerprint of the inputs of a build, and of its build directory.
+
+    The inputs are the options, the versions of the tools, the files of the
+    modules found, of the scripts and of the files copied (checked by size
+    and modification time, and then by hash), and the modules that were not
+    found, that must still be missing (the submodules are searched in the
+    path of their package). The build directory must have the
+    files written by the build. The fingerprint is stored next to the build
+    directory.
+    """
+
+    def __init__(self, target_dir: Path, options: dict[str, Any]) -> None:
+        """Construct the fingerprint of a build.
+
+        :param target_dir: The build directory.
+        :param options: The options of the build, with their repr used as
+            their fingerprint.
+        """
+        self.target_dir: Path = target_dir
+        self.path: Path = target_dir.with_name(
+            f".{target_dir.name}.fingerprint.json"
+        )
+        data = repr(sorted(options.items())).encode()
+        self.options: str = hashlib.sha256(data).hexdigest()
+
+    def _header(self) -> dict[str, Any]:
+        return {
+            "version": FINGERPRINT_VERSION,
+            "tools": _tool_versions(),
+            "options": self.options,
+        }
+
+    def _outputs(self) -> dict[str, list[int]]:
+        outputs = {}
+        for root, _, files in os.walk(self.target_dir):
+            for name in files:
+                path = Path(root, name)
+                with suppress(OSError):
+                    stat = path.lstat()
+                    relative = path.relative_to(self.target_dir).as_posix()
+                    outputs[relative] = [stat.st_size, stat.st_mtime_ns]
+        return outputs
+
+    def is_up_to_date(self) -> bool:
+        """Check the previous build, its inputs and its build directory."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf_8"))
+            header = data["header"]
+            inputs = data["inputs"]
+            missing = data["missing"]
+            path = data["path"]
+            outputs = data["outputs"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        if header != self._header() or not self.target_dir.is_dir():
+            return False
+        if any(
+            self._is_changed(Path(name), *value)
+            for name, value in inputs.items()
+        ):
+            return False
+        # a module that is installed since the previous build can be found
+        for name, search_path in missing.items():
+            with suppress(ImportError, ValueError):
+                if PathFinder.find_spec(name, search_path or path) is not None:
+                    return False
+        return self._outputs() == outputs
+
+    @staticmethod
+    def _is_changed(source: Path, size: int, mtime: int, digest: str) -> bool:
+        # the hash is computed only when the modification time is changed
+        try:
+            stat = source.stat()
+            if stat.st_size != size:
+                return True
+            if stat.st_mtime_ns == mtime:
+                return False
+            return _file_hash(source) != digest
+        except OSError:
+            return True
+
+    def clear(self) -> None:
+        """Remove the fingerprint, before a build that can fail."""
+        with suppress(OSError):
+            self.path.unlink()
+
+    def save(self, freezer: Freezer) -> None:
+        """Save the fingerprint of a build done by the freezer."""
+        sources: set[Path] = set(freezer.source_files)
+        for module in freezer.finder.modules:
+            if module.file is not None:
+                sources.add(module.file)
+        for exe in freezer.executables:
+            sources.update(
+                path
+                for path in (exe.main_script, exe.init_script, exe.base)
+                if path is not None
+            )
+        for source_path, _ in freezer.finder.zip_includes:
+            if source_path.is_dir():
+                sources.update(source_path.rglob("*"))
+            else:
+                sources.add(source_path)
+        data = {
+            "header": self._header(),
+            "inputs": dict(self._inputs(sources)),
+            "missing": self._missing(freezer),
+            "path": freezer.path,
+            "outputs": self._outputs(),
+        }
+        # write to a temporary file, so the fingerprint is complete or missing
+        temp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_text(json.dumps(data), encoding="utf_8")
+        temp.replace(self.path)
+
+    @staticmethod
+    def _missing(freezer: Freezer) -> dict[str, list[str] | None]:
+        # the path of the package of a submodule, or None for the build path
+        packages = {
+            module.name: [os.fspath(path) for path in module.path]
+            for module in freezer.finder.modules
+            if module.path is not None
+        }
+        missing = {}
+        for name in freezer.finder.missing_modules:
+            parent_name = name.rpartition(".")[0]
+            if not parent_name:
+                missing[name] = None
+            elif parent_name in packages:
+                missing[name] = packages[parent_name]
+            # else the parent is missing, or is not a package
+        return missing
+
+    @staticmethod
+    def _inputs(
+        sources: Iterable[Path],
+    ) -> Iterable[tuple[str, tuple[int, int, str]]]:
+        for source in sources:
+            with suppress(OSError):
+                if source.is_file():
+                    stat = source.stat()
+                    yield (
+                        os.fspath(source.resolve()),
+                        (stat.st_size, stat.st_mtime_ns, _file_hash(source)),
+                    )
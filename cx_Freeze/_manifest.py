@@ -0,0 +1,218 @@
+"""Manifest of the files of a build directory, for incremental builds."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from contextlib import suppress
+from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = ["BuildManifest", "remove_directory"]
+
+# Changing the version invalidates the manifests of previous versions
+MANIFEST_VERSION = 1
+
+
+def remove_directory(path: Path) -> None:
+    """Remove a directory, by renaming it and deleting it in background.
+
+    The path is free when the function returns. The deletion is done by a
+    daemon thread, that does not delay the exit, so the trash directories
+    left by the previous builds are deleted too. When the directory cannot
+    be renamed (a file in use on Windows, for instance), it is removed in
+    place.
+
+    :raises OSError: When the directory cannot be removed.
+    """
+    prefix = f".{path.name}-"
+    trashes = [
+        entry
+        for entry in path.parent.iterdir()
+        if entry.name.startswith(prefix) and entry.name.endswith(".trash")
+    ]
+    trash = tempfile.mkdtemp(prefix=prefix, suffix=".trash", dir=path.parent)
+    try:
+        path.rename(os.path.join(trash, path.name))
+    except OSError:
+        os.rmdir(trash)
+        shutil.rmtree(path)
+    else:
+        trashes.append(trash)
+    if trashes:
+        threading.Thread(
+            target=_remove_trashes, args=(trashes,), daemon=True
+        ).start()
+
+
+def _remove_trashes(trashes: list[Path | str]) -> None:
+    for trash in trashes:
+        shutil.rmtree(trash, ignore_errors=True)
+
+
+class BuildManifest:
+    """Manifest of the files written in a build directory.
+
+    For each file, it keeps its size and modification time, and the path,
+    size and modification time of its source, or the hash of its content
+    when written from memory. The next build uses the manifest of the
+    previous one to skip the files that are up to date and to delete the
+    stale ones. The manifest is stored next to the build directory.
+    """
+
+    def __init__(self, target_dir: Path) -> None:
+        """Construct the manifest, loading the one of the previous build.
+
+        :param target_dir: The build directory.
+        """
+        self.target_dir: Path = target_dir
+        self.path: Path = target_dir.with_name(
+            f".{target_dir.name}.manifest.json"
+        )
+        self.files: dict[str, dict[str, Any]] = {}
+        self.previous: dict[str, dict[str, Any]] = self._load()
+        self.kept: int = 0
+
+    @staticmethod
+    def _header() -> dict[str, Any]:
+        return {
+            "version": MANIFEST_VERSION,
+            "cx_Freeze": version("cx_Freeze"),
+            "python": sys.version,
+        }
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load the manifest of the previous build.
+
+        The file is removed, so an interrupted build is not trusted.
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding="utf_8"))
+        except (OSError, ValueError):
+            return {}
+        with suppress(OSError):
+            self.path.unlink()
+        if not isinstance(data, dict) or data.get("header") != self._header():
+            return {}
+        return data.get("files", {})
+
+    def _name(self, target: Path) -> str | None:
+        try:
+            return target.relative_to(self.target_dir).as_posix()
+        except ValueError:
+            return None
+
+    def _is_unchanged(self, target: Path, entry: dict[str, Any]) -> bool:
+        """Check if the target is the one written by the previous build."""
+        try:
+            stat = target.lstat()
+        except OSError:
+            return False
+        return stat.st_size == entry.get(
+            "size"
+        ) and stat.st_mtime_ns == entry.get("mtime")
+
+    def is_copied(self, source: Path, target: Path) -> bool:
+        """Check if the target was copied from the unchanged source."""
+        name = self._name(target)
+        entry = self.previous.get(name) if name else None
+        if entry is None or entry.get("source") != os.fspath(source):
+            return False
+        try:
+            stat = source.stat()
+        except OSError:
+            return False
+        if (
+            stat.st_size != entry.get("source_size")
+            or stat.st_mtime_ns != entry.get("source_mtime")
+            or not self._is_unchanged(target, entry)
+        ):
+            return False
+        self.kept += 1
+        return True
+
+    def is_written(self, target: Path, data: bytes) -> bool:
+        """Check if the target was written with the same data."""
+        name = self._name(target)
+        entry = self.previous.get(name) if name else None
+        if (
+            entry is None
+            or entry.get("hash") != hashlib.sha256(data).hexdigest()
+            or not self._is_unchanged(target, entry)
+        ):
+            return False
+        self.kept += 1
+        return True
+
+    def add_copy(self, source: Path, target: Path) -> None:
+        """Add a file copied from the source."""
+        name = self._name(target)
+        if name:
+            stat = source.stat()
+            self.files[name] = {
+                "source": os.fspath(source),
+                "source_size": stat.st_size,
+                "source_mtime": stat.st_mtime_ns,
+            }
+
+    def add_data(self, target: Path, data: bytes) -> None:
+        """Add a file written from memory."""
+        name = self._name(target)
+        if name:
+            self.files[name] = {"hash": hashlib.sha256(data).hexdigest()}
+
+    def add_file(self, target: Path) -> None:
+        """Add a file that is always written, like the zip file."""
+        name = self._name(target)
+        if name:
+            self.files[name] = {}
+
+    def remove_stale(self) -> int:
+        """Remove the files of the previous build that were not written.
+
+        Returns the number of files removed.
+        """
+        target_dir = self.target_dir
+        removed = 0
+        for name in self.previous.keys() - self.files.keys():
+            path = target_dir / name
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+            # remove the directories left empty
+            with suppress(OSError):
+                for parent in path.parents:
+                    if parent == target_dir:
+                        break
+                    parent.rmdir()
+        return removed
+
+    def save(self) -> None:
+        """Save the manifest, with the size and time of the files written."""
+        target_dir = self.target_dir
+        files = {}
+        for name, entry in self.files.items():
+            try:
+                stat = (target_dir / name).lstat()
+            except OSError:
+                continue
+            files[name] = {
+                **entry,
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+            }
+        data = {"header": self._header(), "files": files}
+        # write to a temporary file, so the manifest is complete or missing
+        temp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_text(json.dumps(data), encoding="utf_8")
+        temp.replace(self.path)
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import json
+import os
 import re
+from fnmatch import fnmatchcase
 from importlib.machinery import EXTENSION_SUFFIXES
 from importlib.metadata import PathDistribution
-from importlib.metadata import version as metadata_version
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import TYPE_CHECKING
 
 from packaging.requirements import Requirement
@@ -15,10 +17,20 @@ from cx_Freeze._compat import IS_MINGW, IS_WINDOWS
 from cx_Freeze.exception import ModuleError
 
 if TYPE_CHECKING:
+    from importlib.metadata import Distribution
+
     from cx_Freeze._typing import StrPath
     from cx_Freeze.finder import ModuleFinder
 
-__all__ = ["DistributionCache"]
+__all__ = ["METADATA_FILES", "DistributionCache", "DistributionFiles"]
+
+# The metadata files needed by importlib.metadata in the frozen application
+# (a minimal RECORD is added).
+METADATA_FILES = ("METADATA", "entry_points.txt", "top_level.txt")
+
+# Directories of the test suites and of the documentation
+DOCS_DIRS = frozenset({"doc", "docs"})
+TESTS_DIRS = frozenset({"test", "tests"})
 
 
 class DistributionCache(PathDistribution):
@@ -40,7 +52,7 @@ class DistributionCache(PathDistribution):
         self._dist = distribution
         self._name = name
 
-        # Cache dist-info files in a temporary directory
+        # Cache the metadata files in memory, shared by the finder
         normalized_name = self.normalized_name
         source_path = getattr(distribution, "_path", None)
         if source_path is None:
@@ -53,47 +65,37 @@ class DistributionCache(PathDistribution):
         if source_path is None or not source_path.exists():
             raise ModuleError(name)
         dist_name = f"{normalized_name}-{distribution.version}.dist-info"
-        target_path = finder.cache_path / dist_name
-        super().__init__(target_path)
+        super().__init__(finder.cache_path / dist_name)
         self.distinfo_name = dist_name
-        if target_path.exists():  # already cached
-            return
+        self._file_indexes = finder.dist_files
+        self.metadata_files: dict[str, bytes] = (
+            finder.dist_metadata.setdefault(dist_name, {})
+        )
+        if not self.metadata_files:  # not cached yet
+            self._read_metadata_files(source_path)
 
-        # Copy data from dist-info directory or create it.
-        target_path.mkdir(parents=True)
-        purelib = False
-        if source_path.name.endswith(".dist-info"):
-            for source in source_path.rglob("*"):
-                target = target_path / source.relative_to(source_path)
-                if source.is_dir():
-                    target.mkdir(exist_ok=True)
-                else:
-                    target.write_bytes(source.read_bytes())
-        elif source_path.is_file():
+    def _read_metadata_files(self, source_path: Path) -> None:
+        """Read the metadata files needed at runtime by importlib.metadata.
+
+        Each file is read once from the dist-info directory, or converted
+        from the egg-info file or directory, and a minimal RECORD is created.
+        """
+        metadata_files = self.metadata_files
+        if source_path.is_file():
             # old egg-info file is converted to dist-info
-            target = target_path / "METADATA"
-            target.write_bytes(source_path.read_bytes())
-            purelib = bool(
-                source_path.parent.joinpath(normalized_name + ".py").exists()
-            )
+            metadata_files["METADATA"] = source_path.read_bytes()
         else:
-            # Copy minimal data from egg-info directory into dist-info
-            source = source_path / "PKG-INFO"
-            if source.is_file():
-                target = target_path / "METADATA"
-                target.write_bytes(source.read_bytes())
-            source = source_path / "entry_points.txt"
-            if source.is_file():
-                target = target_path / "entry_points.txt"
-                target.write_bytes(source.read_bytes())
-            source = source_path / "top_level.txt"
-            if source.is_file():
-                target = target_path / "top_level.txt"
-                target.write_bytes(source.read_bytes())
-            purelib = not bool(source_path.joinpath("not-zip-safe").is_file())
-
-        self._write_wheel_distinfo(purelib)
-        self._write_record_distinfo()
+            is_distinfo = source_path.name.endswith(".dist-info")
+            for name in METADATA_FILES:
+                source = source_path / name
+                if name == "METADATA" and not is_distinfo:
+                    source = source_path / "PKG-INFO"
+                if source.is_file():
+                    metadata_files[name] = source.read_bytes()
+        distinfo_name = self.distinfo_name
+        record = [f"{distinfo_name}/{name},," for name in metadata_files]
+        record.append(f"{distinfo_name}/RECORD,,")
+        metadata_files["RECORD"] = "\n".join(record).encode("utf_8")
 
     @property
     def name(self) -> str:
@@ -105,58 +107,19 @@ class DistributionCache(PathDistribution):
             self._dist, "_normalized_name", self.name.lower().replace("-", "_")
         )
 
-    def _write_wheel_distinfo(self, purelib: bool) -> None:
-        """Create a WHEEL file if it doesn't exist."""
-        target = self.locate_file(f"{self.distinfo_name}/WHEEL")
-        if not target.exists():
-            project = Path(__file__).parent.name  # cx_Freeze
-            version = metadata_version(project)
-            root_is_purelib = "true" if purelib else "false"
-            text = [
-                "Wheel-Version: 1.0",
-                f"Generator: {project} ({version})",
-                f"Root-Is-Purelib: {root_is_purelib}",
-                "Tag: py3-none-any",
-            ]
-            with target.open(mode="w", encoding="utf_8", newline="") as file:
-                file.write("\n".join(text))
-
-    def _write_record_distinfo(self) -> None:
-        """Recreate a minimal RECORD file."""
-        distinfo_name = self.distinfo_name
-        target = self.locate_file(f"{distinfo_name}/RECORD")
-        target_dir = target.parent
-        record = [
-            f"{distinfo_name}/{file.name},," for file in target_dir.iterdir()
-        ]
-        record.append(f"{distinfo_name}/RECORD,,")
-        with target.open(mode="w", encoding="utf_8", newline="") as file:
-            file.write("\n".join(record))
-
     @property
     def binary_files(self) -> list[str]:
         """Return the relative path of binary files included in the package."""
-        files = self._dist.files
-        if not files:
-            return []
+        return list(self.file_index.shared_library)
 
-        if IS_MINGW or IS_WINDOWS:
-            # all .dll's
-            return [
-                file.as_posix()
-                for file in files
-                if file.suffix.lower() == ".dll"
-            ]
-
-        # Linux and macOS
-        extensions = tuple([ext for ext in EXTENSION_SUFFIXES if ext != ".so"])
-        # all .so* or .dylib as long as it is not a python extension
-        return [
-            file.as_posix()
-            for file in files
-            if (file.match("*.so*") or file.match("*.dylib"))
-            and not file.name.endswith(extensions)
-        ]
+    @property
+    def file_index(self) -> DistributionFiles:
+        """Return the index of the files of the package, built only once."""
+        index = self._file_indexes.get(self.distinfo_name)
+        if index is None:
+            index = DistributionFiles(self._dist)
+            self._file_indexes[self.distinfo_name] = index
+        return index
 
     @property
     def installer(self) -> str:
@@ -167,12 +130,40 @@ class DistributionCache(PathDistribution):
 
     def locate_file(self, path: StrPath) -> Path:
         """Given a path to a file in this distribution, return a path to it."""
-        if Path(path).parents[0].as_posix() == self.distinfo_name:
-            full_path = super().locate_file(path)
-        else:
-            full_path = self._dist.locate_file(path)
+        full_path = self._dist.locate_file(path)
         return Path(str(full_path)).resolve()
 
+    def read_text(self, filename: str) -> str | None:
+        """Return the text of a metadata file.
+
+        The files needed at runtime are read from the cache, the others from
+        the distribution package.
+        """
+        data = self.metadata_files.get(filename)
+        if data is not None:
+            return data.decode("utf_8")
+        return self._dist.read_text(filename)
+
+    @property
+    def is_local(self) -> bool:
+        """Return True if the package is installed from a local source.
+
+        This is the case of an editable install of the application, or of an
+        install from its directory or from a wheel file built locally.
+        """
+        direct_url = self.read_text("direct_url.json")
+        if not direct_url:
+            return False
+        try:
+            data = json.loads(direct_url)
+        except ValueError:
+            return False
+        if not isinstance(data, dict):
+            return False
+        return "dir_info" in data or str(data.get("url", "")).startswith(
+            "file:"
+        )
+
     @property
     def requires(self) -> list[str]:
         """Generated requirements specified for this Distribution."""
@@ -194,3 +185,71 @@ class DistributionCache(PathDistribution):
             part.lower() if not part.isdigit() else int(part)
             for part in version_separators.split(version_value)
         )
+
+
+class DistributionFiles:
+    """Index of the files of a distribution package.
+
+    The files listed in RECORD are classified once, and each category maps
+    the relative path of the file, as listed, to its absolute path.
+    """
+
+    def __init__(self, distribution: Distribution) -> None:
+        """Construct the index of the files.
+
+        :param distribution: The distribution package to index.
+        """
+        self.source: dict[str, Path] = {}
+        self.bytecode: dict[str, Path] = {}
+        self.extension: dict[str, Path] = {}
+        self.shared_library: dict[str, Path] = {}
+        self.stub: dict[str, Path] = {}
+        self.tests: dict[str, Path] = {}
+        self.docs: dict[str, Path] = {}
+        self.metadata: dict[str, Path] = {}
+        self.data: dict[str, Path] = {}
+        files = distribution.files
+        if not files:
+            return
+        base_path = os.path.realpath(str(distribution.locate_file("")))
+        for file in files:
+            name = file.as_posix()
+            path = Path(os.path.normpath(os.path.join(base_path, name)))
+            getattr(self, self.classify(file))[name] = path
+
+    @staticmethod
+    def classify(file: PurePath) -> str:  # noqa: PLR0911
+        """Return the category of a file, given its relative path.
+
+        The binary files are classified by type first, so the shared
+        libraries found in the test directories are still included.
+        """
+        name = file.name
+        parents = file.parts[:-1]
+        if parents and parents[0].endswith((".dist-info", ".egg-info")):
+            return "metadata"
+        if IS_MINGW or IS_WINDOWS:
+            if name.lower().endswith(".dll"):
+                return "shared_library"
+            if name.lower().endswith(".pyd"):
+                return "extension"
+        elif name.endswith(_EXTENSION_SUFFIXES):
+            return "extension"
+        elif fnmatchcase(name, "*.so*") or fnmatchcase(name, "*.dylib"):
+            # all .so* or .dylib as long as it is not a python extension
+            return "shared_library"
+        if TESTS_DIRS.intersection(parents) or name == "conftest.py":
+            return "tests"
+        if DOCS_DIRS.intersection(parents):
+            return "docs"
+        suffix = file.suffix.lower()
+        if suffix == ".py":
+            return "source"
+        if suffix in (".pyc", ".pyo"):
+            return "bytecode"
+        if suffix == ".pyi":
+            return "stub"
+        return "data"
+
+
+_EXTENSION_SUFFIXES = tuple(ext for ext in EXTENSION_SUFFIXES if ext != ".so")
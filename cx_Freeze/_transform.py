@@ -0,0 +1,347 @@
+"""Source transformations applied before compiling the modules."""
+
+from __future__ import annotations
+
+import ast
+import operator
+import os
+import sys
+from contextlib import suppress
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import CodeType
+
+__all__ = [
+    "LAZY_IMPORT_FUNC",
+    "LAZY_IMPORT_MODULE",
+    "LAZY_IMPORT_NATIVE",
+    "compile_source",
+]
+
+# Python 3.15+ (PEP 810) marks the import statements with the is_lazy field
+LAZY_IMPORT_NATIVE = "is_lazy" in ast.Import._fields
+# Name of the runtime module (cx_Freeze/runtime/lazy_import.py) and of the
+# function bound in the module globals to import the modules lazily
+LAZY_IMPORT_MODULE = "_cx_freeze_lazy"
+LAZY_IMPORT_FUNC = "_cx_freeze_lazy_import"
+
+
+def _lazy_import_statements(node: ast.Import) -> list[ast.stmt]:
+    """Return the statements that replace an import statement.
+
+    Each module is assigned by a call to the lazy import function, except the
+    dotted names without alias, which bind the top-level package and are kept
+    as eager imports.
+    """
+    statements: list[ast.stmt] = []
+    eager: list[ast.alias] = []
+    for alias in node.names:
+        if alias.asname is None and "." in alias.name:
+            eager.append(alias)
+            continue
+        call = ast.Call(
+            func=ast.Name(id=LAZY_IMPORT_FUNC, ctx=ast.Load()),
+            args=[ast.Constant(value=alias.name)],
+            keywords=[],
+        )
+        target = ast.Name(id=alias.asname or alias.name, ctx=ast.Store())
+        statements.append(ast.Assign(targets=[target], value=call))
+    if eager:
+        statements.append(ast.Import(names=eager))
+    for statement in statements:
+        ast.copy_location(statement, node)
+    return statements
+
+
+def _lazy_imports(tree: ast.Module) -> None:
+    """Rewrite the top-level imports of the module into lazy imports.
+
+    Only the statements at the top level of the module are changed, so the
+    imports in functions or guarded by try/except are kept as they are.
+    With Python 3.15+, the import statements are marked as lazy. With older
+    versions, the "import module" and "import module as name" statements are
+    replaced by a call to lazy_import of the runtime module, that uses
+    importlib.util.LazyLoader; the "from module import name" statements are
+    kept, because they access the module at import time.
+    """
+    body: list[ast.stmt] = []
+    preamble = 0
+    changed = False
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+            preamble = len(body) + 1
+        elif (
+            isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+            and not body
+        ):
+            preamble = 1  # docstring
+        elif (LAZY_IMPORT_NATIVE and isinstance(node, ast.Import)) or (
+            LAZY_IMPORT_NATIVE
+            and isinstance(node, ast.ImportFrom)
+            and node.names[0].name != "*"
+        ):
+            node.is_lazy = 1  # ty: ignore[unresolved-attribute]
+        elif isinstance(node, ast.Import):
+            statements = _lazy_import_statements(node)
+            changed = changed or not isinstance(statements[0], ast.Import)
+            body.extend(statements)
+            continue
+        body.append(node)
+    if changed:
+        # bind the lazy import function in the module globals
+        alias = ast.alias(name="lazy_import", asname=LAZY_IMPORT_FUNC)
+        node = ast.ImportFrom(
+            module=LAZY_IMPORT_MODULE, names=[alias], level=0
+        )
+        body.insert(preamble, ast.copy_location(node, body[preamble]))
+    tree.body = body
+
+
+def _bound_names(node: ast.AST) -> list[str]:  # noqa: PLR0911
+    """Return the names bound by a node, in any scope of the module."""
+    if isinstance(node, ast.Name):
+        return [] if isinstance(node.ctx, ast.Load) else [node.id]
+    if isinstance(node, ast.arg):
+        return [node.arg]
+    if isinstance(node, ast.alias):
+        return [node.asname or node.name.partition(".")[0]]
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [node.name]
+    if isinstance(node, (ast.ExceptHandler, ast.MatchAs, ast.MatchStar)):
+        return [node.name] if node.name else []
+    if isinstance(node, ast.MatchMapping):
+        return [node.rest] if node.rest else []
+    return []
+
+
+class _PlatformBranches(ast.NodeTransformer):
+    """Remove the branches that are dead on the current platform.
+
+    The conditions are evaluated using the values of sys.platform, os.name
+    and sys.version_info, when sys and os are imported at the top level of
+    the module, and the IS_* style constants assigned once from them.
+
+    In a function, the dead code is kept under "if 0:", that the compiler
+    removes, because its yield and the names it binds still change the
+    function (a generator, local names).
+    """
+
+    def __init__(self, tree: ast.Module) -> None:
+        modules: dict[str, dict[str, object]] = {
+            "os": {"name": os.name},
+            "sys": {
+                "platform": sys.platform,
+                "version_info": tuple(sys.version_info),
+            },
+        }
+        # the names must be bound only once in the module
+        assigned: dict[str, int] = {}
+        for node in ast.walk(tree):
+            for name in _bound_names(node):
+                assigned[name] = assigned.get(name, 0) + 1
+        self.modules: dict[str, dict[str, object]] = {}
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    name = alias.asname or alias.name
+                    if alias.name in modules and assigned[name] == 1:
+                        self.modules[name] = modules[alias.name]
+        self.constants: dict[str, object] = {}
+        for node in tree.body:
+            if (
+                isinstance(node, ast.Assign)
+                and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id.startswith("IS_")
+                and assigned[node.targets[0].id] == 1
+            ):
+                value = self.evaluate(node.value)
+                if isinstance(value, bool):
+                    self.constants[node.targets[0].id] = value
+        self.removed = 0
+        # the scopes being visited, True for a function
+        self._scopes: list[bool] = [False]
+
+    def evaluate(self, node: ast.expr) -> object:  # noqa: PLR0911
+        """Return the value of an expression, or _UNKNOWN."""
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            return self.constants.get(node.id, _UNKNOWN)
+        if isinstance(node, ast.Attribute):
+            if isinstance(node.value, ast.Name):
+                values = self.modules.get(node.value.id, {})
+                return values.get(node.attr, _UNKNOWN)
+            return _UNKNOWN
+        if isinstance(node, ast.Tuple):
+            items = tuple(self.evaluate(elt) for elt in node.elts)
+            return _UNKNOWN if _UNKNOWN in items else items
+        if isinstance(node, ast.Subscript):
+            return self._evaluate_subscript(node)
+        if isinstance(node, ast.Call):
+            return self._evaluate_call(node)
+        if isinstance(node, ast.Compare):
+            return self._evaluate_compare(node)
+        if isinstance(node, ast.BoolOp):
+            # an unknown operand can have side effects, so the evaluation
+            # stops there, like the short-circuit of the operator
+            stop = isinstance(node.op, ast.Or)
+            for operand in node.values:
+                value = _bool_value(self.evaluate(operand))
+                if value is _UNKNOWN or value is stop:
+                    return value
+            return not stop
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            value = _bool_value(self.evaluate(node.operand))
+            return _UNKNOWN if value is _UNKNOWN else not value
+        return _UNKNOWN
+
+    def _evaluate_subscript(self, node: ast.Subscript) -> object:
+        """Evaluate sys.version_info[0] or sys.version_info[:2]."""
+        value = self.evaluate(node.value)
+        if not isinstance(value, tuple):
+            return _UNKNOWN
+        index = node.slice
+        if isinstance(index, ast.Slice):
+            if index.step is not None:
+                return _UNKNOWN
+            lower = self.evaluate(index.lower) if index.lower else 0
+            upper = self.evaluate(index.upper) if index.upper else len(value)
+            if isinstance(lower, int) and isinstance(upper, int):
+                return value[lower:upper]
+            return _UNKNOWN
+        position = self.evaluate(index)
+        if isinstance(position, int) and -len(value) <= position < len(value):
+            return value[position]
+        return _UNKNOWN
+
+    def _evaluate_call(self, node: ast.Call) -> object:
+        """Evaluate sys.platform.startswith(...)."""
+        func = node.func
+        if (
+            isinstance(func, ast.Attribute)
+            and func.attr in ("startswith", "endswith")
+            and len(node.args) == 1
+            and not node.keywords
+        ):
+            value = self.evaluate(func.value)
+            argument = self.evaluate(node.args[0])
+            if isinstance(value, str) and isinstance(argument, (str, tuple)):
+                with suppress(TypeError):
+                    return getattr(value, func.attr)(argument)
+        return _UNKNOWN
+
+    def _evaluate_compare(self, node: ast.Compare) -> object:
+        values = [self.evaluate(node.left)]
+        values += [self.evaluate(value) for value in node.comparators]
+        if _UNKNOWN in values:
+            return _UNKNOWN
+        for op, (left, right) in zip(node.ops, pairwise(values), strict=True):
+            compare = _COMPARE_OPERATORS.get(type(op))
+            if compare is None:
+                return _UNKNOWN
+            try:
+                if not compare(left, right):
+                    return False
+            except TypeError:
+                return _UNKNOWN
+        return True
+
+    def _visit_scope(self, node: ast.AST, function: bool) -> ast.AST:
+        self._scopes.append(function)
+        try:
+            self.generic_visit(node)
+        finally:
+            self._scopes.pop()
+        return node
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+        return self._visit_scope(node, True)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
+        return self._visit_scope(node, True)
+
+    def visit_Lambda(self, node: ast.Lambda) -> ast.AST:
+        return self._visit_scope(node, True)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.AST:
+        return self._visit_scope(node, False)
+
+    def visit_If(self, node: ast.If) -> ast.AST | list[ast.stmt]:
+        self.generic_visit(node)
+        value = _bool_value(self.evaluate(node.test))
+        if value is _UNKNOWN:
+            return node
+        self.removed += 1
+        body = node.body if value else node.orelse
+        dead = node.orelse if value else node.body
+        if dead and self._scopes[-1]:
+            test = ast.Constant(value=0)
+            dead_if = ast.If(test=test, body=dead, orelse=[])
+            body = [*body, ast.copy_location(dead_if, node)]
+        return body or ast.copy_location(ast.Pass(), node)
+
+    def visit_IfExp(self, node: ast.IfExp) -> ast.AST:
+        self.generic_visit(node)
+        value = _bool_value(self.evaluate(node.test))
+        if value is _UNKNOWN:
+            return node
+        dead = node.orelse if value else node.body
+        if self._scopes[-1] and any(
+            isinstance(child, _FUNCTION_EXPRESSIONS)
+            for child in ast.walk(dead)
+        ):
+            return node
+        self.removed += 1
+        return node.body if value else node.orelse
+
+
+_UNKNOWN = object()
+# the expressions that change the function they are in
+_FUNCTION_EXPRESSIONS = (ast.Await, ast.NamedExpr, ast.Yield, ast.YieldFrom)
+_COMPARE_OPERATORS: dict[type[ast.cmpop], Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
+
+
+def _bool_value(value: object) -> object:
+    """Return the truth value of a known value, or _UNKNOWN."""
+    return value if value is _UNKNOWN else bool(value)
+
+
+def compile_source(
+    source: str | bytes,
+    filename: str,
+    optimize: int,
+    *,
+    lazy_imports: bool = False,
+    platform_branches: bool = False,
+) -> CodeType:
+    """Compile the source of a module, applying the selected transformations.
+
+    :param lazy_imports: Rewrite the top-level imports into lazy imports.
+    :param platform_branches: Remove the code of the if statements that are
+        dead on the current platform, like 'if sys.platform == "win32":' on
+        Linux, so the imports inside these branches are no longer followed.
+    """
+    tree = ast.parse(source, filename)
+    if platform_branches:
+        tree = _PlatformBranches(tree).visit(tree)
+    if lazy_imports:
+        _lazy_imports(tree)
+    ast.fix_missing_locations(tree)
+    return compile(
+        tree, filename, "exec", dont_inherit=True, optimize=optimize
+    )
@@ -0,0 +1,631 @@
+"""Writers of the modules, to a zip file or directly to the file system."""
+
+from __future__ import annotations
+
+import marshal
+import os
+import struct
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib import import_module
+from importlib.util import MAGIC_NUMBER
+from typing import TYPE_CHECKING, Any
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+__all__ = [
+    "COMPRESS_BEST",
+    "COMPRESS_STORED",
+    "LAYER_IMPORT_MODULE",
+    "SPLIT_IMPORT_MODULE",
+    "ZSTD_IMPORT_MODULE",
+    "DirectoryWriter",
+    "LayeredZipWriter",
+    "ModuleWriter",
+    "SplitZipWriter",
+    "ZipWriter",
+    "ZstdWriter",
+    "zstd_backend",
+]
+
+# the entries are compressed in a pool of threads (zlib releases the GIL),
+# except the small ones, which are faster to compress in place
+COMPRESS_WORKERS = os.cpu_count() or 1
+COMPRESS_MIN_SIZE = 4096
+# the number of entries waiting to be written, to bound the memory used
+COMPRESS_PENDING = 256
+
+# the internals of ZipFile used to write the entries compressed in advance;
+# without them, the entries are compressed serially by writestr
+ZIPFILE_INTERNALS = (
+    "_didModify",
+    "_lock",
+    "_writecheck",
+    "NameToInfo",
+    "filelist",
+    "fp",
+    "start_dir",
+)
+
+# compression of an entry, overriding the compression of the writer
+COMPRESS_STORED = "stored"
+COMPRESS_BEST = "best"
+
+# Name of the runtime module (cx_Freeze/runtime/cold_import.py) that imports
+# the modules from the cold zip file, when the modules are split in two zips
+SPLIT_IMPORT_MODULE = "_cx_freeze_cold"
+
+# Name of the runtime module (cx_Freeze/runtime/layer_import.py) that adds
+# the zip file of the dependencies to sys.path, when the modules are layered;
+# the files of that zip file have a fixed time, so it is reproducible
+LAYER_IMPORT_MODULE = "_cx_freeze_layer"
+LAYER_MTIME = 315532800  # 1980-01-01
+
+# Name of the runtime module (cx_Freeze/runtime/zstd_import.py) that imports
+# the modules from the Zstandard archive, and the format of the archive
+ZSTD_IMPORT_MODULE = "_cx_freeze_zstd"
+ZSTD_ARCHIVE_MAGIC = b"CXZSTD01"
+ZSTD_LEVEL = 3
+ZSTD_LEVEL_BEST = 19
+# the modules needed before the importer is installed are kept in the zip file
+BOOTSTRAP_MODULES = frozenset(
+    {
+        ZSTD_IMPORT_MODULE,
+        LAYER_IMPORT_MODULE,
+        SPLIT_IMPORT_MODULE,
+        "BUILD_CONSTANTS",
+        "__future__",
+        "__startup__",
+        "_collections_abc",
+        "_sitebuiltins",
+        "abc",
+        "codecs",
+        "encodings",
+        "genericpath",
+        "io",
+        "ntpath",
+        "os",
+        "posixpath",
+        "site",
+        "stat",
+        "zipimport",
+    }
+)
+
+
+class ModuleWriter(ABC):
+    """Base class of the writers of the modules and their metadata.
+
+    The names are relative to the root of the writer, using forward slashes
+    as separators, like the names of the zip files.
+    """
+
+    @abstractmethod
+    def write_data(
+        self,
+        name: str,
+        data: bytes,
+        mtime: int | None = None,
+        compression: str | None = None,
+    ) -> None:
+        """Write the data to a file with the given name.
+
+        :param name: The name of the file.
+        :param data: The content of the file.
+        :param mtime: The modification time of the file (the time of its
+            source), or None to use the current time.
+        :param compression: COMPRESS_STORED to store the file without
+            compression, COMPRESS_BEST to compress it with the best
+            compression (if the writer compresses), or None to use the
+            compression of the writer.
+        """
+
+    @abstractmethod
+    def write_file(self, source: Path, name: str) -> None:
+        """Write the content of the source file with the given name."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finish writing the files."""
+
+
+def _deflate(data: bytes, level: int) -> tuple[int, bytes]:
+    """Return the CRC and the data compressed like ZipFile.writestr does."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return zlib.crc32(data), compressor.compress(data) + compressor.flush()
+
+
+def _store(data: bytes) -> tuple[int, bytes]:
+    """Return the CRC and the data, for an entry without compression."""
+    return zlib.crc32(data), data
+
+
+class _ZipFile(ZipFile):
+    """A zip file that accepts entries compressed in advance.
+
+    This relies on the internals of ZipFile, so precompressed is False when
+    they are not found, and the entries must be written by writestr.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.precompressed: bool = hasattr(ZipInfo, "FileHeader") and all(
+            hasattr(self, name) for name in ZIPFILE_INTERNALS
+        )
+
+    def write_compressed(
+        self, zinfo: ZipInfo, crc: int, compressed: bytes
+    ) -> None:
+        """Write an entry whose data is already compressed.
+
+        The entry is the same as written by writestr, including its header.
+        The file_size of zinfo must be set to the size of the data.
+        """
+        with self._lock:
+            zinfo.compress_size = len(compressed)
+            zinfo.CRC = crc
+            zinfo.flag_bits = 0
+            if not zinfo.external_attr:
+                zinfo.external_attr = 0o600 << 16
+            self.fp.seek(self.start_dir)
+            zinfo.header_offset = self.fp.tell()
+            self._writecheck(zinfo)
+            self._didModify = True
+            self.fp.write(zinfo.FileHeader(False))
+            self.fp.write(compressed)
+            self.start_dir = self.fp.tell()
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+
+
+class ZipWriter(ModuleWriter):
+    """Write the modules to a zip file.
+
+    When compressed, the entries are compressed in a pool of threads and
+    written in the order they are given, so the zip file is the same as
+    the one compressed serially. Each entry can be stored, or compressed
+    with the best compression when the zip file is compressed.
+    """
+
+    def __init__(self, filename: Path, compress: bool) -> None:
+        self.filename: Path = filename
+        self.compress_type: int = ZIP_DEFLATED if compress else ZIP_STORED
+        self._outfile = _ZipFile(
+            filename, "w", self.compress_type, strict_timestamps=False
+        )
+        self._pool: ThreadPoolExecutor | None = None
+        if compress and COMPRESS_WORKERS > 1 and self._outfile.precompressed:
+            self._pool = ThreadPoolExecutor(COMPRESS_WORKERS)
+        self._pending: deque[tuple[ZipInfo, Future[tuple[int, bytes]]]] = (
+            deque()
+        )
+
+    def write_data(
+        self,
+        name: str,
+        data: bytes,
+        mtime: int | None = None,
+        compression: str | None = None,
+    ) -> None:
+        if mtime is None:
+            zip_time = time.localtime()[:6]
+        else:
+            zip_time = time.localtime(mtime)[:6]
+            if zip_time[0] < 1980:
+                zip_time = (1980, 1, 1, 0, 0, 0)
+        zinfo = ZipInfo(name, zip_time)
+        if compression == COMPRESS_STORED:
+            zinfo.compress_type = ZIP_STORED
+        else:
+            zinfo.compress_type = self.compress_type
+        if not self._outfile.precompressed or len(data) * 1.05 > ZIP64_LIMIT:
+            self._flush()
+            level = None
+            if zinfo.compress_type == ZIP_DEFLATED:
+                level = (
+                    zlib.Z_BEST_COMPRESSION
+                    if compression == COMPRESS_BEST
+                    else zlib.Z_DEFAULT_COMPRESSION
+                )
+            zinfo.external_attr = 0o600 << 16
+            self._outfile.writestr(zinfo, data, compresslevel=level)
+            return
+        zinfo.file_size = len(data)
+        if zinfo.compress_type == ZIP_STORED:
+            job, args = _store, (data,)
+        elif compression == COMPRESS_BEST:
+            job, args = _deflate, (data, zlib.Z_BEST_COMPRESSION)
+        else:
+            job, args = _deflate, (data, zlib.Z_DEFAULT_COMPRESSION)
+        if (
+            self._pool is None
+            or zinfo.compress_type == ZIP_STORED
+            or len(data) < COMPRESS_MIN_SIZE
+        ):
+            future: Future[tuple[int, bytes]] = Future()
+            future.set_result(job(*args))
+        else:
+            future = self._pool.submit(job, *args)
+        self._pending.append((zinfo, future))
+        if len(self._pending) > COMPRESS_PENDING:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Write the first entry compressed in the pool of threads."""
+        zinfo, future = self._pending.popleft()
+        self._outfile.write_compressed(zinfo, *future.result())
+
+    def _flush(self) -> None:
+        """Write all the entries compressed in the pool of threads."""
+        while self._pending:
+            self._write_pending()
+
+    def write_file(self, source: Path, name: str) -> None:
+        self._flush()
+        self._outfile.write(source, name)
+
+    def close(self) -> None:
+        try:
+            self._flush()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+            self._outfile.close()
+
+
+class DirectoryWriter(ModuleWriter):
+    """Write the modules straight to their final paths in a directory.
+
+    The files are written and copied using the functions of the freezer,
+    which keep track of the files for incremental builds.
+    """
+
+    def __init__(
+        self,
+        target_dir: Path,
+        write: Callable[[Path, bytes], None],
+        copy: Callable[[Path, Path], None],
+    ) -> None:
+        self.target_dir: Path = target_dir
+        self._write = write
+        self._copy = copy
+
+    def write_data(
+        self,
+        name: str,
+        data: bytes,
+        mtime: int | None = None,  # noqa: ARG002
+        compression: str | None = None,  # noqa: ARG002
+    ) -> None:
+        self._write(self.target_dir / name, data)
+
+    def write_file(self, source: Path, name: str) -> None:
+        self._copy(source, self.target_dir / name)
+
+    def close(self) -> None:
+        pass
+
+
+def _module_name(name: str) -> tuple[str | None, bool]:
+    """Return the module name and if it is a package, from a file name."""
+    if not name.endswith(".pyc"):
+        return None, False
+    parts = name[:-4].split("/")
+    is_package = len(parts) > 1 and parts[-1] == "__init__"
+    if is_package:
+        parts.pop()
+    return ".".join(parts), is_package
+
+
+def _embedding_stub(
+    module_name: str, data: bytes, function: str, archive: str
+) -> bytes:
+    """Return the pyc data of the stub of an init module.
+
+    The stub imports the runtime module, and calls the given function of the
+    runtime module with the globals, the name of the archive and the code of
+    the init module, embedded in the stub.
+    """
+    runtime = function.partition(".")[0]
+    source = (
+        f"import {runtime}\n"
+        f"{function}(globals(), {archive!r}, {data[16:]!r})\n"
+    )
+    code = compile(source, f"{module_name}.py", "exec", dont_inherit=True)
+    return data[:16] + marshal.dumps(code)
+
+
+class SplitZipWriter(ModuleWriter):
+    """Write the modules to two zip files, a hot one and a cold one.
+
+    The hot zip file, in sys.path, holds the modules imported at startup,
+    their parent packages and the modules needed to install the importer of
+    the cold zip file, with a stub for each of the init modules, that
+    installs the importer and executes the init module embedded in the
+    stub. The cold zip file holds the other modules, and the data files of
+    their packages; the other files are written to the hot zip file.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        cold_filename: Path,
+        compress: bool,
+        init_modules: Iterable[str],
+        hot_modules: Iterable[str],
+    ) -> None:
+        self.filename: Path = filename
+        self.cold_filename: Path = cold_filename
+        self._init_modules: set[str] = set(init_modules)
+        self._hot_modules: set[str] = set(self._init_modules)
+        for name in hot_modules:
+            parts = name.split(".")
+            self._hot_modules.update(
+                ".".join(parts[:i]) for i in range(1, len(parts) + 1)
+            )
+        self._cold_packages: set[str] = set()
+        self._hot = ZipWriter(filename, compress)
+        self._cold = ZipWriter(cold_filename, compress)
+
+    def _is_hot(self, module_name: str) -> bool:
+        return (
+            module_name in self._hot_modules
+            or module_name.partition(".")[0] in BOOTSTRAP_MODULES
+        )
+
+    def _writer(self, name: str) -> ZipWriter:
+        """Return the writer of a file, that is not a module."""
+        package = name.rpartition("/")[0].replace("/", ".")
+        if package in self._cold_packages:
+            return self._cold
+        return self._hot
+
+    def write_data(
+        self,
+        name: str,
+        data: bytes,
+        mtime: int | None = None,
+        compression: str | None = None,
+    ) -> None:
+        module_name, is_package = _module_name(name)
+        if module_name is None:
+            self._writer(name).write_data(name, data, mtime, compression)
+        elif self._is_hot(module_name):
+            if module_name in self._init_modules:
+                data = _embedding_stub(
+                    module_name,
+                    data,
+                    f"{SPLIT_IMPORT_MODULE}.exec_split",
+                    self.cold_filename.name,
+                )
+            self._hot.write_data(name, data, mtime, compression)
+        else:
+            if is_package:
+                self._cold_packages.add(module_name)
+            self._cold.write_data(name, data, mtime, compression)
+
+    def write_file(self, source: Path, name: str) -> None:
+        self._writer(name).write_file(source, name)
+
+    def close(self) -> None:
+        try:
+            self._cold.close()
+        finally:
+            self._hot.close()
+
+
+class LayeredZipWriter(ModuleWriter):
+    """Write the modules to two zip files, layering the dependencies.
+
+    The zip file of the dependencies holds the given modules, the data files
+    of their packages and the metadata of the distributions; its entries and
+    the headers of its modules have a fixed time and no source size, so it
+    is identical while the dependencies do not change, and it is not written
+    again when it already exists. The zip file of the application holds the
+    other modules and files, with a stub for each of the init modules, that
+    adds the zip file of the dependencies to sys.path and executes the init
+    module embedded in the stub.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        deps_filename: Path,
+        compress: bool,
+        init_modules: Iterable[str],
+        deps_modules: Iterable[str],
+    ) -> None:
+        self.filename: Path = filename
+        self.deps_filename: Path = deps_filename
+        self._init_modules: set[str] = set(init_modules)
+        self._deps_modules: set[str] = set(deps_modules)
+        self._deps_packages: set[str] = set()
+        self._app = ZipWriter(filename, compress)
+        # an existing zip file was completely written, because it is written
+        # to a temporary file that is renamed when it is closed
+        self._deps: ZipWriter | None = None
+        if not deps_filename.exists():
+            self._deps = ZipWriter(deps_filename.with_suffix(".tmp"), compress)
+
+    def _is_deps(self, name: str, module_name: str | None) -> bool:
+        if module_name is not None:
+            return (
+                module_name in self._deps_modules
+                and module_name.partition(".")[0] not in BOOTSTRAP_MODULES
+            )
+        directory = name.partition("/")[0]
+        if directory.endswith(".dist-info"):
+            return True
+        package = name.rpartition("/")[0].replace("/", ".")
+        return package in self._deps_packages
+
+    def write_data(
+        self,
+        name: str,
+        data: bytes,
+        mtime: int | None = None,
+        compression: str | None = None,
+    ) -> None:
+        module_name, is_package = _module_name(name)
+        if not self._is_deps(name, module_name):
+            if module_name in self._init_modules:
+                data = _embedding_stub(
+                    module_name,
+                    data,
+                    f"{LAYER_IMPORT_MODULE}.exec_layered",
+                    self.deps_filename.name,
+                )
+            self._app.write_data(name, data, mtime, compression)
+            return
+        if is_package:
+            self._deps_packages.add(module_name)
+        if self._deps is not None:
+            if data[:4] == MAGIC_NUMBER:
+                # the header of the pyc file has the time of the source
+                data = (
+                    data[:8] + struct.pack("<LL", LAYER_MTIME, 0) + data[16:]
+                )
+            self._deps.write_data(name, data, LAYER_MTIME, compression)
+
+    def write_file(self, source: Path, name: str) -> None:
+        if not self._is_deps(name, None):
+            self._app.write_file(source, name)
+        elif self._deps is not None:
+            self._deps.write_data(name, source.read_bytes(), LAYER_MTIME)
+
+    def close(self) -> None:
+        try:
+            if self._deps is not None:
+                self._deps.close()
+                self._deps.filename.replace(self.deps_filename)
+        finally:
+            self._app.close()
+
+
+def zstd_backend() -> tuple[Callable[[bytes, int], bytes], str] | None:
+    """Return the Zstandard backend, or None if it is not available.
+
+    The backend is the function to compress the data with the given level at
+    build time, and the module to include to decompress it at runtime.
+    """
+    try:
+        zstd = import_module("compression.zstd")  # Python 3.14+
+    except ImportError:
+        try:
+            zstandard = import_module("zstandard")
+        except ImportError:
+            return None
+        compressors = {}
+
+        def compress(data: bytes, level: int) -> bytes:
+            compressor = compressors.get(level)
+            if compressor is None:
+                compressor = compressors[level] = zstandard.ZstdCompressor(
+                    level=level
+                )
+            return compressor.compress(data)
+
+        return compress, "zstandard.backend_c"
+    return zstd.compress, "_zstd"
+
+
+class ZstdWriter(ModuleWriter):
+    """Write the modules to a Zstandard archive, next to the zip file.
+
+    The archive is read by the runtime module _cx_freeze_zstd. The modules
+    needed before it is installed, the data files and the metadata are
+    written to the zip file, without compression, with a stub for each of
+    the init modules, that installs the importer and executes the init
+    module stored in the archive. The modules stored without compression
+    are read from the archive as they are.
+
+    The modules imported at startup, when given and written first, are read
+    ahead by the runtime module when the archive is opened.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        archive: Path,
+        init_modules: Iterable[str],
+        startup_modules: Iterable[str] = (),
+    ) -> None:
+        backend = zstd_backend()
+        if backend is None:
+            msg = "Zstandard compression is not available"
+            raise RuntimeError(msg)
+        self.filename: Path = filename
+        self.archive: Path = archive
+        self._compress = backend[0]
+        self._init_modules: set[str] = set(init_modules)
+        self._startup_modules: set[str] = set(startup_modules)
+        self._readahead: int = 0
+        self._index: dict[str, tuple[int, int, int, bool, bool]] = {}
+        self._zip = ZipWriter(filename, compress=False)
+        self._file = archive.open("wb")
+
+    def _stub(self, module_name: str, mtime: int | None) -> bytes:
+        """Return the pyc data of the stub of an init module."""
+        source = (
+            f"import {ZSTD_IMPORT_MODULE}\n"
+            f"{ZSTD_IMPORT_MODULE}.exec_archived("
+            f"__name__, globals(), {self.archive.name!r})\n"
+        )
+        code = compile(source, f"{module_name}.py", "exec", dont_inherit=True)
+        mtime = int(time.time() if mtime is None else mtime) & 0xFFFF_FFFF
+        header = MAGIC_NUMBER + struct.pack("<iLL", 0, mtime, 0)
+        return header + marshal.dumps(code)
+
+    def write_data(
+        self,
+        name: str,
+        data: bytes,
+        mtime: int | None = None,
+        compression: str | None = None,
+    ) -> None:
+        module_name, is_package = _module_name(name)
+        if (
+            module_name is None
+            or module_name.partition(".")[0] in BOOTSTRAP_MODULES
+        ):
+            self._zip.write_data(name, data, mtime)
+            return
+        code = data[16:]  # without the pyc header
+        if compression == COMPRESS_STORED:
+            compressed = code
+        elif compression == COMPRESS_BEST:
+            compressed = self._compress(code, ZSTD_LEVEL_BEST)
+        else:
+            compressed = self._compress(code, ZSTD_LEVEL)
+        offset = self._file.tell()
+        self._index[module_name] = (
+            offset,
+            len(compressed),
+            len(code),
+            is_package,
+            compression != COMPRESS_STORED,
+        )
+        self._file.write(compressed)
+        if module_name in self._startup_modules:
+            self._readahead = self._file.tell()
+        if module_name in self._init_modules:
+            self._zip.write_data(name, self._stub(module_name, mtime), mtime)
+
+    def write_file(self, source: Path, name: str) -> None:
+        self._zip.write_file(source, name)
+
+    def close(self) -> None:
+        try:
+            offset = self._file.tell()
+            self._file.write(marshal.dumps((self._readahead, self._index)))
+            self._file.write(offset.to_bytes(8, "little"))
+            self._file.write(ZSTD_ARCHIVE_MAGIC)
+        finally:
+            self._file.close()
+            self._zip.close()
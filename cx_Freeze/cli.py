@@ -8,6 +8,7 @@ import sys
 from pathlib import Path
 
 from cx_Freeze import __version__, setup
+from cx_Freeze._cache import ARTIFACT_CACHE_SIZE, ArtifactCache, parse_size
 
 __all__ = ["main"]
 
@@ -31,6 +32,7 @@ when used by Python app from Microsoft Store.
 
 Additional help:
     %(prog)s build_exe --help
+    %(prog)s cache --help
 
 Linux and similar OS:
     %(prog)s bdist_appimage --help
@@ -156,7 +158,8 @@ def prepare_parser() -> argparse.ArgumentParser:
         nargs=argparse.OPTIONAL,
         metavar="COMMAND [command_options] ...",
         help="build, build_exe or supported bdist commands and options "
-        "(commands can be chained in the order of execution)",
+        "(commands can be chained in the order of execution), or cache to "
+        "inspect and prune the artifact cache",
     )
     # Version
     parser.add_argument("--version", action="version", version=VERSION)
@@ -164,6 +167,67 @@ def prepare_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _size(value: str) -> int:
+    try:
+        return parse_size(value)
+    except ValueError:
+        msg = f"invalid size: {value!r}"
+        raise argparse.ArgumentTypeError(msg) from None
+
+
+def _format_size(size: int) -> str:
+    value = float(size)
+    for unit in ("bytes", "KiB", "MiB", "GiB"):
+        if value < 1024 or unit == "GiB":
+            break
+        value /= 1024
+    return f"{size} bytes" if unit == "bytes" else f"{value:.1f} {unit}"
+
+
+def cache_command(argv: list[str]) -> None:
+    """Inspect and prune the artifact cache."""
+    parser = argparse.ArgumentParser(
+        prog="cxfreeze cache",
+        description="Inspect and prune the artifact cache of the builds.",
+    )
+    parser.add_argument(
+        "action",
+        nargs=argparse.OPTIONAL,
+        choices=["info", "prune", "clear"],
+        default="info",
+        help="info: show the location and the size of the cache; prune: "
+        "remove the least recently used artifacts to fit in the size "
+        "limit; clear: remove all the artifacts [default: info]",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="the directory of the artifact cache "
+        "[default: the artifacts subdirectory of the cx_Freeze cache]",
+    )
+    parser.add_argument(
+        "--max-size",
+        metavar="SIZE",
+        type=_size,
+        default=ARTIFACT_CACHE_SIZE,
+        help="the size limit used by prune, like 500M or 2G "
+        f"[default: {_format_size(ARTIFACT_CACHE_SIZE)}]",
+    )
+    args = parser.parse_args(argv)
+    try:
+        cache = ArtifactCache(args.cache_dir, args.max_size)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.action == "info":
+        count, total = cache.size()
+        print(f"location: {cache.path}")
+        print(f"artifacts: {count}")
+        print(f"size: {_format_size(total)}")
+        return
+    removed, freed = cache.prune(0 if args.action == "clear" else None)
+    print(f"removed {removed} artifacts ({_format_size(freed)})")
+
+
 def main() -> None:
     """Entry point for cxfreeze command line tool."""
     sys.setrecursionlimit(sys.getrecursionlimit() * 10)
@@ -174,6 +238,11 @@ def main() -> None:
     command = args.command
     verbose = args.verbose
 
+    # the cache command is not a setuptools command
+    if command == "cache" and script is None:
+        cache_command(argv)
+        return
+
     # help
     if "-h" in argv or "--help" in argv:
         if command is None:
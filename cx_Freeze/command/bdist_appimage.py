@@ -225,20 +225,33 @@ class bdist_appimage(Command):
         )
         self.mkpath(appdir)
 
-        # Copy from build_exe
-        build_dir: str = cast("str", self.build_dir)
-        self.copy_tree(build_dir, appdir, preserve_symlinks=True)
-
-        # Remove zip file after putting all files in the file system
+        # Copy from build_exe, putting all files in the file system
         # (appimage is a compressed file, no need of internal zip file)
-        library_data = Path(appdir, "lib", "library.dat")
+        build_dir: str = cast("str", self.build_dir)
+        library_data = Path(build_dir, "lib", "library.dat")
         if library_data.exists():
-            target_lib_dir = library_data.parent
-            filename = target_lib_dir / library_data.read_bytes().decode()
+            source_lib_dir = library_data.parent
+            filename = source_lib_dir / library_data.read_bytes().decode()
+            skipped = {library_data.name, filename.name}
+
+            def ignore(directory: str, names: list[str]) -> set[str]:
+                if Path(directory) != source_lib_dir:
+                    return set()
+                return skipped.intersection(names)
+
+            self.announce(f"copying {build_dir} -> {appdir}", logging.INFO)
+            shutil.copytree(
+                build_dir,
+                appdir,
+                symlinks=True,
+                ignore=ignore,
+                dirs_exist_ok=True,
+            )
+            # extract the zip file straight from the build directory
             with ZipFile(filename) as outfile:
-                outfile.extractall(target_lib_dir)
-            filename.unlink()
-            library_data.unlink()
+                outfile.extractall(os.path.join(appdir, "lib"))
+        else:
+            self.copy_tree(build_dir, appdir, preserve_symlinks=True)
 
         # Add icons, desktop file and entrypoint
         share_icons = os.path.join("share", "icons")
@@ -6,12 +6,14 @@ import logging
 import os
 import site
 import sys
+from pathlib import Path
 from pkgutil import resolve_name
 from typing import TYPE_CHECKING, ClassVar, cast
 
 from setuptools import Command
 
 from cx_Freeze._compat import BUILD_EXE_DIR, IS_UCRT
+from cx_Freeze._fingerprint import BuildFingerprint
 from cx_Freeze.common import normalize_to_list
 from cx_Freeze.exception import OptionError, SetupError
 from cx_Freeze.freezer import Freezer
@@ -121,6 +123,46 @@ class build_exe(Command):
             None,
             "create a zip file with no compression (See also --zip-filename)",
         ),
+        (
+            "compress-zstd",
+            None,
+            "compress the modules of the zip file with Zstandard, in an "
+            "archive next to it (requires Python 3.14 or zstandard)",
+        ),
+        (
+            "zip-stored-packages=",
+            None,
+            "comma-separated list of packages to store without compression "
+            "in the zip file, for faster imports; the other modules are "
+            "compressed with the best compression",
+        ),
+        (
+            "import-trace=",
+            None,
+            "file with the modules imported at startup (one per line, or the "
+            "output of python -X importtime), to store without compression "
+            "in the zip file with zip-stored-packages",
+        ),
+        (
+            "import-order",
+            None,
+            "write the modules in the order they are imported, the modules "
+            "of the import trace first",
+        ),
+        (
+            "split-archive",
+            None,
+            "split the zip file in a hot zip file, with the modules imported "
+            "at startup, and a cold zip file, opened on the first import "
+            "of another module",
+        ),
+        (
+            "layered-archive",
+            None,
+            "write the modules of the standard library and of the "
+            "distribution packages to their own zip file, named by their "
+            "versions and reused by the incremental builds",
+        ),
         (
             "optimize=",
             "O",
@@ -128,6 +170,67 @@ class build_exe(Command):
             '-O2 for "python -OO" and -O0 to disable '
             f"[default: -O{sys.flags.optimize}]",
         ),
+        (
+            "optimize-packages=",
+            None,
+            "comma-separated list of packages with their own optimization "
+            "level, using the form <package>=<level> (e.g. *=2,myapp=0; "
+            "the last matching package takes precedence)",
+        ),
+        (
+            "lazy-imports=",
+            None,
+            "comma-separated list of packages whose top-level imports are "
+            "compiled as lazy imports (or * for all) [default: none]",
+        ),
+        (
+            "prune-platform-branches=",
+            None,
+            "comma-separated list of packages whose imports in the branches "
+            "that are dead on the current platform (like sys.platform or "
+            "os.name checks) are not followed (or * for all) [default: none]",
+        ),
+        (
+            "strip-platform-branches=",
+            None,
+            "comma-separated list of packages to remove the branches that "
+            "are dead on the current platform from the bytecode "
+            "(or * for all) [default: none]",
+        ),
+        (
+            "exclude-tests=",
+            None,
+            "comma-separated list of names of the subpackages with the test "
+            "suites that are excluded from all packages "
+            "[default: tests,test,testing,conftest]",
+        ),
+        (
+            "include-tests=",
+            None,
+            "comma-separated list of packages whose test suites are included "
+            "(or * for all) [default: none]",
+        ),
+        (
+            "strip-docstrings=",
+            None,
+            "comma-separated list of packages to remove the docstrings from "
+            "the bytecode, regardless of optimization level "
+            "(or * for all; prefix with ! to exclude) [default: none]",
+        ),
+        (
+            "strip-annotations=",
+            None,
+            "comma-separated list of packages to remove the string "
+            "annotations of functions from the bytecode "
+            "(or * for all; prefix with ! to exclude) [default: none]",
+        ),
+        (
+            "strip-debug-ranges=",
+            None,
+            "comma-separated list of packages to remove the column "
+            "information from the bytecode, keeping the line numbers "
+            "(or * for all; prefix with ! to exclude) [default: none]",
+        ),
         (
             "silent",
             "s",
@@ -158,10 +261,81 @@ class build_exe(Command):
             "with one of the following values: 15, 16 or 17 "
             "(version 15 includes UCRT for Windows 8.1 and below)",
         ),
+        (
+            "package-data-from-record",
+            None,
+            "copy the data files of the packages listed in the RECORD of "
+            "their distribution instead of walking the package directories",
+        ),
+        (
+            "needed-libs-only",
+            None,
+            "include the shared libraries distributed along with the packages "
+            "only when they are needed by the extension modules",
+        ),
+        (
+            "incremental",
+            None,
+            "update the files of the previous build, instead of cleaning the "
+            "build directory",
+        ),
+        (
+            "copy-mode=",
+            None,
+            "how to copy the files: copy [default], reflink (clone the files "
+            "when the file system supports it), hardlink or auto",
+        ),
+        (
+            "dedup-files",
+            None,
+            "replace the files with the same content in the build directory "
+            "by hardlinks to one of them",
+        ),
+        (
+            "multicall",
+            None,
+            "copy one executable shared by the executables, which are "
+            "symbolic links to it (not supported on Windows)",
+        ),
+        (
+            "artifact-cache",
+            None,
+            "reuse the bytecode and the patched shared libraries of the "
+            "previous builds, stored in the artifact cache",
+        ),
+        (
+            "artifact-cache-dir=",
+            None,
+            "the directory of the artifact cache, that can be shared "
+            "(implies artifact-cache)",
+        ),
+        (
+            "artifact-cache-size=",
+            None,
+            "the size limit of the artifact cache, like 500M or 2G "
+            "[default: 2G]",
+        ),
+        (
+            "skip-unchanged",
+            None,
+            "skip the build when its inputs are unchanged since the previous "
+            "build, and the build directory is unmodified",
+        ),
     ]
     boolean_options: ClassVar[list[str]] = [
         "no-compress",
+        "compress-zstd",
+        "import-order",
+        "split-archive",
+        "layered-archive",
         "include-msvcr",
+        "package-data-from-record",
+        "needed-libs-only",
+        "incremental",
+        "dedup-files",
+        "multicall",
+        "artifact-cache",
+        "skip-unchanged",
         "silent",
     ]
 
@@ -224,7 +398,15 @@ class build_exe(Command):
             "bin_path_includes",
             "zip_includes",
             "zip_exclude_packages",
+            "zip_stored_packages",
             "zip_include_packages",
+            "lazy_imports",
+            "prune_platform_branches",
+            "strip_platform_branches",
+            "include_tests",
+            "strip_docstrings",
+            "strip_annotations",
+            "strip_debug_ranges",
         ]
         self.excludes = []
         self.includes = []
@@ -240,12 +422,37 @@ class build_exe(Command):
         self.zip_includes = []
         self.zip_exclude_packages = ["*"]
         self.zip_include_packages = []
+        self.zip_stored_packages = []
+        self.lazy_imports = []
+        self.prune_platform_branches = []
+        self.strip_platform_branches = []
+        self.exclude_tests = None
+        self.include_tests = []
+        self.strip_docstrings = []
+        self.strip_annotations = []
+        self.strip_debug_ranges = []
 
         self.build_exe = None
         self.include_msvcr = None
         self.include_msvcr_version = None
         self.no_compress = False
+        self.compress_zstd = False
+        self.import_trace = None
+        self.import_order = False
+        self.split_archive = False
+        self.layered_archive = False
         self.optimize = sys.flags.optimize
+        self.optimize_packages = []
+        self.package_data_from_record = False
+        self.needed_libs_only = False
+        self.incremental = False
+        self.copy_mode = "copy"
+        self.dedup_files = False
+        self.multicall = False
+        self.artifact_cache = False
+        self.artifact_cache_dir = None
+        self.artifact_cache_size = None
+        self.skip_unchanged = False
         self.path: list[str] = []
         self.silent = None
         self.silent_level = None
@@ -274,6 +481,8 @@ class build_exe(Command):
         # make sure all options of multiple values are lists
         for option in self.list_options:
             setattr(self, option, normalize_to_list(getattr(self, option)))
+        if self.exclude_tests is not None:  # can be empty to include all
+            self.exclude_tests = normalize_to_list(self.exclude_tests)
 
         # path options
         if self.path and isinstance(self.path, str):
@@ -301,6 +510,10 @@ class build_exe(Command):
 
         # compression options
         self.no_compress = bool(self.no_compress)
+        self.compress_zstd = bool(self.compress_zstd)
+        if self.no_compress and self.compress_zstd:
+            msg = "compress-zstd option cannot be used with no-compress"
+            raise OptionError(msg)
         if self.zip_filename:
             self.zip_filename = os.path.basename(
                 os.path.splitext(self.zip_filename)[0] + ".zip"
@@ -318,6 +531,8 @@ class build_exe(Command):
 
         # optimization level: 0,1,2
         self.optimize = int(self.optimize or sys.flags.optimize)
+        if isinstance(self.optimize_packages, str):
+            self.optimize_packages = normalize_to_list(self.optimize_packages)
 
     def run(self) -> None:
         # Update the package metadata
@@ -333,6 +548,16 @@ class build_exe(Command):
             constants=self.constants,
         )
 
+        fingerprint: BuildFingerprint | None = None
+        if self.skip_unchanged:
+            fingerprint = self._get_fingerprint(executables)
+            if fingerprint.is_up_to_date():
+                if not self.silent:
+                    print(f"{self.build_exe} is up to date")
+                return
+            # a failed build must not be taken as up to date
+            fingerprint.clear()
+
         freezer: Freezer = Freezer(
             executables,
             constants_module,
@@ -340,8 +565,14 @@ class build_exe(Command):
             excludes=self.excludes,
             packages=self.packages,
             replace_paths=self.replace_paths,
-            compress=(not self.no_compress),
+            compress="zstd" if self.compress_zstd else not self.no_compress,
+            zip_stored_packages=self.zip_stored_packages,
+            import_trace=self.import_trace,
+            import_order=self.import_order,
+            split_archive=self.split_archive,
+            layered_archive=self.layered_archive,
             optimize=self.optimize,
+            optimize_packages=self.optimize_packages,
             path=cast("list[StrPath]", self.path),
             target_dir=self.build_exe,
             bin_includes=self.bin_includes,
@@ -357,10 +588,46 @@ class build_exe(Command):
             include_msvcr=self.include_msvcr or False,
             include_msvcr_version=self.include_msvcr_version,
             zip_filename=self.zip_filename,
+            lazy_imports=self.lazy_imports,
+            prune_platform_branches=self.prune_platform_branches,
+            strip_platform_branches=self.strip_platform_branches,
+            exclude_tests=self.exclude_tests,
+            include_tests=self.include_tests,
+            strip_docstrings=self.strip_docstrings,
+            strip_annotations=self.strip_annotations,
+            strip_debug_ranges=self.strip_debug_ranges,
+            package_data_from_record=self.package_data_from_record,
+            needed_libs_only=self.needed_libs_only,
+            incremental=self.incremental,
+            copy_mode=self.copy_mode,
+            dedup_files=self.dedup_files,
+            multicall=self.multicall,
+            artifact_cache=self.artifact_cache_dir or self.artifact_cache,
+            artifact_cache_size=self.artifact_cache_size,
         )
 
         freezer.freeze()
         freezer.print_report()
+        if fingerprint is not None:
+            fingerprint.save(freezer)
+
+    def _get_fingerprint(
+        self, executables: list[Executable]
+    ) -> BuildFingerprint:
+        """Return the fingerprint of the options and of the executables."""
+        options = {}
+        for option, _, _ in self.user_options:
+            name = option.rstrip("=").replace("-", "_")
+            if name not in ("silent", "silent_level"):
+                options[name] = getattr(self, name)
+        metadata = self.distribution.metadata
+        options["metadata"] = (metadata.get_name(), metadata.get_version())
+        options["executables"] = [
+            sorted(vars(executable).items()) for executable in executables
+        ]
+        return BuildFingerprint(
+            Path(os.path.abspath(self.build_exe)).resolve(), options
+        )
 
     def set_source_location(self, name: str, *path_parts: str) -> None:
         env_name = f"{name.upper()}_BASE"
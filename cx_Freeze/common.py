@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from fnmatch import fnmatchcase
 from importlib import resources
 from pathlib import Path, PurePath
 from typing import TYPE_CHECKING
@@ -10,6 +11,8 @@ from typing import TYPE_CHECKING
 from cx_Freeze.exception import OptionError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from cx_Freeze._typing import IncludesList, InternalIncludesList, StrPath
 
 
@@ -70,3 +73,23 @@ def process_path_specs(specs: IncludesList | None) -> InternalIncludesList:
             raise OptionError(msg)
         processed_specs.append((source, target))
     return processed_specs
+
+
+def package_matches(name: str, patterns: Iterable[str]) -> bool:
+    """Check if the module name matches a list of package globs.
+
+    A pattern matches the named package and all of its submodules, and can
+    use shell-style wildcards (like 'numpy', 'PyQt6.*' or '*').
+    Patterns starting with '!' exclude the matched packages, so ['*', '!app']
+    matches every module except 'app' and its submodules.
+    """
+    parts = name.split(".")
+    prefixes = [".".join(parts[:i]) for i in range(1, len(parts) + 1)]
+    matched = False
+    for pattern in patterns:
+        if pattern.startswith("!"):
+            if any(fnmatchcase(prefix, pattern[1:]) for prefix in prefixes):
+                return False
+        elif not matched:
+            matched = any(fnmatchcase(prefix, pattern) for prefix in prefixes)
+    return matched
@@ -21,8 +21,9 @@ from cx_Freeze._compat import PLATFORM
 from cx_Freeze.exception import PlatformError
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
 
+    from cx_Freeze._cache import ArtifactCache
     from cx_Freeze._typing import StrPath
 
 # In Windows, to get dependencies, the default is to use lief package,
@@ -283,9 +284,12 @@ class ELFParser(Parser):
         bin_path_includes: list[str],
         silent: int,
         warnings: dict[str, bool],
+        artifact_cache: ArtifactCache | None = None,
     ) -> None:
         super().__init__(path, bin_path_includes, silent, warnings)
+        self.artifact_cache: ArtifactCache | None = artifact_cache
         self._patchelf = shutil.which("patchelf")
+        self._patchelf_version: str = ""
         self._verify_patchelf()
 
     def find_library(
@@ -423,6 +427,36 @@ class ELFParser(Parser):
             self.run_patchelf(["--remove-rpath", filename])
             self.run_patchelf(["--add-rpath", rpath, filename])
 
+    def patch(
+        self, filename: StrPath, rpath: str, needed: Mapping[str, str]
+    ) -> None:
+        """Set the rpath and replace the DT_NEEDED entries of a binary.
+
+        The patched binary is stored in the artifact cache, using its
+        content and the changes as the key, so patchelf is not run again.
+        """
+        cache = self.artifact_cache
+        key = None
+        if cache is not None:
+            key = cache.key(
+                "patchelf",
+                self._patchelf_version,
+                cache.file_hash(filename),
+                rpath,
+                *(f"{old}={new}" for old, new in sorted(needed.items())),
+            )
+            data = cache.get(key)
+            if data is not None:
+                self._set_write_mode(filename)
+                Path(filename).write_bytes(data)
+                return
+        if rpath:
+            self.set_rpath(filename, rpath)
+        for so_name, new_so_name in needed.items():
+            self.replace_needed(filename, so_name, new_so_name)
+        if key is not None:
+            cache.put(key, Path(filename).read_bytes())
+
     def set_soname(self, filename: StrPath, new_so_name: str) -> None:
         """Set DT_SONAME entry in the dynamic table."""
         self._set_write_mode(filename)
@@ -461,6 +495,7 @@ class ELFParser(Parser):
             msg = "Could not call `patchelf` binary"
             raise PlatformError(msg) from None
 
+        self._patchelf_version = version.strip()
         mobj = re.match(r"patchelf\s+(\d+(.\d+)?)", version)
         if mobj:
             version = mobj.group(1)
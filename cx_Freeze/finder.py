@@ -7,7 +7,9 @@ import inspect
 import json
 import linecache
 import logging
+import marshal
 import os
+import struct
 import sys
 import traceback
 from contextlib import suppress
@@ -30,6 +32,7 @@ from importlib.metadata import (
     distributions,
     packages_distributions,
 )
+from importlib.util import MAGIC_NUMBER, cache_from_source, source_hash
 from pathlib import Path
 from pkgutil import resolve_name
 from sysconfig import get_config_var
@@ -42,11 +45,19 @@ from cx_Freeze._bytecode import (
     code_object_replace_package,
     scan_code,
 )
+from cx_Freeze._cache import StubCache
 from cx_Freeze._compat import IS_WINDOWS, SOABI
-from cx_Freeze.common import process_path_specs, resource_path
+from cx_Freeze._transform import compile_source
+from cx_Freeze.common import (
+    package_matches,
+    process_path_specs,
+    resource_path,
+)
 from cx_Freeze.hooks.unused_modules import (
     DEFAULT_EXCLUDES,
     DEFAULT_IGNORE_NAMES,
+    DEFAULT_TESTS_EXCLUDES,
+    DEFAULT_TESTS_INCLUDES,
 )
 from cx_Freeze.module import ConstantsModule, Module
 
@@ -54,6 +65,8 @@ if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
     from importlib.abc import Loader
 
+    from cx_Freeze._cache import ArtifactCache
+    from cx_Freeze._metadata import DistributionCache, DistributionFiles
     from cx_Freeze._typing import (
         DeferredList,
         IncludesList,
@@ -63,6 +76,10 @@ if TYPE_CHECKING:
 
 ALL_SUFFIXES = SOURCE_SUFFIXES + BYTECODE_SUFFIXES + EXTENSION_SUFFIXES
 
+# The modules run at startup, before the runtime modules are importable
+BOOTSTRAP_NAMES = frozenset({"__startup__", "BUILD_CONSTANTS"})
+BOOTSTRAP_PREFIXES = ("__init__", "_cx_freeze_")
+
 
 __all__ = ["ModuleFinder"]
 
@@ -79,17 +96,43 @@ class ModuleFinder:
         excludes: list[str] | None = None,
         include_files: IncludesList | None = None,
         optimize: int = 0,
+        optimize_packages: Sequence[tuple[str, int]] | None = None,
+        lazy_imports: Sequence[str] | None = None,
+        prune_platform_branches: Sequence[str] | None = None,
+        strip_platform_branches: Sequence[str] | None = None,
+        exclude_tests: Sequence[str] | None = None,
+        include_tests: Sequence[str] | None = None,
+        needed_libs_only: bool = False,
         path: list[StrPath] | None = None,
         replace_paths: list[tuple[str, str]] | None = None,
         zip_exclude_packages: Sequence[str] | None = None,
         zip_include_packages: Sequence[str] | None = None,
         zip_include_all_packages: bool = False,
         zip_includes: IncludesList | None = None,
+        artifact_cache: ArtifactCache | None = None,
     ) -> None:
         self.included_files: InternalIncludesList = process_path_specs(
             include_files
         )
         self.optimize = optimize
+        self.optimize_packages: list[tuple[str, int]] = list(
+            optimize_packages or []
+        )
+        self.lazy_imports: list[str] = list(lazy_imports or [])
+        self.prune_platform_branches: list[str] = list(
+            prune_platform_branches or []
+        )
+        self.strip_platform_branches: list[str] = list(
+            strip_platform_branches or []
+        )
+        if exclude_tests is None:
+            exclude_tests = DEFAULT_TESTS_EXCLUDES
+        self.exclude_tests: set[str] = set(exclude_tests)
+        self.include_tests: list[str] = [
+            *DEFAULT_TESTS_INCLUDES,
+            *(include_tests or []),
+        ]
+        self.needed_libs_only: bool = needed_libs_only
         self.path: list[str] = [os.path.normpath(p) for p in path or sys.path]
         self.replace_paths: list[tuple[str, str]] = replace_paths or []
         self.zip_include_all_packages: bool = zip_include_all_packages
@@ -99,6 +142,7 @@ class ModuleFinder:
         self.zip_includes: InternalIncludesList = process_path_specs(
             zip_includes
         )
+        self.artifact_cache: ArtifactCache | None = artifact_cache
         self.namespaces: list[Module] = []
         self.aliases: dict[str, str] = {}
         self.excluded_dependent_files: set[Path] = set()
@@ -109,7 +153,16 @@ class ModuleFinder:
         )
         self._tmp_dir = TemporaryDirectory(prefix="cxfreeze-")
         self.cache_path = Path(self._tmp_dir.name)
+        self.stub_cache = StubCache(Module.get_imports_from_source)
+        # metadata files and index of the files of the distributions, by
+        # dist-info directory name
+        self.dist_metadata: dict[str, dict[str, bytes]] = {}
+        self.dist_files: dict[str, DistributionFiles] = {}
+        self._tests_excluded: set[str] = set()
+        self._tests_packages: set[str] = set()
         self.lib_files: dict[Path, str] = {}
+        # dynamic libraries distributed along with the packages
+        self.package_lib_files: set[Path] = set()
 
     def cleanup(self) -> None:
         self._tmp_dir.cleanup()
@@ -152,6 +205,8 @@ class ModuleFinder:
                 and root_name not in sys.stdlib_module_names
             ):
                 module.update_distribution()
+                if module.distribution is not None:
+                    self._exclude_tests(module.distribution)
         return module
 
     def _determine_parent(self, caller: Module | None) -> Module | None:
@@ -193,6 +248,76 @@ class ModuleFinder:
             return self._modules[parent_name]
         return None
 
+    def _exclude_tests(self, distribution: DistributionCache) -> None:
+        """Exclude the test suites of the distribution package.
+
+        The subpackages and modules are found using the index of the files
+        of the distribution, once for each distribution.
+        """
+        if (
+            not self.exclude_tests
+            or distribution.distinfo_name in self._tests_excluded
+        ):
+            return
+        self._tests_excluded.add(distribution.distinfo_name)
+        index = distribution.file_index
+        excludes = set()
+        for files in (
+            index.source,
+            index.bytecode,
+            index.extension,
+            index.tests,
+        ):
+            for file in files:
+                dirname, _, filename = file.rpartition("/")
+                parts = [*dirname.split("/"), filename.partition(".")[0]]
+                name = self._tests_package(parts)
+                if name:
+                    excludes.add(name)
+        for name in excludes:
+            if name in self._modules or package_matches(
+                name, self.include_tests
+            ):
+                continue
+            logger.debug("Excluding the tests [%s]", name)
+            self.exclude_module(name)
+            self._tests_packages.add(name)
+
+    def _include_imported_tests(
+        self, name: str, caller: Module | None
+    ) -> None:
+        """Include the test package imported by a module that is not a test.
+
+        Some packages import their own testing subpackage at runtime (like
+        "from pandas import testing"), so it is excluded only while no other
+        module imports it.
+        """
+        if not self._tests_packages or caller is None:
+            return
+        if self._tests_package(caller.name.split(".")):
+            return
+        parts = name.split(".")
+        for i in range(2, len(parts) + 1):
+            package_name = ".".join(parts[:i])
+            if package_name in self._tests_packages:
+                logger.debug(
+                    "Including the tests [%s] imported by [%s]",
+                    package_name,
+                    caller.name,
+                )
+                self._tests_packages.discard(package_name)
+                if self._modules.get(package_name, False) is None:
+                    del self._modules[package_name]
+
+    def _tests_package(self, parts: list[str]) -> str | None:
+        """Return the name of the test package that contains the module."""
+        for i, part in enumerate(parts):
+            if not part.isidentifier():
+                break
+            if i > 0 and part in self.exclude_tests:
+                return ".".join(parts[: i + 1])
+        return None
+
     def _import_all_sub_modules(
         self,
         module: Module,
@@ -274,6 +399,7 @@ class ModuleFinder:
         """
         # absolute import: search only by the given name.
         if relative_import_index == 0:
+            self._include_imported_tests(name, caller)
             module = self._internal_import_module(name, deferred_imports)
 
         # old style relative import (regular 'import foo' in Python 2)
@@ -308,6 +434,7 @@ class ModuleFinder:
                 module = parent
             else:
                 name = f"{parent.name}.{name}"
+                self._include_imported_tests(name, caller)
                 module = self._internal_import_module(name, deferred_imports)
 
         else:
@@ -480,21 +607,40 @@ class ModuleFinder:
             logger.debug("Adding module [%s] [EXTENSION]", name)
         elif isinstance(loader, (SourceFileLoader, SourcelessFileLoader)):
             filename = loader.get_filename(name)
+            optimize = self.optimize_level(name)
+            # the bootstrap and runtime modules cannot import lazily
+            lazy = not (
+                name in BOOTSTRAP_NAMES or name.startswith(BOOTSTRAP_PREFIXES)
+            ) and package_matches(name, self.lazy_imports)
+            strip = package_matches(name, self.strip_platform_branches)
             try:
-                if (
-                    isinstance(loader, SourcelessFileLoader)
-                    or self.optimize == sys.flags.optimize
+                if isinstance(loader, SourcelessFileLoader) or (
+                    optimize == sys.flags.optimize and not (lazy or strip)
                 ):
                     # Load Python bytecode
                     logger.debug("Adding module [%s] [BYTECODE]", name)
                     module.code = loader.get_code(name)
+                elif lazy or strip:
+                    # Compile Python source code with transformations
+                    logger.debug("Adding module [%s] [TRANSFORM]", name)
+                    module.code = self._compile_source(
+                        loader,
+                        name,
+                        filename,
+                        optimize,
+                        lazy_imports=lazy,
+                        platform_branches=strip,
+                    )
                 else:
-                    # Load & compile Python source code
-                    logger.debug("Adding module [%s] [SOURCE]", name)
-                    source = loader.get_source(name)
-                    if source is not None:
-                        module.code = loader.source_to_code(
-                            source, filename, _optimize=self.optimize
+                    # Load Python bytecode from a valid __pycache__ file
+                    # or compile Python source code
+                    module.code = self._load_cached_code(filename, optimize)
+                    if module.code is not None:
+                        logger.debug("Adding module [%s] [CACHED]", name)
+                    else:
+                        logger.debug("Adding module [%s] [SOURCE]", name)
+                        module.code = self._compile_source(
+                            loader, name, filename, optimize
                         )
             except ImportError as exc:
                 module.error_exc = exc
@@ -531,7 +677,7 @@ class ModuleFinder:
             module.code = self._replace_paths_in_code(module)
 
         # Scan the module code for import statements
-        self._scan_code(module, deferred_imports)
+        self._scan_code(module, deferred_imports, self._pruned_code(module))
         if module.code is None and module.stub_code is not None:
             self._scan_code(module, deferred_imports, code=module.stub_code)
         # using lazy loader
@@ -541,6 +687,109 @@ class ModuleFinder:
         module.in_import = False
         return True
 
+    def _compile_source(
+        self,
+        loader: SourceFileLoader,
+        name: str,
+        filename: str,
+        optimize: int,
+        *,
+        lazy_imports: bool = False,
+        platform_branches: bool = False,
+    ) -> CodeType | None:
+        """Compile the source of a module, using the artifact cache.
+
+        The code is cached using the source, the filename and the
+        transformations as the key.
+        """
+        source = loader.get_source(name)
+        if source is None:
+            return None
+        cache = self.artifact_cache
+        key = None
+        if cache is not None:
+            key = cache.key(
+                "code",
+                source,
+                filename,
+                str(optimize),
+                "lazy_imports" if lazy_imports else "",
+                f"{sys.platform} {os.name}" if platform_branches else "",
+            )
+            data = cache.get(key)
+            if data is not None:
+                with suppress(EOFError, ValueError, TypeError):
+                    code = marshal.loads(data)  # noqa: S302
+                    if isinstance(code, CodeType):
+                        return code
+        if lazy_imports or platform_branches:
+            code = compile_source(
+                source,
+                filename,
+                optimize,
+                lazy_imports=lazy_imports,
+                platform_branches=platform_branches,
+            )
+        else:
+            code = loader.source_to_code(source, filename, _optimize=optimize)
+        if key is not None:
+            cache.put(key, marshal.dumps(code))
+        return code
+
+    def _pruned_code(self, module: Module) -> CodeType | None:
+        """Return the code to scan for imports without the dead branches.
+
+        This applies to the modules selected by prune_platform_branches, to
+        not follow the imports of the branches that are dead on the current
+        platform, while the frozen code is kept as it is.
+        """
+        name = module.name
+        loader = module.loader
+        if (
+            module.code is None
+            or module.hook is not None
+            or not isinstance(loader, SourceFileLoader)
+            or not package_matches(name, self.prune_platform_branches)
+            or package_matches(name, self.strip_platform_branches)
+        ):
+            return None
+        try:
+            source = loader.get_source(name)
+            filename = loader.get_filename(name)
+            return compile_source(source, filename, 0, platform_branches=True)
+        except (ImportError, SyntaxError):
+            return None
+
+    @staticmethod
+    def _load_cached_code(filename: str, optimize: int) -> CodeType | None:
+        """Load the code object from the bytecode cache of a source file.
+
+        The cached file (like those created by pip or uv at install time) is
+        used only if it matches the optimization level and the source file,
+        checking its timestamp and size, or its hash.
+        """
+        source_path = Path(filename)
+        try:
+            cached = cache_from_source(filename, optimization=optimize or "")
+            data = Path(cached).read_bytes()
+            flags = int.from_bytes(data[4:8], "little")
+            if len(data) < 16 or data[:4] != MAGIC_NUMBER or flags & ~0b11:
+                valid = False
+            elif flags & 0b01:  # hash-based pyc
+                valid = data[8:16] == source_hash(source_path.read_bytes())
+            else:
+                source_stat = source_path.stat()
+                mtime = int(source_stat.st_mtime) & 0xFFFF_FFFF
+                size = source_stat.st_size & 0xFFFF_FFFF
+                valid = data[8:16] == struct.pack("<LL", mtime, size)
+            code = marshal.loads(data[16:]) if valid else None  # noqa: S302
+        except (NotImplementedError, OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(code, CodeType):
+            return None
+        _imp._fix_co_filename(code, filename)  # noqa: SLF001
+        return code
+
     def _load_module_code_builtins(
         self, module: Module, deferred_imports: DeferredList
     ) -> Module | None:
@@ -557,8 +806,10 @@ class ModuleFinder:
         if module is module.root:
             for source, target in module.libs():
                 self.lib_files.setdefault(source, target)
-                # use include_files on windows
-                if IS_WINDOWS:
+                self.package_lib_files.add(source)
+                # use include_files on windows, unless the libraries are
+                # copied only as dependencies of the extension modules
+                if IS_WINDOWS and not self.needed_libs_only:
                     self.include_files(source, target)
             if IS_WINDOWS and module.in_file_system == 0:
                 # Save the directory "module.libs" to be used in __startup__
@@ -858,6 +1109,9 @@ class ModuleFinder:
         # trying to import it, because includes has priority over excludes.
         if self._modules.get(name) is None:
             self._modules.pop(name, None)
+        tests_package = self._tests_package(name.split("."))
+        if tests_package:
+            self.include_tests.append(tests_package)
         # Include the module.
         deferred_imports: DeferredList = []
         module = self._import_module(name, deferred_imports, caller)
@@ -875,6 +1129,9 @@ class ModuleFinder:
         # trying to import it, because includes has priority over excludes.
         if self._modules.get(name) is None:
             self._modules.pop(name, None)
+        tests_package = self._tests_package(name.split("."))
+        if tests_package:
+            self.include_tests.append(tests_package)
         # Include the package.
         deferred_imports: DeferredList = []
         module = self._import_module(name, deferred_imports, caller)
@@ -904,6 +1161,26 @@ class ModuleFinder:
         valid_modules -= builtin
         return sorted(valid_modules, key=lambda module: module.name)
 
+    def modules_in_import_order(
+        self, startup: Mapping[str, int] | None = None
+    ) -> list[Module]:
+        """List of modules expected in the frozen executable, by import order.
+
+        The startup modules come first, ordered by their position, and then
+        the other modules, in the order they were found while scanning the
+        imports of the included modules.
+        """
+        startup = startup or {}
+        found = {name: index for index, name in enumerate(self._modules)}
+        return sorted(
+            self.modules,
+            key=lambda module: (
+                (0, startup[module.name])
+                if module.name in startup
+                else (1, found.get(module.name, len(found)))
+            ),
+        )
+
     @property
     def optimize(self) -> int:
         """Value of optimize flag propagated according to the user's choice."""
@@ -914,6 +1191,23 @@ class ModuleFinder:
         # The value of optimize is checked in '.command.build_exe' or '.cli'.
         self._optimize_flag = value if 0 <= value <= 2 else sys.flags.optimize
 
+    def optimize_level(self, name: str) -> int:
+        """Return the optimization level used to compile the named module.
+
+        The last package glob of optimize_packages that matches the name
+        takes precedence over the global optimize flag.
+        """
+        optimize = self.optimize
+        for pattern, value in self.optimize_packages:
+            if package_matches(name, [pattern]):
+                optimize = value
+        return optimize
+
+    @property
+    def missing_modules(self) -> list[str]:
+        """The names of the modules that weren't found."""
+        return sorted(self._bad_modules)
+
     def report_missing_modules(self) -> None:
         """Display a list of modules that weren't found."""
         if self._bad_modules:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import marshal
 import os
 import shutil
@@ -11,16 +12,21 @@ import sys
 import sysconfig
 import time
 from abc import abstractmethod
-from contextlib import suppress
-from functools import cached_property
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing, suppress
+from functools import cached_property, partial
+from importlib import resources
+from importlib.metadata import version
 from importlib.util import MAGIC_NUMBER
-from pathlib import Path
+from pathlib import Path, PurePath
 from pkgutil import resolve_name
 from typing import TYPE_CHECKING, Any, cast
-from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
 from setuptools import Distribution
 
+from cx_Freeze._bytecode import code_object_strip
+from cx_Freeze._cache import ArtifactCache, parse_size
 from cx_Freeze._compat import (
     ABI_THREAD,
     BUILD_EXE_DIR,
@@ -31,16 +37,37 @@ from cx_Freeze._compat import (
     IS_WINDOWS,
     PYTHON_VERSION,
 )
+from cx_Freeze._copy import COPY_MODES, copy_file, dedup_files, is_linked
 from cx_Freeze._license import frozen_license
-from cx_Freeze._metadata import DistributionCache
-from cx_Freeze.common import process_path_specs, resource_path
+from cx_Freeze._manifest import BuildManifest, remove_directory
+from cx_Freeze._metadata import DistributionCache, DistributionFiles
+from cx_Freeze._transform import LAZY_IMPORT_MODULE, LAZY_IMPORT_NATIVE
+from cx_Freeze._writer import (
+    COMPRESS_BEST,
+    COMPRESS_STORED,
+    LAYER_IMPORT_MODULE,
+    SPLIT_IMPORT_MODULE,
+    ZSTD_IMPORT_MODULE,
+    DirectoryWriter,
+    LayeredZipWriter,
+    ModuleWriter,
+    SplitZipWriter,
+    ZipWriter,
+    ZstdWriter,
+    zstd_backend,
+)
+from cx_Freeze.common import (
+    package_matches,
+    process_path_specs,
+    resource_path,
+)
 from cx_Freeze.dep_parser import ELFParser, Parser, PEParser
 from cx_Freeze.exception import OptionError
 from cx_Freeze.finder import ModuleFinder
 from cx_Freeze.module import ConstantsModule, Module
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Sequence
 
     from cx_Freeze._typing import IncludesList, InternalIncludesList, StrPath
     from cx_Freeze.executable import Executable
@@ -87,6 +114,66 @@ have full write access to built executable.
 """
 
 
+# Categories of the files of a distribution (see DistributionFiles) used to
+# find the files of a package, and the ones that are copied as package data
+_PACKAGE_DATA_CATEGORIES = (
+    "source",
+    "bytecode",
+    "stub",
+    "extension",
+    "shared_library",
+    "data",
+    "docs",
+    "tests",
+)
+_PACKAGE_DATA_COPY = frozenset(
+    {"extension", "shared_library", "data", "docs", "tests"}
+)
+_PACKAGE_DATA_IGNORE_SUFFIXES = (
+    ".c",
+    ".cpp",
+    ".pxd",  # cython declaration file
+    ".pxi",  # cython include file
+    ".py",
+    ".pyc",
+    ".pyi",  # python stub files
+    ".pyo",
+    ".pyx",  # cython source
+)
+_PACKAGE_DATA_IGNORE_NAMES = frozenset(
+    {"py.typed"} if IS_MACOS else {"py.typed", ".DS_store"}
+)
+
+
+# Number of threads used to copy the files
+COPY_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Name of the executable shared by the executables, with multicall
+MULTICALL_NAME = "multicall"
+
+
+def _ignore_package_data(name: str) -> bool:
+    """Return True for a relative file name that is not package data."""
+    base_name = name.rpartition("/")[2]
+    return (
+        base_name.endswith(_PACKAGE_DATA_IGNORE_SUFFIXES)
+        or base_name in _PACKAGE_DATA_IGNORE_NAMES
+        or "/__pycache__/" in f"/{name}"
+    )
+
+
+def _is_dependency(module: Module) -> bool:
+    """Return True for a module of the standard library or a distribution.
+
+    The distributions installed from a local directory or file (an editable
+    install of the application, for instance) are not dependencies.
+    """
+    distribution = module.distribution or module.root.distribution
+    if distribution is not None:
+        return not distribution.is_local
+    return module.root.name in sys.stdlib_module_names
+
+
 class Freezer:
     """Freezer base class."""
 
@@ -110,8 +197,26 @@ class Freezer:
         excludes: list[str] | None = None,
         packages: list[str] | None = None,
         replace_paths: list[tuple[str, str]] | None = None,
-        compress: bool | None = True,
+        compress: bool | str | None = True,
+        zip_stored_packages: Sequence[str] | None = None,
+        import_trace: StrPath | None = None,
+        import_order: bool = False,
+        split_archive: bool = False,
+        layered_archive: bool = False,
         optimize: int = 0,
+        optimize_packages: Mapping[str, int] | Sequence[str] | None = None,
+        lazy_imports: Sequence[str] | None = None,
+        prune_platform_branches: Sequence[str] | None = None,
+        strip_platform_branches: Sequence[str] | None = None,
+        exclude_tests: Sequence[str] | None = None,
+        include_tests: Sequence[str] | None = None,
+        needed_libs_only: bool = False,
+        incremental: bool = False,
+        copy_mode: str = "copy",
+        dedup_files: bool = False,
+        multicall: bool = False,
+        artifact_cache: StrPath | bool | None = None,
+        artifact_cache_size: int | str | None = None,
         path: list[StrPath] | None = None,
         target_dir: StrPath | None = None,
         bin_includes: list[str] | None = None,
@@ -127,6 +232,10 @@ class Freezer:
         zip_include_packages: Sequence[str] | None = None,
         zip_exclude_packages: Sequence[str] | None = None,
         zip_filename: StrPath | None = None,
+        strip_docstrings: Sequence[str] | None = None,
+        strip_annotations: Sequence[str] | None = None,
+        strip_debug_ranges: Sequence[str] | None = None,
+        package_data_from_record: bool = False,
     ) -> None:
         executables = self._validate_executables(executables)
         self.executables: list[Executable] = executables
@@ -140,12 +249,39 @@ class Freezer:
         self.excludes: list[str] = list(excludes or [])
         self.packages: set[str] = set(packages or [])
         self.replace_paths: list[tuple[str, str]] = list(replace_paths or [])
-        self.compress: bool = True if compress is None else compress
+        self.compress: bool | str = self._validate_compress(compress)
+        self.zip_stored_packages: list[str] = list(zip_stored_packages or [])
+        self.import_trace: dict[str, int] = self._load_import_trace(
+            import_trace
+        )
+        self.import_order: bool = import_order
         self.optimize: int = int(optimize or 0)
+        self.optimize_packages: list[tuple[str, int]] = (
+            self._validate_optimize_packages(optimize_packages)
+        )
+        self.lazy_imports: list[str] = list(lazy_imports or [])
+        self.prune_platform_branches: list[str] = list(
+            prune_platform_branches or []
+        )
+        self.strip_platform_branches: list[str] = list(
+            strip_platform_branches or []
+        )
+        self.exclude_tests: list[str] | None = (
+            None if exclude_tests is None else list(exclude_tests)
+        )
+        self.include_tests: list[str] = list(include_tests or [])
+        self.needed_libs_only: bool = bool(needed_libs_only)
         self.path: list[str] = self._validate_path(path)
         # include-msvcr is used on Windows and some MSYS2 environments
         self.include_msvcr: bool = IS_UCRT and bool(include_msvcr)
         self.include_msvcr_version: str | None = include_msvcr_version
+        self.incremental: bool = bool(incremental)
+        self.copy_mode: str = self._validate_copy_mode(copy_mode)
+        self.dedup_files: bool = bool(dedup_files)
+        self.multicall: bool = self._validate_multicall(multicall, executables)
+        self.artifact_cache: ArtifactCache | None = (
+            self._validate_artifact_cache(artifact_cache, artifact_cache_size)
+        )
         self.target_dir = target_dir
         self.default_bin_includes: list[str] = self._default_bin_includes()
         self.default_bin_excludes: list[str] = self._default_bin_excludes()
@@ -183,9 +319,24 @@ class Freezer:
         if zip_filename:
             zip_filename = Path(zip_filename).with_suffix(".zip").name
             self.zip_filename = self.target_dir / "lib" / zip_filename
+        self.split_archive: bool = self._validate_split_archive(
+            split_archive, self.zip_filename, self.compress
+        )
+        self.layered_archive: bool = self._validate_layered_archive(
+            layered_archive, self.zip_filename, self.compress, split_archive
+        )
+
+        self.strip_docstrings: list[str] = list(strip_docstrings or [])
+        self.strip_annotations: list[str] = list(strip_annotations or [])
+        self.strip_debug_ranges: list[str] = list(strip_debug_ranges or [])
+        self.bytecode_saved: dict[str, int] = {}
+        self.package_data_from_record: bool = bool(package_data_from_record)
 
         self._symlinks: set[tuple[Path, Path, bool]] = set()
+        self._copy_pool: ThreadPoolExecutor | None = None
+        self._copy_jobs: list[Future] = []
         self.files_copied: set[Path] = set()
+        self.source_files: set[Path] = set()
         self._warnings: dict[str, bool] = {}
         self._check_installation()
         self.finder: ModuleFinder = self._get_module_finder()
@@ -203,13 +354,20 @@ class Freezer:
         if os.fspath(path) in self.path:
             msg = "the build_exe directory cannot be used as search path"
             raise OptionError(msg)
-        if path.is_dir():
-            # starts in a clean directory
+        # an incremental build keeps the files of the previous build
+        manifest = BuildManifest(path) if self.incremental else None
+        if path.is_dir() and not (manifest and manifest.previous):
+            # starts in a clean directory, without waiting for the deletion
+            # of the files in an incremental build
             try:
-                shutil.rmtree(path)
+                if manifest is None:
+                    shutil.rmtree(path)
+                else:
+                    remove_directory(path)
             except OSError:
                 msg = "the build_exe directory cannot be cleaned"
                 raise OptionError(msg) from None
+        self._manifest: BuildManifest | None = manifest
         self._targetdir: Path = path
 
     def _add_license(self) -> None:
@@ -248,6 +406,7 @@ class Freezer:
     ) -> None:
         if not self._should_copy_file(source):
             return
+        self.source_files.add(source)
 
         # handle pre-copy tasks, normally on the target path
         source, target = self._pre_copy_hook(source, target)
@@ -256,10 +415,51 @@ class Freezer:
             return
         if source == target:
             return
+        manifest = self._manifest
+        if manifest is not None and not include_mode:
+            manifest.add_copy(source, target)
+            # a binary linked by dedup_files is patched in its own copy
+            if manifest.is_copied(source, target) and not (
+                self._is_binary(source) and is_linked(target)
+            ):
+                # the file is up to date, but its dependencies are checked
+                self.files_copied.add(target)
+                self._post_copy_hook(source, target, copy_dependent_files)
+                return
         self._create_directory(target.parent)
         if self.silent < 1:
             print(f"copying {source} -> {target}")
-        shutil.copyfile(source, target)
+        if self._copy_pool is None or include_mode or self._is_binary(source):
+            # binaries are copied at once, because they can be patched
+            # after their dependencies are copied
+            self._copy_file_data(source, target, include_mode, private=True)
+        else:
+            self._copy_jobs.append(
+                self._copy_pool.submit(
+                    self._copy_file_data, source, target, include_mode
+                )
+            )
+        if manifest is not None and include_mode:
+            manifest.add_file(target)
+        self.files_copied.add(target)
+
+        # handle post-copy tasks, including copying dependencies
+        self._post_copy_hook(source, target, copy_dependent_files)
+
+    def _copy_file_data(
+        self,
+        source: Path,
+        target: Path,
+        include_mode: bool,
+        private: bool = False,
+    ) -> None:
+        """Copy the data and the metadata of a file.
+
+        A private copy is made of the files that are modified afterwards,
+        whatever the copy mode.
+        """
+        if copy_file(source, target, self.copy_mode, private=private):
+            return  # a link shares the metadata of the source
         if include_mode:
             shutil.copymode(source, target)
             shutil.copystat(source, target)
@@ -269,30 +469,33 @@ class Freezer:
             except OSError:
                 if self.silent < 3:
                     print("WARNING: unable to copy file metadata:", target)
-        self.files_copied.add(target)
 
-        # handle post-copy tasks, including copying dependencies
-        self._post_copy_hook(source, target, copy_dependent_files)
+    def _wait_for_copies(self) -> None:
+        """Wait for the files copied by the pool of threads, and stop it.
+
+        The errors of the copies are raised here.
+        """
+        pool = self._copy_pool
+        if pool is None:
+            return
+        self._copy_pool = None
+        jobs = self._copy_jobs
+        self._copy_jobs = []
+        try:
+            for job in jobs:
+                job.result()
+        finally:
+            pool.shutdown(cancel_futures=True)
 
     def _copy_package_data(self, module: Module, target_dir: Path) -> None:
         """Copy any non-Python files to the target directory."""
         if module.file is None:
             return
         ignore_patterns = [
-            "*.c",
-            "*.cpp",
-            "*.pxd",  # cython declaration file
-            "*.pxi",  # cython include file
-            "*.py",
-            "*.pyc",
-            "*.pyi",  # python stub files
-            "*.pyo",
-            "*.pyx",  # cython source
+            *(f"*{suffix}" for suffix in _PACKAGE_DATA_IGNORE_SUFFIXES),
+            *_PACKAGE_DATA_IGNORE_NAMES,
             "__pycache__",
-            "py.typed",
         ]
-        if not IS_MACOS:
-            ignore_patterns.append(".DS_store")
 
         def copy_tree(
             source_dir: Path, target_dir: Path, excludes: set[str]
@@ -314,7 +517,11 @@ class Freezer:
                         if m.startswith(f"{source_dir.name}.{source_name}")
                     }
                     copy_tree(source, target, excludes_sub)
-                else:
+                elif not (
+                    self.needed_libs_only
+                    and DistributionFiles.classify(PurePath(source_name))
+                    == "shared_library"
+                ):
                     self._copy_file(source, target, copy_dependent_files=True)
 
         source_dir = module.file.parent
@@ -325,8 +532,54 @@ class Freezer:
         excludes = set()
         for exclude in self.finder.excluded_submodules(module_name):
             excludes.add(exclude.removeprefix(module_name))
+        if self.package_data_from_record and self._copy_package_data_record(
+            module, target_dir, excludes
+        ):
+            return
         copy_tree(source_dir, target_dir, excludes)
 
+    def _copy_package_data_record(
+        self, module: Module, target_dir: Path, excludes: set[str]
+    ) -> bool:
+        """Copy the non-Python files of a package listed in the RECORD.
+
+        The files are filtered by their category in the distribution index.
+        Returns False when the package files are not listed, so the package
+        directory should be walked instead.
+        """
+        distribution = module.distribution
+        if distribution is None or module.file is None:
+            return False
+        index = distribution.file_index
+        prefix = module.file.parent.resolve().as_posix() + "/"
+        # do not copy the subfolders which belong to excluded modules
+        excludes_dir = tuple(
+            exclude.lstrip(".").replace(".", "/") + "/" for exclude in excludes
+        )
+        found = False
+        files: list[tuple[Path, str]] = []
+        for category in _PACKAGE_DATA_CATEGORIES:
+            for source in getattr(index, category).values():
+                source_name = source.as_posix()
+                if not source_name.startswith(prefix):
+                    continue
+                found = True
+                if category not in _PACKAGE_DATA_COPY or (
+                    category == "shared_library" and self.needed_libs_only
+                ):
+                    continue
+                name = source_name[len(prefix) :]
+                if name.startswith(excludes_dir) or _ignore_package_data(name):
+                    continue
+                files.append((source, name))
+        if not found:
+            return False
+        self._create_directory(target_dir)
+        for source, name in files:
+            target = target_dir / name
+            self._copy_file(source, target, copy_dependent_files=True)
+        return True
+
     def _pre_copy_hook(self, source: Path, target: Path) -> tuple[Path, Path]:
         """Prepare the source and target paths.
 
@@ -367,17 +620,45 @@ class Freezer:
 
         # copy the executable and its dependencies
         target_path = self.target_dir / exe.target_name
-        self._get_top_dependencies(exe.base)
+        if self.multicall:
+            # a link to the shared executable, created after the copies
+            if target_path.exists() and not target_path.is_symlink():
+                target_path.unlink()  # copied by a previous build
+            self._symlinks.add((target_path, Path(MULTICALL_NAME), False))
+        else:
+            self._copy_base(exe.base, target_path)
+
+        # Add license and resources like version metadata and icon
+        self._add_license()
+        self._add_resources(exe)
+
+    def _freeze_multicall(self) -> None:
+        """Copy the executable shared by the executables, with multicall."""
+        runtime = resources.files("cx_Freeze.runtime") / "multicall.py"
+        self.finder.include_file_as_module(
+            str(runtime), f"__init__{MULTICALL_NAME}"
+        )
+        self._copy_base(
+            self.executables[0].base, self.target_dir / MULTICALL_NAME
+        )
+
+    def _copy_base(self, base: Path, target_path: Path) -> None:
+        """Copy the base of an executable and its dependencies."""
+        self._get_top_dependencies(base)
         self._copy_file(
-            exe.base, target_path, copy_dependent_files=True, include_mode=True
+            base, target_path, copy_dependent_files=True, include_mode=True
         )
         if not os.access(target_path, os.W_OK):
             mode = target_path.stat().st_mode
             target_path.chmod(mode | stat.S_IWUSR)
 
-        # Add license and resources like version metadata and icon
-        self._add_license()
-        self._add_resources(exe)
+    @property
+    def _init_module_names(self) -> list[str]:
+        """The names of the init modules run by the startup script."""
+        names = [exe.init_module_name for exe in self.executables]
+        if self.multicall:
+            names.append(f"__init__{MULTICALL_NAME}")
+        return names
 
     @abstractmethod
     def _get_top_dependencies(self, source: StrPath) -> None:
@@ -437,17 +718,42 @@ class Freezer:
             excludes=self.excludes,
             include_files=self.include_files,
             optimize=self.optimize,
+            optimize_packages=self.optimize_packages,
+            lazy_imports=self.lazy_imports,
+            prune_platform_branches=self.prune_platform_branches,
+            strip_platform_branches=self.strip_platform_branches,
+            exclude_tests=self.exclude_tests,
+            include_tests=self.include_tests,
+            needed_libs_only=self.needed_libs_only,
             path=cast("list[StrPath]", self.path),
             replace_paths=self.replace_paths,
             zip_exclude_packages=self.zip_exclude_packages,
             zip_include_packages=self.zip_include_packages,
             zip_include_all_packages=self.zip_include_all_packages,
             zip_includes=self.zip_includes,
+            artifact_cache=self.artifact_cache,
         )
+        # Include the runtime module used by the rewritten lazy imports.
+        if self.lazy_imports and not LAZY_IMPORT_NATIVE:
+            runtime = resources.files("cx_Freeze.runtime") / "lazy_import.py"
+            finder.include_file_as_module(str(runtime), LAZY_IMPORT_MODULE)
         for name in self.includes:
             finder.include_module(name)
         for name in self.packages:
             finder.include_package(name)
+        # Include the runtime module that imports from the Zstandard archive.
+        if self.compress == "zstd":
+            runtime = resources.files("cx_Freeze.runtime") / "zstd_import.py"
+            finder.include_file_as_module(str(runtime), ZSTD_IMPORT_MODULE)
+            finder.include_module(zstd_backend()[1])
+        # Include the runtime module that imports from the cold zip file.
+        if self.split_archive:
+            runtime = resources.files("cx_Freeze.runtime") / "cold_import.py"
+            finder.include_file_as_module(str(runtime), SPLIT_IMPORT_MODULE)
+        # Include the runtime module that adds the dependencies to sys.path.
+        if self.layered_archive:
+            runtime = resources.files("cx_Freeze.runtime") / "layer_import.py"
+            finder.include_file_as_module(str(runtime), LAYER_IMPORT_MODULE)
         # Include modules required during initialization;
         # (using freeze-core 0.7.0+ it is frozen in the executable).
         if "encodings" not in finder.builtin_modules:
@@ -463,8 +769,12 @@ class Freezer:
         for target, symlink, symlink_is_directory in self._symlinks:
             if self.silent < 1:
                 print(f"linking {target} -> {symlink}")
+            if target.is_symlink() and target.readlink() != symlink:
+                target.unlink()  # changed since an incremental build
             if not target.exists():
                 target.symlink_to(symlink, symlink_is_directory)
+            if self._manifest is not None:
+                self._manifest.add_file(target)
 
     @staticmethod
     def _remove_version_numbers(filename: str) -> str:
@@ -570,6 +880,201 @@ class Freezer:
                 valid_path.pop(index)
         return valid_path
 
+    @staticmethod
+    def _validate_compress(compress: bool | str | None) -> bool | str:
+        """Return a valid compress value. Raises OptionError on failure."""
+        if compress is None:
+            return True
+        if not isinstance(compress, str):
+            return bool(compress)
+        if compress != "zstd":
+            msg = f"invalid compress value {compress!r}"
+            raise OptionError(msg)
+        if zstd_backend() is None:
+            msg = (
+                "compress='zstd' requires Python 3.14 or the zstandard package"
+            )
+            raise OptionError(msg)
+        return compress
+
+    @staticmethod
+    def _validate_artifact_cache(
+        artifact_cache: StrPath | bool | None,
+        artifact_cache_size: int | str | None,
+    ) -> ArtifactCache | None:
+        """Return the artifact cache, or None if it is not used.
+
+        Raises OptionError on failure.
+        """
+        if artifact_cache is None or artifact_cache is False:
+            return None
+        try:
+            max_size = (
+                None
+                if artifact_cache_size is None
+                else parse_size(artifact_cache_size)
+            )
+            return ArtifactCache(
+                None if artifact_cache is True else artifact_cache, max_size
+            )
+        except ValueError as exc:
+            msg = f"artifact_cache: {exc}"
+            raise OptionError(msg) from None
+
+    @staticmethod
+    def _validate_split_archive(
+        split_archive: bool, zip_filename: Path | None, compress: bool | str
+    ) -> bool:
+        """Return the split_archive value. Raises OptionError on failure."""
+        if not split_archive:
+            return False
+        if zip_filename is None:
+            msg = "split_archive requires a zip file"
+            raise OptionError(msg)
+        if compress == "zstd":
+            msg = "split_archive cannot be used with Zstandard compression"
+            raise OptionError(msg)
+        return True
+
+    @staticmethod
+    def _validate_layered_archive(
+        layered_archive: bool,
+        zip_filename: Path | None,
+        compress: bool | str,
+        split_archive: bool,
+    ) -> bool:
+        """Return the layered_archive value. Raises OptionError on failure."""
+        if not layered_archive:
+            return False
+        if zip_filename is None:
+            msg = "layered_archive requires a zip file"
+            raise OptionError(msg)
+        if compress == "zstd" or split_archive:
+            msg = (
+                "layered_archive cannot be used with Zstandard compression "
+                "or split_archive"
+            )
+            raise OptionError(msg)
+        return True
+
+    @staticmethod
+    def _load_import_trace(import_trace: StrPath | None) -> dict[str, int]:
+        """Return the modules of an import trace, by position of import.
+
+        The trace is a file with a module name per line, or the output of
+        'python -X importtime'. Raises OptionError on failure.
+        """
+        if not import_trace:
+            return {}
+        try:
+            lines = Path(import_trace).read_text(encoding="utf_8").splitlines()
+        except (OSError, UnicodeDecodeError) as exc:
+            msg = f"cannot read the import trace {import_trace!s}: {exc}"
+            raise OptionError(msg) from None
+        # importtime lists a module when its import is done, after the
+        # modules it imports, that are indented; rebuild the tree of imports
+        # to get the sequence in which the modules start to be imported
+        roots: list[tuple[int, str, list]] = []
+        for line in lines:
+            entry = line
+            if entry.startswith("import time:"):
+                entry = entry.rpartition("|")[2]
+            name = entry.strip()
+            if not name or not all(
+                part.isidentifier() for part in name.split(".")
+            ):
+                continue
+            depth = len(entry) - len(entry.lstrip())
+            children = []
+            while roots and roots[-1][0] > depth:
+                children.insert(0, roots.pop())
+            roots.append((depth, name, children))
+        names: dict[str, int] = {}
+        stack = roots[::-1]
+        while stack:
+            _, name, children = stack.pop()
+            names.setdefault(name, len(names))
+            stack.extend(children[::-1])
+        return names
+
+    def _get_compression(self, name: str) -> str | None:
+        """Return the compression of the module in the zip file.
+
+        Without zip_stored_packages, None is returned to use the compression
+        of the zip file, so the import trace can be used only to order the
+        modules. Otherwise, the modules that match zip_stored_packages and the
+        modules imported at startup, listed in the import trace, are stored,
+        and the others use the best compression.
+        """
+        if not self.zip_stored_packages:
+            return None
+        if name in self.import_trace or package_matches(
+            name, self.zip_stored_packages
+        ):
+            return COMPRESS_STORED
+        return COMPRESS_BEST
+
+    @staticmethod
+    def _validate_copy_mode(copy_mode: str | None) -> str:
+        """Return a valid copy mode. Raises OptionError on failure."""
+        if not copy_mode:
+            return "copy"
+        if copy_mode not in COPY_MODES:
+            msg = (
+                f"invalid copy_mode value {copy_mode!r} "
+                f"(expected one of {', '.join(COPY_MODES)})"
+            )
+            raise OptionError(msg)
+        return copy_mode
+
+    @staticmethod
+    def _validate_multicall(
+        multicall: bool, executables: list[Executable]
+    ) -> bool:
+        """Return a valid multicall flag. Raises OptionError on failure."""
+        if not multicall:
+            return False
+        if IS_WINDOWS or IS_MINGW:
+            msg = "multicall is not supported on Windows"
+            raise OptionError(msg)
+        if len({exe.base for exe in executables}) > 1:
+            msg = "multicall requires the executables to have the same base"
+            raise OptionError(msg)
+        if MULTICALL_NAME in {exe.target_name for exe in executables}:
+            msg = f"multicall reserves the executable name {MULTICALL_NAME!r}"
+            raise OptionError(msg)
+        return True
+
+    @staticmethod
+    def _validate_optimize_packages(
+        optimize_packages: Mapping[str, int] | Sequence[str] | None,
+    ) -> list[tuple[str, int]]:
+        """Return valid (package glob, optimization level) pairs.
+
+        Accepts a mapping or a list of strings in the form <glob>=<level>.
+        Raises OptionError on failure.
+        """
+        if not optimize_packages:
+            return []
+        if isinstance(optimize_packages, Mapping):
+            items = list(optimize_packages.items())
+        else:
+            items = [spec.rpartition("=")[::2] for spec in optimize_packages]
+        validated = []
+        for pattern, value in items:
+            try:
+                level = int(value)
+            except (TypeError, ValueError):
+                level = -1
+            if not pattern or level not in (0, 1, 2):
+                msg = (
+                    f"invalid optimize_packages value {pattern}={value} "
+                    "(expected <package>=<level>, with level 0, 1 or 2)"
+                )
+                raise OptionError(msg)
+            validated.append((pattern, level))
+        return validated
+
     @staticmethod
     def _validate_bin_file(
         filenames: Sequence[StrPath] | None,
@@ -638,6 +1143,30 @@ class Freezer:
         self.zip_exclude_packages = zip_exclude_packages
         self.zip_include_all_packages = zip_include_all_packages
 
+    def _strip_code(self, module: Module) -> None:
+        """Shrink the code object of the module before it is marshalled.
+
+        The transformations are selected per package by the strip_* options.
+        """
+        code = module.code
+        if code is None:
+            return
+        name = module.name
+        docstrings = package_matches(name, self.strip_docstrings)
+        annotations = package_matches(name, self.strip_annotations)
+        debug_ranges = package_matches(name, self.strip_debug_ranges)
+        if not (docstrings or annotations or debug_ranges):
+            return
+        module.code = code_object_strip(
+            code,
+            docstrings=docstrings,
+            annotations=annotations,
+            debug_ranges=debug_ranges,
+        )
+        saved = len(marshal.dumps(code)) - len(marshal.dumps(module.code))
+        if saved > 0:
+            self.bytecode_saved[name] = saved
+
     def _write_modules(self) -> None:
         filename: Path = self.target_dir / "lib" / "library.zip"
         finder: ModuleFinder = self.finder
@@ -662,14 +1191,59 @@ class Freezer:
         target_lib_dir = filename.parent
         self._create_directory(target_lib_dir)
 
-        # Prepare zip file
-        compress_type = ZIP_DEFLATED if self.compress else ZIP_STORED
-        with ZipFile(
-            filename, "w", compress_type, strict_timestamps=False
-        ) as outfile:
+        # Prepare the zip file (and the Zstandard archive), or write the
+        # modules straight to the file system when no zip file is requested
+        writer: ModuleWriter
+        if self.zip_filename is None:
+            writer = DirectoryWriter(
+                target_lib_dir,
+                self._write_file,
+                partial(self._copy_file, copy_dependent_files=False),
+            )
+        elif self.compress == "zstd":
+            writer = ZstdWriter(
+                filename,
+                self._zstd_archive,
+                self._init_module_names,
+                self.import_trace if self.import_order else (),
+            )
+        elif self.split_archive:
+            # the hot zip file holds the modules imported at startup
+            writer = SplitZipWriter(
+                filename,
+                self._cold_archive,
+                bool(self.compress),
+                self._init_module_names,
+                [
+                    *self.import_trace,
+                    *(exe.main_module_name for exe in self.executables),
+                ],
+            )
+        elif self.layered_archive:
+            # the dependencies are in their own zip file, that is named by
+            # their versions and reused while they do not change
+            deps_modules = [
+                module for module in finder.modules if _is_dependency(module)
+            ]
+            writer = LayeredZipWriter(
+                filename,
+                self._deps_archive(deps_modules),
+                bool(self.compress),
+                self._init_module_names,
+                [module.name for module in deps_modules],
+            )
+        else:
+            writer = ZipWriter(filename, bool(self.compress))
+        with closing(writer):
             files_to_copy: list[tuple[Module, Path]] = []
 
-            for module in finder.modules:
+            # the modules imported at startup are written first, so they are
+            # read with few seeks, and the Zstandard archive can be read ahead
+            if self.import_order:
+                modules = finder.modules_in_import_order(self.import_trace)
+            else:
+                modules = finder.modules
+            for module in modules:
                 # determine if the module should be written to the file system;
                 # a number of packages make the assumption that files that they
                 # require will be found in a location relative to where they
@@ -693,11 +1267,14 @@ class Freezer:
                         # so for now create the directory for this package
                         self._create_directory(target_package_dir)
 
-                    elif not target_package_dir.exists():
+                    elif (
+                        self._manifest is not None
+                        or not target_package_dir.exists()
+                    ):
                         # whether the package and its data will be written to
                         # the file system, any non-Python files are copied at
                         # this point if the target directory does not already
-                        # exist
+                        # exist (or exists from the previous incremental build)
                         self._copy_package_data(module, target_package_dir)
 
                 # if an extension module is found in a package that is to be
@@ -734,6 +1311,7 @@ class Freezer:
                 # determining if the file is up to date so we can safely set
                 # this value to zero
                 if module.code is not None:
+                    self._strip_code(module)
                     if module.file is not None and module.file.exists():
                         file_stat = module.file.stat()
                         mtime = int(file_stat.st_mtime) & 0xFFFF_FFFF
@@ -762,27 +1340,24 @@ class Freezer:
                             parts.append("__init__")
                         target_name = target_lib_dir.joinpath(*parts)
                         target_name = target_name.with_suffix(".pyc")
-                        self._create_directory(target_name.parent)
-                        target_name.write_bytes(data)
+                        self._write_file(target_name, data)
 
                 # otherwise, write to the zip file
                 elif module.code is not None:
-                    zip_time = time.localtime(mtime)[:6]
-                    if zip_time[0] < 1980:
-                        zip_time = (1980, 1, 1, 0, 0, 0)
                     target_name = "/".join(mod_name_parts)
                     if module.path:
                         target_name += "/__init__"
-                    zinfo = ZipInfo(target_name + ".pyc", zip_time)
-                    zinfo.compress_type = compress_type
-                    outfile.writestr(zinfo, data)
+                    writer.write_data(
+                        f"{target_name}.pyc",
+                        data,
+                        mtime,
+                        self._get_compression(mod_name),
+                    )
 
             # put the distribution files metadata in the zip file
-            pos = len(cache_path.as_posix()) + 1
-            for name in cache_path.rglob("*.dist-info/*"):
-                if name.is_dir():
-                    continue
-                outfile.write(name, name.as_posix()[pos:])
+            for distinfo_name, files in finder.dist_metadata.items():
+                for name, data in files.items():
+                    writer.write_data(f"{distinfo_name}/{name}", data)
 
             # write any files to the zip file that were requested specially
             for source_path, target_path in finder.zip_includes:
@@ -793,9 +1368,9 @@ class Freezer:
                         target = target_path.joinpath(
                             source_filename.relative_to(source_path)
                         )
-                        outfile.write(source_filename, target.as_posix())
+                        writer.write_file(source_filename, target.as_posix())
                 else:
-                    outfile.write(source_path, target_path.as_posix())
+                    writer.write_file(source_path, target_path.as_posix())
 
         # Copy Python extension modules from the list built above.
         orig_path = os.environ["PATH"]
@@ -812,23 +1387,97 @@ class Freezer:
             finally:
                 os.environ["PATH"] = orig_path
 
-        # put all files in the file system or keep them in a zip file
-        if self.zip_filename is None:
-            with ZipFile(filename) as outfile:
-                outfile.extractall(target_lib_dir)
-            filename.unlink()
-        else:
+        # the modules are in the file system or in a zip file
+        if self.zip_filename is not None:
+            manifest = self._manifest
             if self.zip_filename.name != filename.name:
                 # zip_filename differs from default
-                filename.rename(self.zip_filename)
+                filename.replace(self.zip_filename)
             library_data = self.target_dir / "lib" / "library.dat"
-            library_data.write_bytes(self.zip_filename.name.encode())
+            self._write_file(library_data, self.zip_filename.name.encode())
+            if manifest is not None:
+                manifest.add_file(self.zip_filename)
+                if self.compress == "zstd":
+                    manifest.add_file(self._zstd_archive)
+                if self.split_archive:
+                    manifest.add_file(self._cold_archive)
+                if isinstance(writer, LayeredZipWriter):
+                    manifest.add_file(writer.deps_filename)
+
+    @property
+    def _zstd_archive(self) -> Path:
+        """The Zstandard archive of the modules, next to the zip file."""
+        return self.target_dir / "lib" / f"{self.zip_filename.stem}.zst"
+
+    def _deps_archive(self, deps_modules: list[Module]) -> Path:
+        """Return the zip file of the dependencies, next to the zip file.
+
+        It is named by a hash of the modules, their code and the versions of
+        their distributions, and of the options that change the code of the
+        modules, so a module changed without a new version is written again;
+        the zip files of other versions are removed.
+        """
+        lib_dir = self.target_dir / "lib"
+        prefix = f"{self.zip_filename.stem}-deps-"
+        key = hashlib.sha256()
+        key.update(f"{version('cx_Freeze')}\n{sys.version}\n".encode())
+        options = (
+            self.compress,
+            self.optimize,
+            self.optimize_packages,
+            self.lazy_imports,
+            self.prune_platform_branches,
+            self.strip_platform_branches,
+            self.strip_docstrings,
+            self.strip_annotations,
+            self.strip_debug_ranges,
+            self.zip_stored_packages,
+            sorted(self.import_trace),
+            self.replace_paths,
+        )
+        key.update(repr(options).encode())
+        for module in deps_modules:
+            distribution = module.distribution or module.root.distribution
+            if distribution is None:
+                key.update(f"{module.name}\n".encode())
+            else:
+                key.update(
+                    f"{module.name} {distribution.distinfo_name}\n".encode()
+                )
+            if module.code is not None:
+                key.update(hashlib.sha256(marshal.dumps(module.code)).digest())
+        deps_archive = lib_dir / f"{prefix}{key.hexdigest()[:16]}.zip"
+        for stale in lib_dir.glob(f"{prefix}*.zip"):
+            if stale != deps_archive:
+                stale.unlink()
+        return deps_archive
+
+    @property
+    def _cold_archive(self) -> Path:
+        """The cold zip file of the modules, next to the zip file."""
+        return self.target_dir / "lib" / f"{self.zip_filename.stem}_cold.zip"
+
+    def _write_file(self, target: Path, data: bytes) -> None:
+        """Write the data to the target file, unless it is up to date."""
+        manifest = self._manifest
+        if manifest is None or not manifest.is_written(target, data):
+            self._create_directory(target.parent)
+            # do not write into a file linked by dedup_files
+            target.unlink(missing_ok=True)
+            target.write_bytes(data)
+        if manifest is not None:
+            manifest.add_data(target, data)
 
     def freeze(self) -> None:
         """Do the freeze."""
         finder: ModuleFinder = self.finder
 
+        # the files are copied in a pool of threads, except the binaries
+        self._copy_pool = ThreadPoolExecutor(COPY_WORKERS)
+
         # Add the executables to target
+        if self.multicall:
+            self._freeze_multicall()
         executables = []
         for executable in self.executables:
             self._freeze_executable(executable)
@@ -864,10 +1513,42 @@ class Freezer:
                 fulltarget = target_dir / target_path
                 self._copy_file(source_path, fulltarget, copy_dependent_files)
 
-        # do any platform-specific post-Freeze work
+        # do any platform-specific post-Freeze work, after the files are
+        # copied (the symbolic links are created at this point)
+        self._wait_for_copies()
         self._post_freeze_hook()
         self.finder.cleanup()
 
+        # replace the files with the same content by links to one of them
+        if self.dedup_files:
+            linked, saved = dedup_files(self.target_dir, COPY_WORKERS)
+            if self.silent < 1:
+                print(
+                    f"dedup files: {linked} duplicate files linked, "
+                    f"{saved} bytes saved"
+                )
+
+        # evict the least recently used artifacts when new ones were cached
+        cache = self.artifact_cache
+        if cache is not None:
+            if cache.misses:
+                cache.prune()
+            if self.silent < 1:
+                print(
+                    f"artifact cache: {cache.hits} hits, {cache.misses} misses"
+                )
+
+        # remove the stale files of an incremental build
+        manifest = self._manifest
+        if manifest is not None:
+            removed = manifest.remove_stale()
+            manifest.save()
+            if self.silent < 1:
+                print(
+                    f"incremental build: {manifest.kept} files up to date, "
+                    f"{removed} stale files removed"
+                )
+
     def print_report(self) -> None:
         """Display report.
 
@@ -886,6 +1567,26 @@ class Freezer:
                 else:
                     print("m", end="")
                 print(f" {module.name:<25} {module.file or ''}")
+            if self.bytecode_saved:
+                saved = sum(self.bytecode_saved.values())
+                print(
+                    f"\nstripping bytecode saved {saved} bytes in "
+                    f"{len(self.bytecode_saved)} modules\n"
+                )
+        if self.silent < 1 and self.needed_libs_only:
+            # Display the libraries that were not needed, wherever the
+            # others were copied (next to an extension module, for instance)
+            copied = {source.resolve() for source in self.source_files}
+            skipped = [
+                source
+                for source in self.finder.package_lib_files
+                if source.resolve() not in copied
+            ]
+            if skipped:
+                print("\nskipped libraries not needed by the extensions:")
+                for source in sorted(skipped):
+                    print(f"  {source}")
+                print()
         if self.silent < 2:
             self.finder.report_missing_modules()
         if self.silent < 3:
@@ -914,6 +1615,21 @@ class WinFreezer(Freezer, PEParser):
             self._warnings,
         )
 
+    @property
+    def search_path(self) -> list[Path]:
+        """The default search path.
+
+        With needed_libs_only, the libraries distributed along with the
+        packages are copied only as dependencies, so they are searched for
+        in their directories too.
+        """
+        search_path = super().search_path
+        if self.needed_libs_only:
+            for source in self.finder.package_lib_files:
+                if source.parent not in search_path:
+                    search_path.append(source.parent)
+        return search_path
+
     def _add_resources(self, exe: Executable) -> None:
         target_path: Path = self.target_dir / exe.target_name
 
@@ -1371,6 +2087,7 @@ class LinuxFreezer(Freezer, ELFParser):
             self.default_bin_path_includes + self.bin_path_includes,
             self.silent,
             self._warnings,
+            self.artifact_cache,
         )
 
     def _default_bin_excludes(self) -> list[str]:
@@ -1464,7 +2181,5 @@ class LinuxFreezer(Freezer, ELFParser):
             )
             if dependent.name != dependent_name:
                 fix_needed.setdefault(dependent.name, dependent_name)
-        if fix_rpath:
-            self.set_rpath(target, ":".join(fix_rpath))
-        for needed_old, needed_new in fix_needed.items():
-            self.replace_needed(target, needed_old, needed_new)
+        if fix_rpath or fix_needed:
+            self.patch(target, ":".join(sorted(fix_rpath)), fix_needed)
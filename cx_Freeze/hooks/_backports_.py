@@ -25,7 +25,7 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             "",
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
 
     def backports_zstd(
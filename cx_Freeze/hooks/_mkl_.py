@@ -34,16 +34,16 @@ class Hook(ModuleHook):
         distribution = module.distribution
         if distribution and distribution.installer == "pip":
             target_dir = f"lib/{module.name}.libs"
-            for file in distribution.binary_files:
-                source = distribution.locate_file(file)
+            binary_files = distribution.file_index.shared_library
+            for source in binary_files.values():
                 target = f"{target_dir}/{source.name}"
                 finder.lib_files[source] = target
                 finder.include_files(source, target)
             for req_name in distribution.requires:
                 with suppress(ModuleError):
                     req_dist = DistributionCache(req_name, finder)
-                    for file in req_dist.binary_files:
-                        source = distribution.locate_file(file)
+                    binary_files = req_dist.file_index.shared_library
+                    for source in binary_files.values():
                         target = f"{target_dir}/{source.name}"
                         finder.lib_files[source] = target
                         finder.include_files(source, target)
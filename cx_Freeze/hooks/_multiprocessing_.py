@@ -106,7 +106,7 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             source_code + dedent(patch),
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
 
     def multiprocessing_context(
@@ -161,7 +161,7 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             source_code + dedent(patch),
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
 
     def multiprocessing_synchronize(
@@ -65,17 +65,6 @@ class Hook(ModuleHook):
             finder.exclude_module("numpy.distutils")
             module.ignore_names.add("numpy.distutils")
 
-        # Exclude tests
-        dist = finder.import_distributions.get(module.name)
-        if dist and dist.files:
-            excludes = set()
-            for file in dist.files:
-                if file.parent.match("**/tests"):
-                    excludes.add(file.parent.as_posix().replace("/", "."))
-            excludes.discard("numpy._core.tests")
-            for exclude in excludes:
-                finder.exclude_module(exclude)
-
         # Exclude/Include modules based on distribution and/or version
         dist = module.distribution
         if dist:
@@ -122,7 +111,7 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             source_code,
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
 
     def numpy_compat(self, _finder: ModuleFinder, module: Module) -> None:
@@ -205,7 +194,7 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             source_code.replace(search, replace),
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
 
     numpy_core_overrides = numpy__core_overrides  # numpy < 2.0
@@ -315,7 +304,7 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             source_code,
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
 
     def numpy_lib_utils(
@@ -58,5 +58,5 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             source_code + dedent(patch),
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
@@ -42,7 +42,7 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             source_code,
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
 
     def pandas_core_arrays_sparse_accessor(
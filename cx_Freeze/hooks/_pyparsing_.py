@@ -37,7 +37,7 @@ class Hook(ModuleHook):
                 "testing = None",
             ),
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
 
     def pyparsing_core(self, _finder: ModuleFinder, module: Module) -> None:
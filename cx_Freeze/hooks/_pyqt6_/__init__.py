@@ -84,7 +84,7 @@ class Hook(QtHook):
         module.code = loader.source_to_code(
             source_code + dedent(patch),
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
 
     def qt_qtwidgets(self, finder: ModuleFinder, module: Module) -> None:
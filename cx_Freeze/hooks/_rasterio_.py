@@ -65,7 +65,7 @@ class Hook(ModuleHook):
             module.code = loader.source_to_code(
                 dedent(patch) + source_code,
                 loader.get_filename(module.name),
-                _optimize=finder.optimize,
+                _optimize=finder.optimize_level(module.name),
             )
 
     def rasterio_plot(self, _finder: ModuleFinder, module: Module) -> None:
@@ -97,7 +97,7 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             source_code,
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
 
     def rasterio__io(
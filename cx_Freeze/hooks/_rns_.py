@@ -60,5 +60,5 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             source_code,
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
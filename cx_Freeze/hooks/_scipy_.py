@@ -42,22 +42,15 @@ submodules = (
 class Hook(ModuleHook):
     """The Hook class for scipy."""
 
-    def scipy(self, finder: ModuleFinder, module: Module) -> None:
+    def scipy(
+        self,
+        finder: ModuleFinder,
+        module: Module,  # noqa: ARG002
+    ) -> None:
         """Optimize hook.
 
         Supported pypi and conda-forge versions (tested until 1.18.0rc2).
         """
-        dist = finder.import_distributions.get(module.name)
-        if dist and dist.files:
-            # Exclude tests
-            excludes = set()
-            for file in dist.files:
-                if file.parent.match("**/tests"):
-                    excludes.add(file.parent.as_posix().replace("/", "."))
-            # >>> excludes.discard("scipy.special.tests")
-            for exclude in excludes:
-                finder.exclude_module(exclude)
-
         # Exclude unnecessary module
         finder.exclude_module("scipy.conftest")
 
@@ -90,7 +83,7 @@ class Hook(ModuleHook):
             module.code = loader.source_to_code(
                 source_code,
                 loader.get_filename(module.name),
-                _optimize=finder.optimize,
+                _optimize=finder.optimize_level(module.name),
             )
 
     def scipy__lib_array_api_compat(
@@ -229,7 +222,7 @@ class Hook(ModuleHook):
                     "from warnings import catch_warnings as suppress_warnings",
                 ),
                 loader.get_filename(module.name),
-                _optimize=finder.optimize,
+                _optimize=finder.optimize_level(module.name),
             )
 
     def __getattr__(self, name: str) -> object:
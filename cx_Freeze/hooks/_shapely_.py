@@ -41,7 +41,7 @@ class Hook(ModuleHook):
             module.code = loader.source_to_code(
                 source_code,
                 loader.get_filename(module.name),
-                _optimize=finder.optimize,
+                _optimize=finder.optimize_level(module.name),
             )
 
     def shapely_geos(self, finder: ModuleFinder, module: Module) -> None:
@@ -60,7 +60,7 @@ class Hook(ModuleHook):
             module.code = loader.source_to_code(
                 source_code,
                 loader.get_filename(module.name),
-                _optimize=finder.optimize,
+                _optimize=finder.optimize_level(module.name),
             )
 
     def shapely__geometry_helpers(
@@ -27,13 +27,6 @@ class Hook(ModuleHook):
             module.update_distribution("scikit-image")
             dist = getattr(module.distribution, "_dist", None)
         if dist and dist.files:
-            # Exclude all tests
-            excludes = set()
-            for file in dist.files:
-                if file.parent.match("**/tests"):
-                    excludes.add(file.parent.as_posix().replace("/", "."))
-            for exclude in excludes:
-                finder.exclude_module(exclude)
             # Include stubs
             if module.in_file_system == 0:
                 for file in dist.files:
@@ -89,7 +82,7 @@ class Hook(ModuleHook):
                     "__import__('sys').prefix + '/share/skimage/data/file'",
                 ),
                 loader.get_filename(module.name),
-                _optimize=finder.optimize,
+                _optimize=finder.optimize_level(module.name),
             )
         module.ignore_names.add("pytest")
 
@@ -111,7 +104,7 @@ class Hook(ModuleHook):
             module.code = loader.source_to_code(
                 source_code,
                 loader.get_filename(module.name),
-                _optimize=finder.optimize,
+                _optimize=finder.optimize_level(module.name),
             )
 
     def skimage_io__plugins(
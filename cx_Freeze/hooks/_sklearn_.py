@@ -21,21 +21,8 @@ class Hook(ModuleHook):
     def sklearn(
         self,
         finder: ModuleFinder,
-        module: Module,
+        module: Module,  # noqa: ARG002
     ) -> None:
-        dist = finder.import_distributions.get(module.name)
-        if dist and dist.files:
-            # Exclude tests
-            excludes = set()
-            for file in dist.files:
-                if file.parent.match("**/conftest.py"):
-                    exclude = file.with_suffix("").as_posix().replace("/", ".")
-                    excludes.add(exclude)
-            for file in dist.files:
-                if file.parent.match("**/tests"):
-                    excludes.add(file.parent.as_posix().replace("/", "."))
-            for exclude in excludes:
-                finder.exclude_module(exclude)
         # Exclude unnecessary modules
         finder.exclude_module("sklearn._build_utils")
         finder.exclude_module("sklearn.utils._testing")
@@ -56,7 +43,7 @@ class Hook(ModuleHook):
             module.code = loader.source_to_code(
                 "",
                 loader.get_filename(module.name),
-                _optimize=finder.optimize,
+                _optimize=finder.optimize_level(module.name),
             )
 
     def sklearn_externals_array_api_compat_numpy(
@@ -100,7 +87,7 @@ class Hook(ModuleHook):
                 module.code = loader.source_to_code(
                     source_code,
                     loader.get_filename(module.name),
-                    _optimize=finder.optimize,
+                    _optimize=finder.optimize_level(module.name),
                 )
 
     def sklearn_utils__mask(
@@ -149,7 +136,7 @@ class Hook(ModuleHook):
             module.code = loader.source_to_code(
                 source_code,
                 loader.get_filename(module.name),
-                _optimize=finder.optimize,
+                _optimize=finder.optimize_level(module.name),
             )
 
     def sklearn_utils_validation(
@@ -75,7 +75,7 @@ class Hook(ModuleHook):
             module.code = loader.source_to_code(
                 source_code,
                 loader.get_filename(module.name),
-                _optimize=finder.optimize,
+                _optimize=finder.optimize_level(module.name),
             )
 
         # include the shared libraries in 'lib' as fixed libraries
@@ -139,7 +139,7 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             source_code,
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
 
     def torch__numpy(self, finder: ModuleFinder, module: Module) -> None:
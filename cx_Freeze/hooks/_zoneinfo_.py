@@ -88,5 +88,5 @@ class Hook(ModuleHook):
         module.code = loader.source_to_code(
             dedent(patch) + source_code,
             loader.get_filename(module.name),
-            _optimize=finder.optimize,
+            _optimize=finder.optimize_level(module.name),
         )
@@ -9,7 +9,12 @@ import collections.abc
 import os
 import sys
 
-__all__ = ("DEFAULT_EXCLUDES", "DEFAULT_IGNORE_NAMES")
+__all__ = (
+    "DEFAULT_EXCLUDES",
+    "DEFAULT_IGNORE_NAMES",
+    "DEFAULT_TESTS_EXCLUDES",
+    "DEFAULT_TESTS_INCLUDES",
+)
 
 # EXCLUDES - modules that exists in the current supported Python version or
 # platforms and shouldn't included in the frozen executable.
@@ -359,3 +364,13 @@ if PY_VERSION < (3, 14):
 
 # Ignore all default excludes.
 DEFAULT_IGNORE_NAMES.update(DEFAULT_EXCLUDES)
+
+# TESTS - names of the subpackages (or modules) with the test suites of the
+# distributions, and the test packages that are imported at runtime.
+DEFAULT_TESTS_EXCLUDES: tuple[str, ...] = (
+    "tests",
+    "test",
+    "testing",
+    "conftest",
+)
+DEFAULT_TESTS_INCLUDES: tuple[str, ...] = ("numpy._core.tests",)
@@ -150,22 +150,7 @@ class Module:
         if not imports_only:
             # search for a stub file along side the python extension module
             source_file = filename.parent / stub_name
-            if source_file.exists():
-                imports_only = self.get_imports_from_file(source_file)
-            if not imports_only and self.finder:
-                target_file = self.finder.cache_path / package / stub_name
-                if target_file.exists():
-                    # a parsed stub exists in the cache
-                    imports_only = target_file.read_text(encoding="utf_8")
-                else:
-                    imports_only = self.get_imports_from_file(source_file)
-                    if imports_only:
-                        # cache the parsed stub
-                        target_file.parent.mkdir(parents=True, exist_ok=True)
-                        target_file.write_text(
-                            "# Generated by cx_Freeze\n\n" + imports_only,
-                            encoding="utf_8",
-                        )
+            imports_only = self.get_imports_from_file(source_file)
         if imports_only:
             return compile(imports_only, stub_name, "exec", dont_inherit=True)
         return None
@@ -174,6 +159,15 @@ class Module:
         """Get the implicit imports in a stub file."""
         if not source_file.is_file():
             return None
+        finder = self.finder
+        if finder is None:
+            source = source_file.read_text(encoding="utf_8")
+            return self.get_imports_from_source(source, source_file.name)
+        return finder.stub_cache.get(source_file)
+
+    @staticmethod
+    def get_imports_from_source(source: str, filename: str) -> str | None:
+        """Get the implicit imports in the source of a stub file."""
         ignore = {
             "__future__",
             "builtins",
@@ -181,9 +175,8 @@ class Module:
             "typing",
             "typing_extensions",
         }
-        source = source_file.read_text(encoding="utf_8")
         try:
-            rootnode = ast.parse(source, source_file.name)
+            rootnode = ast.parse(source, filename)
         except SyntaxError:
             return None
         lines = []
@@ -210,10 +203,10 @@ class Module:
         """Dynamic libraries distributed along with the package."""
         distribution = self.distribution
         if distribution:
+            binary_files = distribution.file_index.shared_library
             if self.in_file_system == 0:
                 # the module is in zip file and binary files are
-                for file in distribution.binary_files:
-                    source = distribution.locate_file(file)
+                for file, source in binary_files.items():
                     # .. not in library directories
                     if not source.parent.name.endswith((".libs", ".dylibs")):
                         target = f"lib/{source.name}"
@@ -223,8 +216,7 @@ class Module:
             else:
                 # the module is in file system, so consider
                 # mirroring the binary files to the lib directory
-                for file in distribution.binary_files:
-                    source = distribution.locate_file(file)
+                for file, source in binary_files.items():
                     target = f"lib/{file}"
                     yield source, target
         else:
@@ -243,11 +235,9 @@ class Module:
         """Return the directories where shared library files are stored."""
         distribution = self.distribution
         if distribution:
+            binary_files = distribution.file_index.shared_library
             return list(
-                {
-                    distribution.locate_file(file).parent.as_posix()
-                    for file in distribution.binary_files
-                }
+                {source.parent.as_posix() for source in binary_files.values()}
             )
 
         module_path = self.path
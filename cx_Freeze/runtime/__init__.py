@@ -0,0 +1 @@
+"""Modules included in the frozen executables to support build options."""
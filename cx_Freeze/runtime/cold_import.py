@@ -0,0 +1,79 @@
+"""Import of modules from the cold zip file, used by split_archive.
+
+This module is included in the frozen executable as _cx_freeze_cold, in the
+hot zip file (the one in sys.path), which holds the modules imported at
+startup, with a stub for each init script. The stub installs the importer
+and executes the init script embedded in it.
+
+The cold zip file holds the other modules, and is opened, parsing its
+central directory, only when a module is not found in the hot zip file.
+
+This module imports only built-in and frozen modules, and zipimport.
+"""
+
+import marshal
+import os
+import sys
+from _frozen_importlib import ModuleSpec
+from zipimport import zipimporter
+
+__all__ = ["ColdArchiveFinder", "exec_split", "install"]
+
+
+class ColdArchiveFinder:
+    """A finder of the modules stored in the cold zip file.
+
+    The submodules are looked up in the directory of their package in the
+    cold zip file, which is not in the __path__ of a hot package.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self._importers: dict[str, zipimporter] = {}
+
+    def find_spec(
+        self,
+        fullname: str,
+        path=None,  # noqa: ANN001,ARG002
+        target=None,  # noqa: ANN001
+    ) -> ModuleSpec | None:
+        package = fullname.rpartition(".")[0]
+        importer = self._importers.get(package)
+        if importer is None:
+            # the central directory is read once, and shared by the importers
+            location = os.path.join(self.path, *package.split("."), "")
+            importer = self._importers[package] = zipimporter(location)
+        return importer.find_spec(fullname, target)
+
+    def invalidate_caches(self) -> None:
+        for importer in self._importers.values():
+            importer.invalidate_caches()
+
+
+def install(archive: str) -> ColdArchiveFinder:
+    """Install the finder of the modules stored in the cold zip file.
+
+    The cold zip file is searched in the directories of sys.path, and in
+    the directories of the zip files of sys.path.
+    """
+    for finder in sys.meta_path:
+        if isinstance(finder, ColdArchiveFinder):
+            return finder
+    for entry in sys.path:
+        directory = entry if os.path.isdir(entry) else os.path.dirname(entry)
+        path = os.path.join(directory, archive)
+        if os.path.isfile(path):
+            break
+    else:
+        msg = f"Cold zip file not found: {archive!r}"
+        raise ImportError(msg)
+    finder = ColdArchiveFinder(path)
+    # the modules of sys.path take precedence
+    sys.meta_path.append(finder)
+    return finder
+
+
+def exec_split(namespace: dict, archive: str, code: bytes) -> None:
+    """Install the finder and execute the code of the init module."""
+    install(archive)
+    exec(marshal.loads(code), namespace)  # noqa: S102,S302
@@ -0,0 +1,39 @@
+"""Import of the dependencies from their own zip file, for layered_archive.
+
+This module is included in the frozen executable as _cx_freeze_layer, in the
+zip file of the application, with a stub for each init script. The stub adds
+the zip file of the dependencies to sys.path and executes the init script
+embedded in it.
+
+This module imports only built-in and frozen modules.
+"""
+
+import marshal
+import os
+import sys
+
+__all__ = ["exec_layered", "install"]
+
+
+def install(archive: str) -> str:
+    """Add the zip file of the dependencies to sys.path, after the zip file.
+
+    The zip file is searched in the directories of sys.path, and in the
+    directories of the zip files of sys.path.
+    """
+    for position, entry in enumerate(sys.path):
+        directory = entry if os.path.isdir(entry) else os.path.dirname(entry)
+        path = os.path.join(directory, archive)
+        if path in sys.path:
+            return path
+        if os.path.isfile(path):
+            sys.path.insert(position + 1, path)
+            return path
+    msg = f"Zip file of the dependencies not found: {archive!r}"
+    raise ImportError(msg)
+
+
+def exec_layered(namespace: dict, archive: str, code: bytes) -> None:
+    """Add the zip file to sys.path and execute the code of the init module."""
+    install(archive)
+    exec(marshal.loads(code), namespace)  # noqa: S102,S302
@@ -0,0 +1,65 @@
+"""Lazy import of modules, used by the lazy_imports build option.
+
+This module is included in the frozen executable as _cx_freeze_lazy, and the
+top-level imports of the selected packages are rewritten to call lazy_import.
+
+This module imports only built-in modules at import time, so the rewritten
+modules can import it at any point of the startup; importlib.util is
+imported on the first call, and the modules it imports, which can be
+rewritten too, are imported eagerly meanwhile.
+"""
+
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False  # typing is not imported at startup
+if TYPE_CHECKING:
+    from types import ModuleType
+
+__all__ = ["lazy_import"]
+
+# importlib.util, once imported, and whether it is being imported
+_machinery: dict[str, ModuleType | bool] = {}
+
+
+def _import_eagerly(name: str) -> ModuleType:
+    __import__(name)
+    return sys.modules[name]
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return the named module, which is executed on first attribute access.
+
+    Modules already imported and built-in modules are returned as they are.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if name in sys.builtin_module_names:
+        return _import_eagerly(name)
+    util = _machinery.get("util")
+    if util is None:
+        if _machinery.get("importing"):
+            return _import_eagerly(name)
+        _machinery["importing"] = True
+        try:
+            from importlib import util  # noqa: PLC0415
+        finally:
+            _machinery["importing"] = False
+        _machinery["util"] = util
+    spec = util.find_spec(name)  # the parent package is imported eagerly
+    if spec is None or spec.loader is None:
+        msg = f"No module named {name!r}"
+        raise ModuleNotFoundError(msg, name=name)
+    if not hasattr(spec.loader, "exec_module"):
+        return _import_eagerly(name)
+    loader = util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent_name, _, child_name = name.rpartition(".")
+    if parent_name:
+        setattr(sys.modules[parent_name], child_name, module)
+    return module
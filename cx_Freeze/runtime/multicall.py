@@ -0,0 +1,85 @@
+"""Dispatch of the multi-call executable, used by multicall.
+
+This module is included in the frozen executable as the init module of the
+executable shared by all the executables, which are symbolic links to it.
+The startup script runs the init module named by sys.executable, the path
+of the shared executable once the links are resolved, so this module
+dispatches on the name in sys.argv[0] to the init and main modules of the
+executable called, following the links made to the executables by the user.
+Like busybox, the shared executable can be called by its
+own name, with the name of the executable as first argument.
+
+This module imports only built-in and frozen modules, and BUILD_CONSTANTS.
+"""
+
+import os
+import sys
+
+__all__ = ["find_command", "run"]
+
+
+def get_name(executable: str) -> str:
+    """Get the module basename of an executable, like the startup script."""
+    name = os.path.normcase(os.path.basename(executable))
+    name = name.partition(".")[0]
+    if not name.isidentifier():
+        import string  # noqa: PLC0415
+
+        invalid = string.whitespace + string.punctuation
+        idtable = str.maketrans(invalid, "_" * len(invalid))
+        return name.translate(idtable)
+    return name
+
+
+def find_command(executable: str, executables: list[str]) -> str:
+    """Get the name of the executable called, following the links to it.
+
+    A link to an executable, like an alias, has a name of its own, so the
+    links are followed hop by hop, up to the first name of an executable.
+    """
+    path = executable
+    if not os.path.dirname(path) and not os.path.lexists(path):
+        # called by its name, found in the PATH
+        for directory in os.environ.get("PATH", "").split(os.pathsep):
+            location = os.path.join(directory, path)
+            if os.path.lexists(location):
+                path = location
+                break
+    seen = set()
+    command = get_name(path)
+    while command not in executables and path not in seen:
+        seen.add(path)
+        try:
+            target = os.readlink(path)
+        except (OSError, ValueError):
+            break
+        path = os.path.join(os.path.dirname(path), target)
+        command = get_name(path)
+    return command if command in executables else get_name(executable)
+
+
+def run(name: str) -> None:  # noqa: ARG001
+    """Execute the init and main modules of the executable called."""
+    import BUILD_CONSTANTS  # noqa: PLC0415 # ty: ignore[unresolved-import]
+
+    executables = [
+        get_name(executable)
+        for executable in BUILD_CONSTANTS.__EXECUTABLES__.split(os.pathsep)
+    ]
+    command = find_command(sys.argv[0], executables)
+    if command not in executables and sys.argv[1:2]:
+        # called by its own name, the executable is the first argument
+        argument = get_name(sys.argv[1])
+        if argument in executables:
+            del sys.argv[0]
+            command = argument
+    if command not in executables:
+        if len(executables) > 1:
+            msg = (
+                f"Unknown executable {command!r}, the multi-call executable "
+                f"runs one of: {', '.join(executables)}"
+            )
+            raise RuntimeError(msg)
+        command = executables[0]
+    module_init = __import__(f"__init__{command}")
+    module_init.run(f"__main__{command}")
@@ -0,0 +1,230 @@
+"""Import of modules from a Zstandard archive, used by compress='zstd'.
+
+This module is included in the frozen executable as _cx_freeze_zstd, in the
+zip file, which also holds a stub for each init script. The stub installs
+the importer and executes the init script stored in the archive.
+
+This module imports only built-in and frozen modules, because the other
+modules are stored in the archive.
+
+The data files of the packages are kept in the zip file, so the modules have
+their file names in the zip file, and their loader reads the data and the
+resources from the zip file.
+
+The archive holds the code of each module, compressed separately, followed
+by the size of the data to read ahead at startup and the index of the
+modules, serialized with marshal (name: offset, size, uncompressed size, is
+package, is compressed), the offset of the index as an 8-byte little-endian
+integer, and a magic number.
+"""
+
+import marshal
+import os
+import sys
+from _frozen_importlib import ModuleSpec, module_from_spec
+from _frozen_importlib_external import (
+    EXTENSION_SUFFIXES,
+    ExtensionFileLoader,
+    PathFinder,
+    spec_from_file_location,
+)
+from _thread import allocate_lock
+from zipimport import zipimporter
+
+__all__ = ["ZstdArchiveFinder", "exec_archived", "install"]
+
+# keep in sync with cx_Freeze._writer
+ARCHIVE_MAGIC = b"CXZSTD01"
+FOOTER_SIZE = 16
+
+ModuleType = type(sys)
+
+
+def _load_zstandard() -> ModuleType:
+    """Load the extension of the zstandard package, without the package.
+
+    Importing the package requires modules that are stored in the archive.
+    """
+    name = "zstandard.backend_c"
+    for entry in sys.path:
+        if not os.path.isdir(entry):
+            continue
+        for suffix in EXTENSION_SUFFIXES:
+            for location in (
+                os.path.join(entry, "zstandard", f"backend_c{suffix}"),
+                os.path.join(entry, f"{name}{suffix}"),
+            ):
+                if os.path.isfile(location):
+                    loader = ExtensionFileLoader(name, location)
+                    spec = spec_from_file_location(
+                        name, location, loader=loader
+                    )
+                    module = module_from_spec(spec)
+                    loader.exec_module(module)
+                    return module
+    msg = "No Zstandard decompressor found"
+    raise ImportError(msg)
+
+
+def _get_decompress():  # noqa: ANN202
+    """Return a function to decompress the data of a module."""
+    try:
+        from _zstd import ZstdDecompressor  # noqa: PLC0415 # Python 3.14+
+    except ImportError:
+        dctx = _load_zstandard().ZstdDecompressor()
+
+        def decompress(data: bytes, size: int) -> bytes:
+            return dctx.decompress(data, max_output_size=size)
+
+    else:
+
+        def decompress(data: bytes, size: int) -> bytes:  # noqa: ARG001
+            return ZstdDecompressor().decompress(data)
+
+    return decompress
+
+
+class _ZipResources:
+    """A resource reader of a package, for the data files in the zip file."""
+
+    def __init__(self, archive: str, prefix: str) -> None:
+        self.archive: str = archive
+        self.prefix: str = prefix
+
+    def files(self):  # noqa: ANN202
+        from zipfile import Path  # noqa: PLC0415 (stored in the archive)
+
+        return Path(self.archive, self.prefix)
+
+
+class ZstdArchiveFinder:
+    """A finder and loader for the modules stored in a Zstandard archive."""
+
+    def __init__(self, path: str, zip_path: str | None = None) -> None:
+        self.path: str = path
+        self.zip_path: str = zip_path or path
+        self._zip: zipimporter | None = None
+        self._file = open(path, "rb")  # noqa: SIM115
+        end = self._file.seek(-FOOTER_SIZE, os.SEEK_END)
+        footer = self._file.read(FOOTER_SIZE)
+        if footer[8:] != ARCHIVE_MAGIC:
+            msg = f"Bad Zstandard archive: {path!r}"
+            raise ImportError(msg, path=path)
+        index_offset = int.from_bytes(footer[:8], "little")
+        self._file.seek(index_offset)
+        data = self._file.read(end - index_offset)
+        self._index: dict[str, tuple[int, int, int, bool, bool]]
+        readahead, self._index = marshal.loads(data)  # noqa: S302
+        if readahead and hasattr(os, "posix_fadvise"):
+            # the modules imported at startup are at the start of the archive
+            try:  # noqa: SIM105 (contextlib is not available yet)
+                os.posix_fadvise(
+                    self._file.fileno(), 0, readahead, os.POSIX_FADV_WILLNEED
+                )
+            except OSError:
+                pass
+        self._lock = allocate_lock()
+        self._decompress = _get_decompress()
+
+    def _get_filename(self, fullname: str, is_package: bool) -> str:
+        parts = fullname.split(".")
+        if is_package:
+            parts.append("__init__")
+        return os.path.join(self.zip_path, *parts) + ".pyc"
+
+    def find_spec(
+        self,
+        fullname: str,
+        path=None,  # noqa: ANN001,ARG002
+        target=None,  # noqa: ANN001,ARG002
+    ) -> ModuleSpec | None:
+        entry = self._index.get(fullname)
+        if entry is None:
+            return None
+        is_package = entry[3]
+        origin = self._get_filename(fullname, is_package)
+        spec = ModuleSpec(fullname, self, origin=origin, is_package=is_package)
+        spec.has_location = True
+        if is_package:
+            spec.submodule_search_locations = [os.path.dirname(origin)]
+        return spec
+
+    def create_module(self, spec: ModuleSpec) -> None:  # noqa: ARG002
+        return None
+
+    def exec_module(self, module: ModuleType) -> None:
+        code = self.get_code(module.__spec__.name)
+        exec(code, module.__dict__)  # noqa: S102
+
+    def get_code(self, fullname: str):  # noqa: ANN201
+        try:
+            offset, size, file_size, _, compressed = self._index[fullname]
+        except KeyError:
+            msg = f"No module named {fullname!r}"
+            raise ImportError(msg, name=fullname) from None
+        with self._lock:
+            self._file.seek(offset)
+            data = self._file.read(size)
+            if compressed:
+                data = self._decompress(data, file_size)
+        return marshal.loads(data)  # noqa: S302
+
+    def get_data(self, path: str) -> bytes:
+        """Return the data of a file stored in the zip file."""
+        if self._zip is None:
+            if self.zip_path == self.path:
+                raise OSError(0, "No zip file for the data", path)
+            self._zip = zipimporter(self.zip_path)
+        return self._zip.get_data(path)
+
+    def get_resource_reader(self, fullname: str) -> _ZipResources | None:
+        if self.zip_path == self.path or not self.is_package(fullname):
+            return None
+        prefix = fullname.replace(".", "/") + "/"
+        return _ZipResources(self.zip_path, prefix)
+
+    def get_filename(self, fullname: str) -> str:
+        return self._get_filename(fullname, self.is_package(fullname))
+
+    def get_source(self, fullname: str) -> None:  # noqa: ARG002
+        return None
+
+    def is_package(self, fullname: str) -> bool:
+        try:
+            return self._index[fullname][3]
+        except KeyError:
+            msg = f"No module named {fullname!r}"
+            raise ImportError(msg, name=fullname) from None
+
+
+def install(archive: str) -> ZstdArchiveFinder:
+    """Install the finder of the modules stored in the archive.
+
+    The archive is searched in the directories of sys.path, and in the
+    directories of the zip files of sys.path.
+    """
+    for finder in sys.meta_path:
+        if isinstance(finder, ZstdArchiveFinder):
+            return finder
+    for entry in sys.path:
+        directory = entry if os.path.isdir(entry) else os.path.dirname(entry)
+        path = os.path.join(directory, archive)
+        if os.path.isfile(path):
+            break
+    else:
+        msg = f"Zstandard archive not found: {archive!r}"
+        raise ImportError(msg)
+    # the zip file next to the archive holds the data files
+    finder = ZstdArchiveFinder(path, entry if os.path.isfile(entry) else None)
+    # the built-in and frozen modules take precedence
+    try:
+        position = sys.meta_path.index(PathFinder)
+    except ValueError:
+        position = len(sys.meta_path)
+    sys.meta_path.insert(position, finder)
+    return finder
+
+
+def exec_archived(name: str, namespace: dict, archive: str) -> None:
+    """Install the finder and execute the module stored in the archive."""
+    exec(install(archive).get_code(name), namespace)  # noqa: S102
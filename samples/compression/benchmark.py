@@ -0,0 +1,75 @@
+"""Compare the compression of the modules on size and startup time.
+
+The startup.py script is frozen with the modules stored in the zip file,
+compressed with deflate, and compressed with Zstandard (requires Python 3.14
+or the zstandard package). All packages are put in the zip file.
+
+Run the benchmark with the command 'python benchmark.py'
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from cx_Freeze import Freezer
+from cx_Freeze._writer import zstd_backend
+
+RUNS = 20
+
+MODES = {"stored": False, "deflate": True}
+if zstd_backend() is not None:
+    MODES["zstd"] = "zstd"
+
+
+def build(name: str, compress: bool | str) -> Path:
+    target_dir = Path("build", name)
+    freezer = Freezer(
+        executables=["startup.py"],
+        compress=compress,
+        zip_filename="library.zip",
+        zip_include_packages=["*"],
+        zip_exclude_packages=[],
+        target_dir=target_dir,
+        silent=True,
+    )
+    freezer.freeze()
+    return target_dir
+
+
+def archive_size(target_dir: Path) -> int:
+    lib_dir = target_dir / "lib"
+    return sum(
+        path.stat().st_size
+        for path in lib_dir.iterdir()
+        if path.suffix in (".zip", ".zst")
+    )
+
+
+def startup_time(target_dir: Path) -> float:
+    executable = target_dir / (
+        "startup.exe" if sys.platform == "win32" else "startup"
+    )
+    subprocess.run([executable], check=True, capture_output=True)  # warm up
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([executable], check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    print(f"{'mode':<10}{'archive size':>16}{'startup (median)':>20}")
+    for name, compress in MODES.items():
+        target_dir = build(name, compress)
+        size = archive_size(target_dir)
+        elapsed = startup_time(target_dir)
+        print(f"{name:<10}{size:>16,}{elapsed * 1000:>17.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
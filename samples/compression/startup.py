@@ -0,0 +1,38 @@
+"""Import a good part of the standard library, to measure the startup."""
+
+import argparse
+import asyncio
+import csv
+import dataclasses
+import decimal
+import difflib
+import email.message
+import http.client
+import json
+import logging
+import pathlib
+import sqlite3
+import subprocess
+import urllib.request
+import xml.dom.minidom
+import zipfile
+
+modules = (
+    argparse,
+    asyncio,
+    csv,
+    dataclasses,
+    decimal,
+    difflib,
+    email.message,
+    http.client,
+    json,
+    logging,
+    pathlib,
+    sqlite3,
+    subprocess,
+    urllib.request,
+    xml.dom.minidom,
+    zipfile,
+)
+print(f"imported {len(modules)} modules")
@@ -722,6 +722,17 @@ def normalize(name: str) -> str:
     return re.sub(r"[-_.]+", "-", name).lower()
 
 
+@pytest.fixture(scope="session")
+def _cache_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(_cache_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use a temporary persistent cache, instead of the cache of the user."""
+    monkeypatch.setenv("CXFREEZE_CACHE_DIR", os.fspath(_cache_path))
+
+
 @pytest.fixture
 def _tmp_package(
     request: pytest.FixtureRequest,
@@ -43,6 +43,21 @@ def test_cxfreeze_additional_help(tmp_package: TempPackage) -> None:
     result.stdout.fnmatch_lines("*--help-commands*")
 
 
+def test_cxfreeze_cache(tmp_package: TempPackage) -> None:
+    """Test cxfreeze cache."""
+    tmp_package.create(SOURCE)
+    cache_dir = tmp_package.path / "cache"
+    (cache_dir / "ab").mkdir(parents=True)
+    (cache_dir / "ab" / "abcdef").write_bytes(b"x" * 100)
+    command = f"cxfreeze cache --cache-dir={cache_dir}"
+    result = tmp_package.freeze(command)
+    result.stdout.fnmatch_lines(["artifacts: 1", "size: 100 bytes"])
+    result = tmp_package.freeze(f"{command} prune")
+    result.stdout.fnmatch_lines("removed 0 artifacts (0 bytes)")
+    result = tmp_package.freeze(f"{command} clear")
+    result.stdout.fnmatch_lines("removed 1 artifacts (100 bytes)")
+
+
 def test_cxfreeze_debug_verbose(tmp_package: TempPackage) -> None:
     """Test cxfreeze --debug --verbose."""
     tmp_package.create(SOURCE)
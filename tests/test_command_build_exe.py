@@ -454,6 +454,82 @@ def test_build_exe_asmodule(tmp_package: TempPackage) -> None:
     result.stdout.fnmatch_lines("Hello from cx_Freeze")
 
 
+def test_build_exe_skip_unchanged(tmp_package: TempPackage) -> None:
+    """Test the build_exe with skip-unchanged option."""
+    tmp_package.create_from_sample("asmodule")
+    command = (
+        "python setup.py build_exe --excludes=tkinter --include-msvcr "
+        "--skip-unchanged"
+    )
+    output = tmp_package.freeze(command)
+    output.stdout.no_fnmatch_line("*is up to date")
+    executable = tmp_package.executable("asmodule")
+    assert executable.is_file()
+
+    # the inputs are unchanged
+    output = tmp_package.freeze(command)
+    output.stdout.fnmatch_lines("*is up to date")
+
+    # the build directory is modified
+    executable.with_name("extra.txt").write_bytes(b"extra")
+    output = tmp_package.freeze(command)
+    output.stdout.no_fnmatch_line("*is up to date")
+    assert not executable.with_name("extra.txt").exists()
+
+    # a source is changed
+    script = tmp_package.path / "asmodule.py"
+    script.write_bytes(
+        script.read_bytes().replace(b"Hello from", b"Hello again from")
+    )
+    output = tmp_package.freeze(command)
+    output.stdout.no_fnmatch_line("*is up to date")
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines("Hello again from cx_Freeze")
+
+
+SOURCE_OPTIONAL = """\
+optional.py
+    import mypkg
+
+    try:
+        import mypkg.optional
+    except ImportError:
+        print("Hello without mypkg.optional")
+    else:
+        print("Hello with mypkg.optional")
+mypkg/__init__.py
+setup.py
+    from cx_Freeze import setup
+
+    setup(name="optional", executables=["optional.py"])
+"""
+
+
+def test_build_exe_skip_unchanged_missing(tmp_package: TempPackage) -> None:
+    """Test the build_exe with skip-unchanged, and a missing submodule."""
+    tmp_package.create(SOURCE_OPTIONAL)
+    command = (
+        "python setup.py build_exe --excludes=tkinter --include-msvcr "
+        "--skip-unchanged"
+    )
+    output = tmp_package.freeze(command)
+    output.stdout.no_fnmatch_line("*is up to date")
+    executable = tmp_package.executable("optional")
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines("Hello without mypkg.optional")
+
+    # the submodule is still missing
+    output = tmp_package.freeze(command)
+    output.stdout.fnmatch_lines("*is up to date")
+
+    # the submodule is added to the package
+    tmp_package.path.joinpath("mypkg/optional.py").touch()
+    output = tmp_package.freeze(command)
+    output.stdout.no_fnmatch_line("*is up to date")
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines("Hello with mypkg.optional")
+
+
 SOURCE_FLAT_LAYOUT = """\
 test1.py
     import importlib.metadata
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import inspect
 import os
+import py_compile
+import sys
+from importlib.machinery import SourceFileLoader
+from importlib.util import cache_from_source
 from typing import TYPE_CHECKING
 
 import pytest
 
 from cx_Freeze import ConstantsModule, ModuleFinder
+from cx_Freeze._cache import ArtifactCache
 
 from .datatest import SCAN_CODE_TEST, SYNTAX_ERROR_TEST
 
@@ -62,3 +68,221 @@ class TestModuleFinder:
         module = fix_module_finder.include_module("invalid_syntax")
         assert module is not None
         assert module.error_msg == "SyntaxError: invalid syntax"
+
+    @pytest.mark.parametrize("optimize", [1, 2])
+    def test_cached_bytecode(
+        self,
+        tmp_package: TempPackage,
+        mocker: MockerFixture,
+        optimize: int,
+    ) -> None:
+        """Valid __pycache__ files are used instead of compiling the source."""
+        tmp_package.create(CACHED_BYTECODE_TEST)
+        source = tmp_package.path / "cached_module.py"
+        py_compile.compile(
+            source,
+            cfile=cache_from_source(source, optimization=optimize),
+            optimize=optimize,
+            doraise=True,
+        )
+        compile_mock = mocker.spy(SourceFileLoader, "source_to_code")
+
+        finder = ModuleFinder(
+            ConstantsModule(), optimize=optimize, path=[tmp_package.path]
+        )
+        module = finder.include_module("cached_module")
+        assert module is not None
+        assert module.code is not None
+        compile_mock.assert_not_called()
+
+        # the source is changed, so the cached file is stale
+        source.write_text("print('Hello from cx_Freeze')\n# changed\n")
+        finder = ModuleFinder(
+            ConstantsModule(), optimize=optimize, path=[tmp_package.path]
+        )
+        module = finder.include_module("cached_module")
+        assert module is not None
+        assert module.code is not None
+        compile_mock.assert_called_once()
+
+    def test_artifact_cache(
+        self, tmp_package: TempPackage, mocker: MockerFixture
+    ) -> None:
+        """The compiled code is reused from the artifact cache."""
+        tmp_package.create(CACHED_BYTECODE_TEST)
+        cache = ArtifactCache(tmp_package.path / "cache")
+        compile_mock = mocker.spy(SourceFileLoader, "source_to_code")
+        for _ in range(2):
+            finder = ModuleFinder(
+                ConstantsModule(),
+                optimize=2,
+                path=[tmp_package.path],
+                artifact_cache=cache,
+            )
+            module = finder.include_module("cached_module")
+            assert module is not None
+            assert module.code is not None
+        compile_mock.assert_called_once()
+        assert (cache.hits, cache.misses) == (1, 1)
+        count, size = cache.size()
+        assert count == 1
+        assert cache.prune(0) == (1, size)
+        assert cache.size() == (0, 0)
+
+    @pytest.mark.parametrize(
+        "option", ["prune_platform_branches", "strip_platform_branches"]
+    )
+    def test_platform_branches(
+        self, tmp_package: TempPackage, option: str
+    ) -> None:
+        """Imports in dead branches on the current platform are skipped."""
+        tmp_package.create(PLATFORM_BRANCHES_TEST)
+        finder = ModuleFinder(
+            ConstantsModule(),
+            path=[tmp_package.path, *sys.path],
+            **{option: ["platform_module"]},
+        )
+        module = finder.include_module("platform_module")
+        assert module is not None
+        assert module.code is not None
+        names = [module.name for module in finder.modules]
+        assert "py3_module" in names
+        assert "py2_module" not in names
+        missing = finder._bad_modules  # noqa: SLF001
+        assert "py2_module" not in missing
+        assert "nt_module" not in missing
+        stripped = option == "strip_platform_branches"
+        assert ("py2_module" not in module.code.co_names) is stripped
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "rebound_class",
+            "rebound_def",
+            "rebound_except",
+            "rebound_import",
+        ],
+    )
+    def test_platform_branches_rebound(
+        self, tmp_package: TempPackage, name: str
+    ) -> None:
+        """The branches using a name bound more than once are kept."""
+        tmp_package.create(PLATFORM_BRANCHES_REBOUND_TEST)
+        finder = ModuleFinder(
+            ConstantsModule(),
+            path=[tmp_package.path, *sys.path],
+            prune_platform_branches=[name],
+        )
+        module = finder.include_module(name)
+        assert module is not None
+        assert "nt_module" in finder._bad_modules  # noqa: SLF001
+
+    def test_platform_branches_function(
+        self, tmp_package: TempPackage
+    ) -> None:
+        """The dead branches of a function do not change the function."""
+        tmp_package.create(PLATFORM_BRANCHES_FUNCTION_TEST)
+        finder = ModuleFinder(
+            ConstantsModule(),
+            path=[tmp_package.path, *sys.path],
+            strip_platform_branches=["function_module"],
+        )
+        module = finder.include_module("function_module")
+        assert module is not None
+        assert module.code is not None
+        assert "nt_module" not in finder._bad_modules  # noqa: SLF001
+        namespace: dict[str, object] = {}
+        exec(module.code, namespace)  # noqa: S102
+        assert inspect.isgenerator(namespace["generator"]())
+        with pytest.raises(UnboundLocalError):
+            namespace["local"]()
+        with pytest.raises(UnboundLocalError):
+            namespace["walrus"]()
+        assert namespace["pruned"]() == 2
+
+
+CACHED_BYTECODE_TEST = """
+cached_module.py
+    print("Hello from cx_Freeze")
+"""
+
+PLATFORM_BRANCHES_TEST = """
+platform_module.py
+    import os
+    import sys
+
+    IS_PY2 = sys.version_info[0] == 2
+
+    if IS_PY2:
+        import py2_module
+    elif sys.version_info >= (3,):
+        import py3_module
+    if os.name == "unknown":
+        import nt_module
+py2_module.py
+    print("Hello from Python 2")
+py3_module.py
+    print("Hello from Python 3")
+"""
+
+PLATFORM_BRANCHES_REBOUND_TEST = """
+rebound_class.py
+    import os
+
+    if os.name == "unknown":
+        import nt_module
+
+
+    class os:
+        name = "unknown"
+rebound_def.py
+    import os
+
+    if os.name == "unknown":
+        import nt_module
+
+
+    def os():
+        pass
+rebound_except.py
+    import os
+
+    try:
+        if os.name == "unknown":
+            import nt_module
+    except ImportError as os:
+        pass
+rebound_import.py
+    import os
+
+    if os.name == "unknown":
+        import nt_module
+    from posixpath import sep as os
+"""
+
+PLATFORM_BRANCHES_FUNCTION_TEST = """
+function_module.py
+    import sys
+
+    value = "global"
+
+
+    def generator():
+        if sys.platform == "unknown":
+            yield 1
+
+
+    def local():
+        if sys.platform == "unknown":
+            import nt_module as value
+        return value
+
+
+    def walrus():
+        result = (value := 1) if sys.platform == "unknown" else 2
+        return value, result
+
+
+    def pruned():
+        return 1 if sys.platform == "unknown" else 2
+"""
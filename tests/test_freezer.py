@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import sys
 import sysconfig
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NoReturn
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 import pytest
 
@@ -19,6 +23,7 @@ from cx_Freeze._compat import (
     IS_WINDOWS,
     PYTHON_VERSION,
 )
+from cx_Freeze._writer import ZIPFILE_INTERNALS, zstd_backend
 from cx_Freeze.exception import OptionError
 
 if TYPE_CHECKING:
@@ -88,7 +93,12 @@ def test_freezer_target_dir_locked(tmp_package: TempPackage) -> None:
         msg = f"cannot clean {path}"
         raise OSError(msg)
 
+    def t_rename(path: Path, target: str) -> NoReturn:
+        msg = f"cannot rename {path} to {target}"
+        raise OSError(msg)
+
     tmp_package.monkeypatch.setattr("shutil.rmtree", t_rmtree)
+    tmp_package.monkeypatch.setattr("pathlib.Path.rename", t_rename)
 
     tmp_package.create(SOURCE)
     target_dir = tmp_package.executable("hello").parent
@@ -516,3 +526,1150 @@ def test_freezer_excludes(tmp_package: TempPackage) -> None:
         for fn in filelist:
             print(fn)
         assert len(filelist) == 3
+
+
+SOURCE_STRIP = """
+hello.py
+    from __future__ import annotations
+
+    import sys
+
+    import module
+
+    def show(name: str) -> None:
+        \"\"\"Show the name.\"\"\"
+        print(f"Hello from {name}")
+
+    show("cx_Freeze")
+    print("hello docstring:", show.__doc__)
+    print("hello annotations:", show.__annotations__)
+    print("module docstring:", module.show.__doc__)
+    print("module annotations:", module.show.__annotations__)
+    if sys.version_info[:2] >= (3, 11):
+        positions = list(module.show.__code__.co_positions())
+        print("module columns:", positions[-1][2])
+module.py
+    from __future__ import annotations
+
+    def show(name: str) -> None:
+        \"\"\"Show the name.\"\"\"
+        print(f"Hello from {name}")
+"""
+
+
+def test_freezer_strip_bytecode(tmp_package: TempPackage) -> None:
+    """Test the freeze strip_* options."""
+    tmp_package.create(SOURCE_STRIP)
+
+    freezer = Freezer(
+        executables=["hello.py"],
+        include_msvcr=True,
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+        strip_docstrings=["*", "!__main__*"],
+        strip_annotations=["module"],
+        strip_debug_ranges=["module"],
+    )
+    freezer.freeze()
+    assert "module" in freezer.bytecode_saved
+
+    executable = tmp_package.executable("hello")
+    assert executable.is_file()
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(
+        [
+            "Hello from cx_Freeze",
+            "hello docstring: Show the name.",
+            "hello annotations: {'name': 'str', 'return': 'None'}",
+            "module docstring: None",
+            "module annotations: {}",
+        ]
+    )
+    if sys.version_info[:2] >= (3, 11):
+        result.stdout.fnmatch_lines("module columns: None")
+
+
+SOURCE_OPTIMIZE_PACKAGES = """
+hello.py
+    \"\"\"Main script.\"\"\"
+
+    import module
+
+    print("hello docstring:", __doc__)
+    print("module docstring:", module.__doc__)
+    print("module asserts:", module.check())
+module.py
+    \"\"\"Module docstring.\"\"\"
+
+    def check():
+        try:
+            assert False
+        except AssertionError:
+            return "kept"
+        return "removed"
+"""
+
+
+def test_freezer_optimize_packages(tmp_package: TempPackage) -> None:
+    """Test the freeze optimize_packages option."""
+    tmp_package.create(SOURCE_OPTIMIZE_PACKAGES)
+
+    freezer = Freezer(
+        executables=["hello.py"],
+        include_msvcr=True,
+        optimize=0,
+        optimize_packages=["module=2"],
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+    )
+    assert freezer.optimize_packages == [("module", 2)]
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    assert executable.is_file()
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(
+        [
+            "hello docstring: Main script.",
+            "module docstring: None",
+            "module asserts: removed",
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "optimize_packages", [["module=3"], ["=1"], ["module"], {"module": "x"}]
+)
+def test_freezer_optimize_packages_invalid(optimize_packages: Any) -> None:
+    """Test the freeze optimize_packages option with invalid values."""
+    with pytest.raises(OptionError, match="invalid optimize_packages value"):
+        Freezer(executables=["hello.py"], optimize_packages=optimize_packages)
+
+
+SOURCE_LAZY_IMPORTS = """
+hello.py
+    import module
+
+    print("before executing module")
+    module.show()
+module.py
+    print("executing module")
+
+    def show():
+        print("Hello from cx_Freeze")
+"""
+
+
+@pytest.mark.parametrize("lazy_imports", [["__main__*"], ["*"]])
+def test_freezer_lazy_imports(
+    tmp_package: TempPackage, lazy_imports: list[str]
+) -> None:
+    """Test the freeze lazy_imports option."""
+    tmp_package.create(SOURCE_LAZY_IMPORTS)
+
+    freezer = Freezer(
+        executables=["hello.py"],
+        include_msvcr=True,
+        lazy_imports=lazy_imports,
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    assert executable.is_file()
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(
+        [
+            "before executing module",
+            "executing module",
+            "Hello from cx_Freeze",
+        ]
+    )
+
+
+SOURCE_PACKAGE_DATA_RECORD = """
+hello.py
+    import mypkg
+
+    mypkg.show()
+site/mypkg/__init__.py
+    from pathlib import Path
+
+    def show() -> None:
+        print(Path(__file__).with_name("data.txt").read_text().strip())
+site/mypkg/data.txt
+    Hello from cx_Freeze
+site/mypkg/leftover.txt
+    not installed
+site/mypkg/tests/__init__.py
+site/mypkg/tests/data.txt
+    test data
+site/mypkg-1.0.dist-info/METADATA
+    Name: mypkg
+    Version: 1.0
+site/mypkg-1.0.dist-info/top_level.txt
+    mypkg
+site/mypkg-1.0.dist-info/RECORD
+    mypkg/__init__.py,,
+    mypkg/data.txt,,
+    mypkg/tests/__init__.py,,
+    mypkg/tests/data.txt,,
+    mypkg-1.0.dist-info/METADATA,,
+    mypkg-1.0.dist-info/top_level.txt,,
+    mypkg-1.0.dist-info/RECORD,,
+"""
+
+
+def test_freezer_package_data_from_record(tmp_package: TempPackage) -> None:
+    """Test the freeze package_data_from_record option."""
+    tmp_package.create(SOURCE_PACKAGE_DATA_RECORD)
+    site = tmp_package.path / "site"
+    tmp_package.monkeypatch.syspath_prepend(site)
+
+    freezer = Freezer(
+        executables=["hello.py"],
+        excludes=["mypkg.tests"],
+        include_msvcr=True,
+        package_data_from_record=True,
+        path=[tmp_package.path, site, *sys.path],
+        silent=True,
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    assert executable.is_file()
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines("Hello from cx_Freeze")
+
+    package_dir = executable.parent / "lib" / "mypkg"
+    assert package_dir.joinpath("data.txt").is_file()
+    assert not package_dir.joinpath("leftover.txt").exists()
+    assert not package_dir.joinpath("tests").exists()
+
+
+SOURCE_EXCLUDE_TESTS = """
+hello.py
+    import mypkg
+
+    print("Hello from cx_Freeze")
+site/mypkg/__init__.py
+site/mypkg/conftest.py
+site/mypkg/testing.py
+site/mypkg/core/__init__.py
+site/mypkg/core/tests/__init__.py
+site/mypkg/core/tests/test_core.py
+site/mypkg-1.0.dist-info/METADATA
+    Name: mypkg
+    Version: 1.0
+site/mypkg-1.0.dist-info/top_level.txt
+    mypkg
+site/mypkg-1.0.dist-info/RECORD
+    mypkg/__init__.py,,
+    mypkg/conftest.py,,
+    mypkg/testing.py,,
+    mypkg/core/__init__.py,,
+    mypkg/core/tests/__init__.py,,
+    mypkg/core/tests/test_core.py,,
+    mypkg-1.0.dist-info/METADATA,,
+    mypkg-1.0.dist-info/top_level.txt,,
+    mypkg-1.0.dist-info/RECORD,,
+"""
+
+
+@pytest.mark.parametrize(
+    ("options", "expected"),
+    [
+        ({}, set()),
+        ({"include_tests": ["mypkg.testing"]}, {"testing.pyc"}),
+        ({"exclude_tests": ["tests"]}, {"conftest.pyc", "testing.pyc"}),
+        (
+            {"include_tests": ["mypkg"]},
+            {"conftest.pyc", "testing.pyc", "core/tests"},
+        ),
+    ],
+    ids=["default", "include_module", "exclude_names", "include_package"],
+)
+def test_freezer_exclude_tests(
+    tmp_package: TempPackage, options: dict[str, list[str]], expected: set
+) -> None:
+    """Test the freeze exclude_tests and include_tests options."""
+    tmp_package.create(SOURCE_EXCLUDE_TESTS)
+    site = tmp_package.path / "site"
+    tmp_package.monkeypatch.syspath_prepend(site)
+
+    freezer = Freezer(
+        executables=["hello.py"],
+        include_msvcr=True,
+        packages=["mypkg"],
+        path=[tmp_package.path, site, *sys.path],
+        silent=True,
+        **options,
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    assert executable.is_file()
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines("Hello from cx_Freeze")
+
+    package_dir = executable.parent / "lib" / "mypkg"
+    assert package_dir.joinpath("core", "__init__.pyc").is_file()
+    tests = {"conftest.pyc", "testing.pyc", "core/tests"}
+    assert {name for name in tests if package_dir.joinpath(name).exists()} == (
+        expected
+    )
+
+
+SOURCE_IMPORTED_TESTS = """
+hello.py
+    import mypkg
+
+    mypkg.testing.show()
+site/mypkg/__init__.py
+    from mypkg import testing
+site/mypkg/testing.py
+    def show() -> None:
+        print("ok helper")
+site/mypkg/tests/__init__.py
+site/mypkg/tests/test_testing.py
+    from mypkg import testing
+site/mypkg-1.0.dist-info/METADATA
+    Name: mypkg
+    Version: 1.0
+site/mypkg-1.0.dist-info/top_level.txt
+    mypkg
+site/mypkg-1.0.dist-info/RECORD
+    mypkg/__init__.py,,
+    mypkg/testing.py,,
+    mypkg/tests/__init__.py,,
+    mypkg/tests/test_testing.py,,
+    mypkg-1.0.dist-info/METADATA,,
+    mypkg-1.0.dist-info/top_level.txt,,
+    mypkg-1.0.dist-info/RECORD,,
+"""
+
+
+def test_freezer_exclude_tests_imported(tmp_package: TempPackage) -> None:
+    """Test that a test package imported by the package is included."""
+    tmp_package.create(SOURCE_IMPORTED_TESTS)
+    site = tmp_package.path / "site"
+    tmp_package.monkeypatch.syspath_prepend(site)
+
+    freezer = Freezer(
+        executables=["hello.py"],
+        include_msvcr=True,
+        packages=["mypkg"],
+        path=[tmp_package.path, site, *sys.path],
+        silent=True,
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines("ok helper")
+    package_dir = executable.parent / "lib" / "mypkg"
+    assert package_dir.joinpath("testing.pyc").is_file()
+    assert not package_dir.joinpath("tests").exists()
+
+
+SOURCE_NEEDED_LIBS = """
+hello.py
+    import mypkg
+
+    print("Hello from cx_Freeze")
+site/mypkg/__init__.py
+site/mypkg/libs/{lib}
+    not a library needed by the extensions
+site/mypkg-1.0.dist-info/METADATA
+    Name: mypkg
+    Version: 1.0
+site/mypkg-1.0.dist-info/top_level.txt
+    mypkg
+site/mypkg-1.0.dist-info/RECORD
+    mypkg/__init__.py,,
+    mypkg/libs/{lib},,
+    mypkg-1.0.dist-info/METADATA,,
+    mypkg-1.0.dist-info/top_level.txt,,
+    mypkg-1.0.dist-info/RECORD,,
+"""
+
+
+@pytest.mark.parametrize("needed_libs_only", [False, True])
+@pytest.mark.parametrize("package_data_from_record", [False, True])
+def test_freezer_needed_libs_only(
+    tmp_package: TempPackage,
+    capsys: pytest.CaptureFixture[str],
+    needed_libs_only: bool,
+    package_data_from_record: bool,
+) -> None:
+    """Test the freeze needed_libs_only option."""
+    lib = "libfoo.dll" if IS_WINDOWS or IS_MINGW else "libfoo.so"
+    tmp_package.create(SOURCE_NEEDED_LIBS.format(lib=lib))
+    site = tmp_package.path / "site"
+    tmp_package.monkeypatch.syspath_prepend(site)
+
+    freezer = Freezer(
+        executables=["hello.py"],
+        include_msvcr=True,
+        needed_libs_only=needed_libs_only,
+        package_data_from_record=package_data_from_record,
+        path=[tmp_package.path, site, *sys.path],
+    )
+    freezer.freeze()
+    freezer.print_report()
+
+    executable = tmp_package.executable("hello")
+    assert executable.is_file()
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines("Hello from cx_Freeze")
+
+    target = executable.parent / "lib" / "mypkg" / "libs" / lib
+    assert target.exists() is not needed_libs_only
+    output = capsys.readouterr().out
+    assert ("skipped libraries" in output) is needed_libs_only
+
+
+def test_freezer_needed_libs_only_report(
+    tmp_package: TempPackage, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that a library copied to another target is not reported."""
+    lib = "libfoo.dll" if IS_WINDOWS or IS_MINGW else "libfoo.so"
+    tmp_package.create(SOURCE_NEEDED_LIBS.format(lib=lib))
+    site = tmp_package.path / "site"
+    tmp_package.monkeypatch.syspath_prepend(site)
+    freezer = Freezer(
+        executables=["hello.py"],
+        include_msvcr=True,
+        needed_libs_only=True,
+        path=[tmp_package.path, site, *sys.path],
+    )
+    freezer.freeze()
+    capsys.readouterr()
+    # the library copied next to an extension module that needs it
+    source = next(iter(freezer.finder.package_lib_files))
+    target = freezer.target_dir / "lib" / "mypkg" / lib
+    freezer._copy_file(source, target, copy_dependent_files=False)  # noqa: SLF001
+    freezer.print_report()
+    assert "skipped libraries" not in capsys.readouterr().out
+
+
+SOURCE_INCREMENTAL = """
+hello.py
+    import mypkg
+
+    print("Hello from cx_Freeze")
+    mypkg.show()
+data.txt
+    data
+mypkg/__init__.py
+    def show() -> None:
+        print("Hello from mypkg")
+"""
+
+
+def test_freezer_incremental(tmp_package: TempPackage) -> None:
+    """Test the freeze incremental option."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    options = {
+        "executables": ["hello.py"],
+        "include_msvcr": True,
+        "incremental": True,
+        "packages": ["mypkg"],
+        "path": [tmp_package.path, *sys.path],
+        "silent": True,
+        "zip_exclude_packages": ["mypkg"],
+    }
+    freezer = Freezer(include_files=["data.txt"], **options)
+    freezer.freeze()
+    executable = tmp_package.executable("hello")
+    target_dir = executable.parent
+    assert target_dir.joinpath("data.txt").is_file()
+    module_file = target_dir / "lib/mypkg/__init__.pyc"
+    module_mtime = module_file.stat().st_mtime_ns
+    leftover = target_dir / "leftover.txt"
+    leftover.write_text("not built")
+
+    # rebuild with a changed script, without the included file
+    tmp_package.path.joinpath("hello.py").write_text(
+        "import mypkg\nprint('Hello again')\nmypkg.show()\n"
+    )
+    freezer = Freezer(**options)
+    freezer.freeze()
+    assert module_file.stat().st_mtime_ns == module_mtime
+    assert not target_dir.joinpath("data.txt").exists()
+    assert leftover.exists()  # not written by a build
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(["Hello again", "Hello from mypkg"])
+
+    # a full build cleans the build directory
+    freezer = Freezer(**{**options, "incremental": False})
+    freezer.freeze()
+    assert not leftover.exists()
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(["Hello again", "Hello from mypkg"])
+
+
+def test_freezer_incremental_clean(tmp_package: TempPackage) -> None:
+    """Test that the build directories removed are not left in the trash."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    target_dir = tmp_package.executable("hello").parent
+    target_dir.mkdir(parents=True)
+    stale = target_dir.with_name(f".{target_dir.name}-stale.trash")
+    stale.joinpath(target_dir.name).mkdir(parents=True)
+    for incremental in (False, True):
+        target_dir.joinpath("leftover.txt").write_text("not built")
+        freezer = Freezer(
+            executables=["hello.py"],
+            include_msvcr=True,
+            incremental=incremental,
+            path=[tmp_package.path, *sys.path],
+            silent=True,
+        )
+        freezer.freeze()
+        assert not target_dir.joinpath("leftover.txt").exists()
+    # the trash directories are removed in background
+    for _ in range(100):
+        if not list(target_dir.parent.glob("*.trash")):
+            break
+        time.sleep(0.1)
+    assert not list(target_dir.parent.glob("*.trash"))
+
+
+def test_freezer_copy_error(tmp_package: TempPackage) -> None:
+    """Test that an error copying a file in the pool of threads is raised."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    copyfile = shutil.copyfile
+
+    def t_copyfile(source: Path, target: Path) -> Path:
+        if Path(source).name == "data.txt":
+            msg = f"cannot copy {source}"
+            raise OSError(msg)
+        return copyfile(source, target)
+
+    tmp_package.monkeypatch.setattr("shutil.copyfile", t_copyfile)
+    freezer = Freezer(
+        executables=["hello.py"],
+        include_files=["data.txt"],
+        include_msvcr=True,
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+    )
+    with pytest.raises(OSError, match="cannot copy"):
+        freezer.freeze()
+
+
+@pytest.mark.parametrize("copy_mode", ["copy", "reflink", "hardlink", "auto"])
+def test_freezer_copy_mode(tmp_package: TempPackage, copy_mode: str) -> None:
+    """Test the freeze copy_mode option."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    freezer = Freezer(
+        executables=["hello.py"],
+        copy_mode=copy_mode,
+        include_files=["data.txt"],
+        include_msvcr=True,
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    assert executable.is_file()
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(["Hello from cx_Freeze", "Hello from mypkg"])
+    # the executable is patched, so it is never linked
+    assert executable.stat().st_nlink == 1
+
+    source = tmp_package.path / "data.txt"
+    target = executable.parent / "data.txt"
+    assert target.read_text(encoding="utf_8").strip() == "data"
+    linked = source.stat().st_ino == target.stat().st_ino
+    assert linked is (copy_mode == "hardlink")
+
+
+def test_freezer_dedup_files(
+    tmp_package: TempPackage, capsys: pytest.CaptureFixture
+) -> None:
+    """Test the freeze dedup_files option."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    options = {
+        "executables": ["hello.py"],
+        "dedup_files": True,
+        "include_files": [("data.txt", "data.txt"), ("data.txt", "copy.txt")],
+        "include_msvcr": True,
+        "incremental": True,
+        "path": [tmp_package.path, *sys.path],
+    }
+    freezer = Freezer(**options)
+    freezer.freeze()
+    output = capsys.readouterr().out
+    assert "dedup files: " in output
+
+    executable = tmp_package.executable("hello")
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(["Hello from cx_Freeze", "Hello from mypkg"])
+    data = executable.parent / "data.txt"
+    copy = executable.parent / "copy.txt"
+    assert data.stat().st_ino == copy.stat().st_ino
+    source = tmp_package.path / "data.txt"
+    assert source.stat().st_nlink == 1  # the sources are never linked
+
+    # an incremental build does not write into the linked files
+    source.write_text("new data")
+    freezer = Freezer(**options)
+    freezer.freeze()
+    assert data.read_text(encoding="utf_8") == "new data"
+    assert copy.read_text(encoding="utf_8") == "new data"
+
+
+SOURCE_MULTICALL = f"""{SOURCE_INCREMENTAL}
+bye.py
+    import sys
+
+    print("Bye", sys.argv[1:])
+"""
+
+
+@pytest.mark.skipif(IS_WINDOWS or IS_MINGW, reason="Unix tests")
+@pytest.mark.parametrize("compress", [True, "zstd"], ids=["zip", "zstd"])
+def test_freezer_multicall(
+    tmp_package: TempPackage, compress: bool | str
+) -> None:
+    """Test the freeze multicall option."""
+    if compress == "zstd" and zstd_backend() is None:
+        pytest.skip("Zstandard compression is not available")
+    tmp_package.create(SOURCE_MULTICALL)
+    freezer = Freezer(
+        executables=["hello.py", "bye.py"],
+        compress=compress,
+        include_msvcr=True,
+        multicall=True,
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+    )
+    freezer.freeze()
+
+    hello = tmp_package.executable("hello")
+    bye = tmp_package.executable("bye")
+    shared = hello.with_name("multicall")
+    assert shared.is_file()
+    assert hello.is_symlink()
+    assert bye.is_symlink()
+    result = tmp_package.run(hello)
+    result.stdout.fnmatch_lines(["Hello from cx_Freeze", "Hello from mypkg"])
+    result = tmp_package.run([bye, "a1"])
+    result.stdout.fnmatch_lines(["Bye ['a1']"])
+    # called by a link made by the user, to a link to the shared executable
+    alias = tmp_package.path / "alias"
+    alias.symlink_to(bye)
+    result = tmp_package.run([alias, "a3"])
+    result.stdout.fnmatch_lines(["Bye ['a3']"])
+    # called by its own name, like busybox
+    result = tmp_package.run([shared, "bye", "a2"])
+    result.stdout.fnmatch_lines(["Bye ['a2']"])
+
+
+def test_freezer_multicall_invalid() -> None:
+    """Test the freeze multicall option with an invalid value."""
+    with pytest.raises(OptionError, match="reserves the executable name"):
+        Freezer(executables=["hello.py", "multicall.py"], multicall=True)
+
+
+def test_freezer_copy_mode_invalid() -> None:
+    """Test the freeze copy_mode option with an invalid value."""
+    with pytest.raises(OptionError, match="invalid copy_mode value"):
+        Freezer(executables=["hello.py"], copy_mode="symlink")
+
+
+def test_freezer_no_zip_file(tmp_package: TempPackage) -> None:
+    """Test that the modules are written directly, without a zip file."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+
+    def t_zip_writer(*args: object) -> None:
+        msg = f"a zip file should not be written: {args}"
+        raise AssertionError(msg)
+
+    tmp_package.monkeypatch.setattr(
+        "cx_Freeze.freezer.ZipWriter", t_zip_writer
+    )
+    freezer = Freezer(
+        executables=["hello.py"],
+        compress=False,
+        include_msvcr=True,
+        packages=["mypkg"],
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+        zip_filename=None,
+        zip_includes=[("data.txt", "mypkg/data.txt")],
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    assert executable.is_file()
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(["Hello from cx_Freeze", "Hello from mypkg"])
+
+    target_lib_dir = executable.parent / "lib"
+    assert not target_lib_dir.joinpath("library.zip").exists()
+    assert not target_lib_dir.joinpath("library.dat").exists()
+    assert target_lib_dir.joinpath("mypkg", "__init__.pyc").is_file()
+    assert target_lib_dir.joinpath("mypkg", "data.txt").is_file()
+    assert target_lib_dir.joinpath("BUILD_CONSTANTS.pyc").is_file()
+
+
+def test_freezer_compress_parallel(tmp_package: TempPackage) -> None:
+    """Test that the zip file compressed in parallel is the same."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    options = {
+        "executables": ["hello.py"],
+        "include_msvcr": True,
+        "packages": ["mypkg"],
+        "path": [tmp_package.path, *sys.path],
+        "silent": True,
+    }
+    entries = {}
+    # without the internals of ZipFile, the entries are written by writestr
+    for workers, internals in ((1, ()), (4, ()), (4, ("_missing",))):
+        tmp_package.monkeypatch.setattr(
+            "cx_Freeze._writer.COMPRESS_WORKERS", workers
+        )
+        tmp_package.monkeypatch.setattr(
+            "cx_Freeze._writer.COMPRESS_MIN_SIZE", 0
+        )
+        tmp_package.monkeypatch.setattr(
+            "cx_Freeze._writer.ZIPFILE_INTERNALS",
+            (*ZIPFILE_INTERNALS, *internals),
+        )
+        freezer = Freezer(**options)
+        freezer.freeze()
+
+        executable = tmp_package.executable("hello")
+        result = tmp_package.run(executable)
+        result.stdout.fnmatch_lines(
+            ["Hello from cx_Freeze", "Hello from mypkg"]
+        )
+        with ZipFile(executable.parent / "lib" / "library.zip") as zip_file:
+            assert zip_file.testzip() is None
+            entries[workers, internals] = [
+                (info.filename, info.CRC, info.compress_size)
+                for info in zip_file.infolist()
+                if info.filename != "BUILD_CONSTANTS.pyc"
+            ]
+    assert entries[1, ()] == entries[4, ()] == entries[4, ("_missing",)]
+
+
+SOURCE_ZSTD = """
+hello.py
+    import sys
+
+    import mypkg
+
+    print("Hello from cx_Freeze")
+    mypkg.show()
+    print(type(sys.modules["mypkg"].__loader__).__name__)
+mypkg/__init__.py
+    def show() -> None:
+        print("Hello from mypkg")
+"""
+
+
+@pytest.mark.skipif(
+    zstd_backend() is None, reason="requires Python 3.14 or zstandard"
+)
+def test_freezer_compress_zstd(tmp_package: TempPackage) -> None:
+    """Test the freeze compress='zstd' option."""
+    tmp_package.create(SOURCE_ZSTD)
+    freezer = Freezer(
+        executables=["hello.py"],
+        compress="zstd",
+        include_msvcr=True,
+        packages=["mypkg"],
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+        zip_include_packages=["mypkg"],
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    assert executable.is_file()
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(
+        ["Hello from cx_Freeze", "Hello from mypkg", "ZstdArchiveFinder"]
+    )
+
+    target_lib_dir = executable.parent / "lib"
+    assert target_lib_dir.joinpath("library.zst").is_file()
+    with ZipFile(target_lib_dir / "library.zip") as zip_file:
+        names = zip_file.namelist()
+    assert "_cx_freeze_zstd.pyc" in names
+    assert "__init__hello.pyc" in names  # the stub
+    assert "mypkg/__init__.pyc" not in names
+
+
+SOURCE_ZSTD_DATA = """\
+hello.py
+    import pkgutil
+    from importlib.resources import files
+
+    print(files("mypkg").joinpath("data.txt").read_text().strip())
+    print(pkgutil.get_data("mypkg", "data.txt").decode().strip())
+mypkg/__init__.py
+data.txt
+    Hello from mypkg data
+"""
+
+
+@pytest.mark.skipif(
+    zstd_backend() is None, reason="requires Python 3.14 or zstandard"
+)
+@pytest.mark.parametrize("compress", [True, "zstd"], ids=["zip", "zstd"])
+def test_freezer_compress_zstd_data(
+    tmp_package: TempPackage, compress: bool | str
+) -> None:
+    """Test the resources of a package, with the freeze compress option."""
+    tmp_package.create(SOURCE_ZSTD_DATA)
+    freezer = Freezer(
+        executables=["hello.py"],
+        compress=compress,
+        include_msvcr=True,
+        packages=["mypkg"],
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+        zip_include_packages=["mypkg"],
+        zip_includes=[("data.txt", "mypkg/data.txt")],
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(
+        ["Hello from mypkg data", "Hello from mypkg data"]
+    )
+    with ZipFile(executable.parent / "lib" / "library.zip") as zip_file:
+        assert "mypkg/data.txt" in zip_file.namelist()
+
+
+def test_freezer_compress_invalid() -> None:
+    """Test the freeze compress option with an invalid value."""
+    with pytest.raises(OptionError, match="invalid compress value"):
+        Freezer(executables=["hello.py"], compress="lzma")
+
+
+def test_freezer_compression_policy(tmp_package: TempPackage) -> None:
+    """Test the zip_stored_packages and import_trace options."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    trace = tmp_package.path / "trace.txt"
+    trace.write_text(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        340 | shlex\n",
+        encoding="utf_8",
+    )
+    freezer = Freezer(
+        executables=["hello.py"],
+        import_trace=trace,
+        include_msvcr=True,
+        includes=["shlex"],
+        packages=["mypkg"],
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+        zip_include_packages=["mypkg"],
+        zip_stored_packages=["mypkg"],
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(["Hello from cx_Freeze", "Hello from mypkg"])
+    with ZipFile(executable.parent / "lib" / "library.zip") as zip_file:
+        assert zip_file.testzip() is None
+        compress_types = {
+            info.filename: info.compress_type for info in zip_file.infolist()
+        }
+    assert compress_types["mypkg/__init__.pyc"] == ZIP_STORED
+    assert compress_types["shlex.pyc"] == ZIP_STORED
+    assert compress_types["__main__hello.pyc"] == ZIP_DEFLATED
+
+
+def test_freezer_compression_policy_stored(tmp_package: TempPackage) -> None:
+    """Test the zip_stored_packages option, with a zip file not compressed."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    freezer = Freezer(
+        executables=["hello.py"],
+        compress=False,
+        include_msvcr=True,
+        packages=["mypkg"],
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+        zip_filename="library",
+        zip_include_packages=["mypkg"],
+        zip_stored_packages=["mypkg"],
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(["Hello from cx_Freeze", "Hello from mypkg"])
+    with ZipFile(executable.parent / "lib" / "library.zip") as zip_file:
+        assert zip_file.testzip() is None
+        compress_types = {info.compress_type for info in zip_file.infolist()}
+    assert compress_types == {ZIP_STORED}
+
+
+def test_freezer_import_order(tmp_package: TempPackage) -> None:
+    """Test the import_order option, with an import trace."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    trace = tmp_package.path / "trace.txt"
+    trace.write_text(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:        80 |         80 |   mypkg\n"
+        "import time:       120 |        200 | shlex\n",
+        encoding="utf_8",
+    )
+    freezer = Freezer(
+        executables=["hello.py"],
+        import_order=True,
+        import_trace=trace,
+        include_msvcr=True,
+        includes=["shlex"],
+        packages=["mypkg"],
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+        zip_include_packages=["mypkg"],
+    )
+    assert list(freezer.import_trace) == ["shlex", "mypkg"]
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(["Hello from cx_Freeze", "Hello from mypkg"])
+    with ZipFile(executable.parent / "lib" / "library.zip") as zip_file:
+        infolist = zip_file.infolist()
+    names = [info.filename for info in infolist]
+    assert names[:2] == ["shlex.pyc", "mypkg/__init__.pyc"]
+    assert names.index("__main__hello.pyc") > 1
+    # the compression is not changed without zip_stored_packages
+    assert {info.compress_type for info in infolist} == {ZIP_DEFLATED}
+
+
+def test_freezer_split_archive(tmp_package: TempPackage) -> None:
+    """Test the split_archive option, with an import trace."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    trace = tmp_package.path / "trace.txt"
+    trace.write_text("shlex\n", encoding="utf_8")
+    freezer = Freezer(
+        executables=["hello.py"],
+        import_trace=trace,
+        include_msvcr=True,
+        includes=["shlex"],
+        packages=["mypkg"],
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+        split_archive=True,
+        zip_include_packages=["mypkg"],
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(["Hello from cx_Freeze", "Hello from mypkg"])
+    lib_dir = executable.parent / "lib"
+    with ZipFile(lib_dir / "library.zip") as zip_file:
+        hot_names = set(zip_file.namelist())
+    with ZipFile(lib_dir / "library_cold.zip") as zip_file:
+        cold_names = set(zip_file.namelist())
+    assert {"shlex.pyc", "__init__hello.pyc", "__main__hello.pyc"} <= hot_names
+    assert "mypkg/__init__.pyc" in cold_names
+    assert not hot_names & cold_names
+
+
+SOURCE_SPLIT_ARCHIVE = """
+hello.py
+    import mypkg
+
+    print("Hello from cx_Freeze")
+    mypkg.show()
+mypkg/__init__.py
+    def show() -> None:
+        from mypkg import sub
+
+        sub.show()
+mypkg/sub.py
+    def show() -> None:
+        print("Hello from mypkg.sub")
+"""
+
+
+def test_freezer_split_archive_cold_submodule(
+    tmp_package: TempPackage,
+) -> None:
+    """Test the split_archive option, with a hot package and cold module."""
+    tmp_package.create(SOURCE_SPLIT_ARCHIVE)
+    trace = tmp_package.path / "trace.txt"
+    trace.write_text("mypkg\n", encoding="utf_8")
+    freezer = Freezer(
+        executables=["hello.py"],
+        import_trace=trace,
+        include_msvcr=True,
+        packages=["mypkg"],
+        path=[tmp_package.path, *sys.path],
+        silent=True,
+        split_archive=True,
+        zip_include_packages=["mypkg"],
+    )
+    freezer.freeze()
+
+    executable = tmp_package.executable("hello")
+    result = tmp_package.run(executable)
+    result.stdout.fnmatch_lines(
+        ["Hello from cx_Freeze", "Hello from mypkg.sub"]
+    )
+    lib_dir = executable.parent / "lib"
+    with ZipFile(lib_dir / "library.zip") as zip_file:
+        assert "mypkg/__init__.pyc" in zip_file.namelist()
+    with ZipFile(lib_dir / "library_cold.zip") as zip_file:
+        assert "mypkg/sub.pyc" in zip_file.namelist()
+
+
+def test_freezer_split_archive_invalid(tmp_package: TempPackage) -> None:
+    """Test the split_archive option without a zip file."""
+    with pytest.raises(OptionError, match="split_archive requires a zip file"):
+        Freezer(
+            executables=["hello.py"],
+            compress=False,
+            path=[tmp_package.path, *sys.path],
+            split_archive=True,
+        )
+
+
+def test_freezer_layered_archive(tmp_package: TempPackage) -> None:
+    """Test the layered_archive option, with a clean and incremental builds."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    deps_data = []
+    for build in range(3):
+        freezer = Freezer(
+            executables=["hello.py"],
+            include_msvcr=True,
+            includes=["shlex"],
+            incremental=build > 0,
+            layered_archive=True,
+            packages=["mypkg"],
+            path=[tmp_package.path, *sys.path],
+            silent=True,
+            zip_include_packages=["mypkg", "shlex"],
+        )
+        freezer.freeze()
+        executable = tmp_package.executable("hello")
+        result = tmp_package.run(executable)
+        result.stdout.fnmatch_lines(
+            ["Hello from cx_Freeze", "Hello from mypkg"]
+        )
+        lib_dir = executable.parent / "lib"
+        deps_archives = list(lib_dir.glob("library-deps-*.zip"))
+        assert len(deps_archives) == 1
+        deps_stat = deps_archives[0].stat()
+        deps_data.append((deps_archives[0].read_bytes(), deps_stat))
+    # the zip file of the dependencies is reproducible, and it is reused by
+    # an incremental build
+    assert deps_data[0][0] == deps_data[1][0]
+    assert deps_data[1][1].st_mtime_ns == deps_data[2][1].st_mtime_ns
+    with ZipFile(lib_dir / "library.zip") as zip_file:
+        app_names = set(zip_file.namelist())
+    with ZipFile(deps_archives[0]) as zip_file:
+        deps_names = set(zip_file.namelist())
+    assert "mypkg/__init__.pyc" in app_names
+    assert "shlex.pyc" in deps_names
+    assert not app_names & deps_names
+
+
+def test_freezer_layered_archive_mtime(tmp_package: TempPackage) -> None:
+    """Test that the times of the dependencies are not in their zip file."""
+    tmp_package.create(SOURCE_INCREMENTAL)
+    tmp_package.monkeypatch.setattr(
+        "cx_Freeze.freezer._is_dependency",
+        lambda module: module.root.name == "mypkg",
+    )
+    source = tmp_package.path / "mypkg/__init__.py"
+    deps_data = []
+    for mtime in (1_000_000_000, 1_500_000_000):
+        os.utime(source, (mtime, mtime))
+        freezer = Freezer(
+            executables=["hello.py"],
+            include_msvcr=True,
+            layered_archive=True,
+            packages=["mypkg"],
+            path=[tmp_package.path, *sys.path],
+            silent=True,
+            zip_include_packages=["mypkg"],
+        )
+        freezer.freeze()
+        lib_dir = tmp_package.executable("hello").parent / "lib"
+        deps_archive = next(lib_dir.glob("library-deps-*.zip"))
+        deps_data.append(deps_archive.read_bytes())
+        with ZipFile(deps_archive) as zip_file:
+            assert "mypkg/__init__.pyc" in zip_file.namelist()
+    assert deps_data[0] == deps_data[1]
+
+
+SOURCE_LAYERED_DIST = """\
+hello.py
+    import mypkg
+
+    mypkg.show()
+mypkg/__init__.py
+    def show() -> None:
+        print("Hello one")
+mypkg-1.0.dist-info/METADATA
+    Name: mypkg
+    Version: 1.0
+mypkg-1.0.dist-info/RECORD
+    mypkg/__init__.py,,
+    mypkg-1.0.dist-info/METADATA,,
+    mypkg-1.0.dist-info/RECORD,,
+"""
+
+
+@pytest.mark.parametrize("local", [False, True], ids=["index", "editable"])
+def test_freezer_layered_archive_changed(
+    tmp_package: TempPackage, local: bool
+) -> None:
+    """Test the layered_archive option, with a distribution changed."""
+    tmp_package.create(SOURCE_LAYERED_DIST)
+    if local:
+        tmp_package.path.joinpath(
+            "mypkg-1.0.dist-info", "direct_url.json"
+        ).write_text(
+            '{"url": "file:///src/mypkg", "dir_info": {"editable": true}}',
+            encoding="utf_8",
+        )
+    source = tmp_package.path / "mypkg/__init__.py"
+    for build, word in enumerate(("one", "three", "eleven")):
+        source.write_text(
+            f'def show() -> None:\n    print("Hello {word}")\n',
+            encoding="utf_8",
+        )
+        freezer = Freezer(
+            executables=["hello.py"],
+            include_msvcr=True,
+            incremental=build > 0,
+            layered_archive=True,
+            path=[tmp_package.path, *sys.path],
+            silent=True,
+            zip_include_packages=["*"],
+        )
+        freezer.freeze()
+        executable = tmp_package.executable("hello")
+        result = tmp_package.run(executable)
+        result.stdout.fnmatch_lines([f"Hello {word}"])
+    # the application installed from its sources is not a dependency
+    with ZipFile(executable.parent / "lib" / "library.zip") as zip_file:
+        app_names = zip_file.namelist()
+    assert ("mypkg/__init__.pyc" in app_names) is local
+
+
+def test_freezer_import_trace_missing(tmp_package: TempPackage) -> None:
+    """Test the import_trace option with a missing file."""
+    with pytest.raises(OptionError, match="cannot read the import trace"):
+        Freezer(
+            executables=["hello.py"],
+            import_trace=tmp_package.path / "missing.txt",
+        )
@@ -5,18 +5,24 @@ from __future__ import annotations
 import os
 import shutil
 from importlib.machinery import EXTENSION_SUFFIXES
+from importlib.metadata import PathDistribution
 from types import CodeType
 from typing import TYPE_CHECKING, Any
+from zipfile import ZipFile
 
 import pytest
 
 from cx_Freeze import ConstantsModule, Module
-from cx_Freeze._compat import IS_CONDA, IS_MINGW
+from cx_Freeze._cache import StubCache
+from cx_Freeze._compat import IS_CONDA, IS_MINGW, IS_WINDOWS
+from cx_Freeze._metadata import DistributionFiles
 from cx_Freeze.exception import OptionError
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from pytest_mock import MockerFixture
+
     from .conftest import TempPackage
 
 SOURCE = """
@@ -119,9 +125,14 @@ def test_invalid(
 
 SOURCE_TEST_EGG_INFO = """
 test_egg_info.py
+    from importlib.metadata import entry_points, version
+
     print("Hello from cx_Freeze")
     import module1
     import module2
+    print("module1", version("module1"))
+    print("module2", version("module2"))
+    print(entry_points(group="distutils.setup_keywords")["entry_points"])
 pyproject.toml
     [project]
     name = "test_egg_info"
@@ -169,5 +180,102 @@ def test_egg_info(tmp_package: TempPackage) -> None:
     assert executable.is_file()
     result = tmp_package.run(executable)
     result.stdout.fnmatch_lines(
-        ["Hello from cx_Freeze", "Hello module1", "Hello module2"]
+        [
+            "Hello from cx_Freeze",
+            "Hello module1",
+            "Hello module2",
+            "module1 1.0",
+            "module2 1.0",
+            "EntryPoint(name='entry_points'*",
+        ]
+    )
+    # only the metadata files needed at runtime are included
+    with ZipFile(executable.parent / "lib" / "library.zip") as zip_file:
+        names = zip_file.namelist()
+    assert "module2-1.0.dist-info/entry_points.txt" in names
+    assert "module2-1.0.dist-info/RECORD" in names
+    assert "module2-1.0.dist-info/WHEEL" not in names
+
+
+SOURCE_STUBS = """
+stubs/first.pyi
+    from typing import Any
+    import os.path
+    from .second import VALUE
+stubs/second.pyi
+    VALUE: int
+"""
+
+
+def test_stub_cache(tmp_package: TempPackage, mocker: MockerFixture) -> None:
+    """Test the persistent cache of the parsed stubs."""
+    tmp_package.create(SOURCE_STUBS)
+    cache_path = tmp_package.path / "cache"
+    files = sorted(tmp_package.path.joinpath("stubs").glob("*.pyi"))
+
+    parse = mocker.Mock(side_effect=Module.get_imports_from_source)
+    cache = StubCache(parse, cache_path)
+    assert cache.get(files[0]) == "import os.path\nfrom .second import VALUE\n"
+    assert cache.get(files[1]) is None
+    assert cache.get(files[0]) == "import os.path\nfrom .second import VALUE\n"
+    assert parse.call_count == 2  # each stub is parsed once
+    assert len(list(cache_path.rglob("*.py"))) == 2
+
+    # a new build uses the parsed stubs stored in the cache
+    parse.reset_mock()
+    cache = StubCache(parse, cache_path)
+    assert cache.get(files[0]) == "import os.path\nfrom .second import VALUE\n"
+    assert cache.get(files[1]) is None
+    parse.assert_not_called()
+
+
+SOURCE_DIST_FILES = """
+site/mypkg/__init__.py
+site/mypkg/core{extension}
+site/mypkg/core.pyi
+site/mypkg/data.json
+site/mypkg/tests/test_core.py
+site/mypkg/docs/index.rst
+site/mypkg.libs/libfoo{library}
+site/mypkg-1.0.dist-info/METADATA
+    Name: mypkg
+    Version: 1.0
+site/mypkg-1.0.dist-info/RECORD
+    mypkg/__init__.py,,
+    mypkg/__pycache__/__init__.cpython-311.pyc,,
+    mypkg/core{extension},,
+    mypkg/core.pyi,,
+    mypkg/data.json,,
+    mypkg/tests/test_core.py,,
+    mypkg/docs/index.rst,,
+    mypkg.libs/libfoo{library},,
+    mypkg-1.0.dist-info/METADATA,,
+    mypkg-1.0.dist-info/RECORD,,
+"""
+
+
+def test_distribution_files(tmp_package: TempPackage) -> None:
+    """Test the classification of the files of a distribution package."""
+    extension = EXTENSION_SUFFIXES[0]
+    library = ".dll" if IS_MINGW or IS_WINDOWS else ".so.1"
+    tmp_package.create(
+        SOURCE_DIST_FILES.format(extension=extension, library=library)
     )
+    site = tmp_package.path / "site"
+    distribution = PathDistribution(site / "mypkg-1.0.dist-info")
+
+    index = DistributionFiles(distribution)
+    assert list(index.source) == ["mypkg/__init__.py"]
+    assert list(index.bytecode) == [
+        "mypkg/__pycache__/__init__.cpython-311.pyc"
+    ]
+    assert list(index.extension) == [f"mypkg/core{extension}"]
+    assert list(index.shared_library) == [f"mypkg.libs/libfoo{library}"]
+    assert list(index.stub) == ["mypkg/core.pyi"]
+    assert list(index.tests) == ["mypkg/tests/test_core.py"]
+    assert list(index.docs) == ["mypkg/docs/index.rst"]
+    assert list(index.data) == ["mypkg/data.json"]
+    assert len(index.metadata) == 2
+    path = index.stub["mypkg/core.pyi"]
+    assert path.is_absolute()
+    assert path.samefile(site / "mypkg/core.pyi")